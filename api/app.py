@@ -6,54 +6,227 @@ cryptocurrency market analysis system.
 """
 
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing_extensions import Annotated
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+import atexit
 import logging
+import queue
 import sys
+import threading
 import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (once, even under --reload)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
-from core.analyzer import MacroChainAnalyzer
-from services.research_formatter import ResearchFormatter
-from config.settings import get_api_config
+from config.settings import get_api_config, get_analysis_config, get_logging_config
+from core.clock import utc_timestamp
+
+
+def _configure_logging() -> None:
+    """
+    Route log records through a queue to a background writer thread.
+    
+    Request handlers only enqueue records; the QueueListener thread does
+    the formatting and the blocking stderr writes. Like basicConfig, this
+    does nothing if the root logger already has handlers.
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    logging_config = get_logging_config()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging_config["format"]))
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root_logger.setLevel(logging_config["level"])
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
 
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from core.analyzer import MacroChainAnalyzer
+    from services.research_formatter import ResearchFormatter
+
 # Initialize FastAPI app
 api_config = get_api_config()
 app = FastAPI(
     title=api_config["title"],
     description=api_config["description"],
-    version=api_config["version"]
+    version=api_config["version"],
+    default_response_class=ORJSONResponse
 )
 
-# Initialize components
-analyzer = MacroChainAnalyzer()
-research_formatter = ResearchFormatter()
+# Components are created on first use so that startup and lightweight
+# endpoints such as /health do not import the analysis stack.
+_analyzer: Optional["MacroChainAnalyzer"] = None
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer() -> "MacroChainAnalyzer":
+    """
+    Get the shared market analyzer, creating it on first use.
+    
+    The startup prewarm thread and the first requests can get here at the
+    same time; the lock makes sure they all end up with one analyzer, and
+    so one result cache and one set of in-flight analyses.
+    """
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                from core.analyzer import MacroChainAnalyzer
+                _analyzer = MacroChainAnalyzer(cache_size=get_analysis_config()["cache_size"])
+    return _analyzer
+
+
+@lru_cache(maxsize=None)
+def get_research_formatter() -> "ResearchFormatter":
+    """Get the shared research formatter, creating it on first use."""
+    from services.research_formatter import ResearchFormatter
+    return ResearchFormatter()
+
+
+# Static endpoint payloads, built once at import
+ROOT_RESPONSE: Dict[str, str] = {
+    "message": "MacroChain AI - Cryptocurrency Market Analysis API",
+    "description": "Educational crypto market analysis without financial advice",
+    "version": api_config["version"],
+    "docs": "/docs",
+    "health": "/health"
+}
+
+INFO_RESPONSE: Dict[str, Any] = {
+    "name": "MacroChain AI",
+    "description": "AI-powered cryptocurrency market analysis agent",
+    "purpose": "Educational market analysis without financial advice",
+    "capabilities": [
+        "Deep research pipeline with deterministic methodology",
+        "Macroeconomic analysis with liquidity and policy context",
+        "Market sentiment assessment with volatility and momentum",
+        "On-chain dynamics analysis with network fundamentals",
+        "Market structure analysis with trading context",
+        "Cross-phase correlation and synthesis",
+        "Professional research report generation",
+        "Risk assessment and uncertainty quantification"
+    ],
+    "supported_assets": [
+        "bitcoin",
+        "ethereum", 
+        "major cryptocurrencies"
+    ],
+    "analysis_types": [
+        "macroeconomic",
+        "sentiment",
+        "onchain",
+        "combined"
+    ],
+    "limitations": [
+        "Educational purposes only - no financial advice",
+        "No price predictions or trading signals",
+        "Conceptual analysis framework, not real-time data",
+        "Research-grade methodology with documented limitations",
+        "Market complexity exceeds analytical frameworks",
+        "Unforeseen events can invalidate current analysis"
+    ],
+    "disclaimer": (
+        "MacroChain AI provides research-grade cryptocurrency market analysis "
+        "for educational purposes only. It does not provide financial advice, "
+        "trading signals, or price predictions. Cryptocurrency markets are "
+        "highly volatile and risky. Always conduct your own research and "
+        "consult with qualified financial professionals."
+    ),
+    "version": api_config["version"],
+    "endpoints": {
+        "analyze": "POST /analyze - Perform market analysis",
+        "health": "GET /health - Check system health",
+        "info": "GET /info - Get API information",
+        "docs": "GET /docs - API documentation"
+    }
+}
+
+
+# Placeholder market conditions until the research report exposes them
+DEFAULT_MARKET_CONDITIONS: Dict[str, Any] = {
+    "overall_state": "neutral",
+    "key_factors": [],
+    "confidence_level": "moderate"
+}
+
+HEALTH_COMPONENTS: Dict[str, str] = {
+    "analyzer": "healthy",
+    "formatter": "healthy",
+    "api": "healthy"
+}
 
 
 # Pydantic models for request/response
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
 class AnalysisRequest(BaseModel):
-    """Request model for market analysis."""
-    query: str
-    assets: Optional[List[str]] = None
+    """
+    Request model for market analysis.
+    
+    Query length and asset count are enforced during parsing, so invalid
+    requests are rejected with a 422 before reaching the handler.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    query: Annotated[str, StringConstraints(strip_whitespace=True, min_length=3)]
+    assets: Optional[Annotated[List[str], Field(max_length=10)]] = None
+    
+    @field_validator("assets", mode="after")
+    @classmethod
+    def normalize_assets(cls, assets: Optional[List[str]]) -> Optional[List[str]]:
+        """Lowercase and strip asset names, dropping blank entries; None if none are left."""
+        normalized = [asset.strip().lower() for asset in assets or () if asset.strip()]
+        return normalized or None
+
+
+class MarketConditions(BaseModel):
+    """Market conditions summary within an analysis response."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    overall_state: str
+    key_factors: List[str]
+    confidence_level: str
+
+
+class AnalysisSections(BaseModel):
+    """Per-dimension report sections within an analysis response."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    macroeconomic: Dict[str, Any]
+    sentiment: Dict[str, Any]
+    onchain: Dict[str, Any]
+    market_structure: Dict[str, Any]
 
 
 class AnalysisResponse(BaseModel):
     """Response model for market analysis."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     query: str
     timestamp: str
     summary: str
-    market_conditions: Dict[str, Any]
-    analysis_sections: Dict[str, Any]
+    market_conditions: MarketConditions
+    analysis_sections: AnalysisSections
     key_insights: List[str]
     risk_factors: List[str]
     educational_context: str
@@ -63,55 +236,39 @@ class AnalysisResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     status: str
     timestamp: str
     version: str
     components: Dict[str, str]
 
 
-@app.get("/", response_model=Dict[str, str])
-async def root():
+@app.get("/", response_model=None)
+async def root() -> ORJSONResponse:
     """
     Root endpoint with basic information.
     
     Returns:
         Basic API information
     """
-    return {
-        "message": "MacroChain AI - Cryptocurrency Market Analysis API",
-        "description": "Educational crypto market analysis without financial advice",
-        "version": api_config["version"],
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return ORJSONResponse(ROOT_RESPONSE)
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
+@app.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_check() -> ORJSONResponse:
     """
     Health check endpoint.
     
     Returns:
         System health status
     """
-    try:
-        from datetime import datetime
-        
-        components = {
-            "analyzer": "healthy",
-            "formatter": "healthy",
-            "api": "healthy"
-        }
-        
-        return HealthResponse(
-            status="healthy",
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            version=api_config["version"],
-            components=components
-        )
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        raise HTTPException(status_code=500, detail="Health check failed")
+    return ORJSONResponse({
+        "status": "healthy",
+        "timestamp": utc_timestamp(),
+        "version": api_config["version"],
+        "components": HEALTH_COMPONENTS
+    })
 
 
 @app.post("/analyze", response_model=AnalysisResponse)
@@ -129,30 +286,16 @@ async def analyze_market(request: AnalysisRequest):
         HTTPException: If analysis fails
     """
     try:
-        logger.info(f"Received analysis request: {request.query}")
-        
-        # Validate query
-        if not request.query or len(request.query.strip()) < 3:
-            raise HTTPException(
-                status_code=400, 
-                detail="Query must be at least 3 characters long"
-            )
+        logger.info("Received analysis request: %s", request.query)
         
-        # Validate assets if provided
-        if request.assets:
-            if len(request.assets) > 10:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Maximum 10 assets allowed per request"
-                )
-            
-            # Convert to lowercase for consistency
-            assets = [asset.lower().strip() for asset in request.assets if asset.strip()]
-        else:
-            assets = None
+        # Query and assets are already validated and normalized by the model
+        assets = request.assets
         
-        # Perform comprehensive analysis using research pipeline
-        analysis_result = analyzer.analyze(request.query, assets)
+        # Perform comprehensive analysis using research pipeline.
+        # The pipeline is awaited on this loop and runs its analyzers on
+        # worker threads; the analyzer shares in-flight runs between
+        # identical requests and caches completed results.
+        analysis_result = await get_analyzer().analyze_async(request.query, assets)
         
         # Check for analysis errors
         if analysis_result.get("error"):
@@ -162,8 +305,9 @@ async def analyze_market(request: AnalysisRequest):
             )
         
         # Format professional research report
-        research_report = research_formatter.format_research_report(
-            analysis_result, 
+        research_report = await run_in_threadpool(
+            get_research_formatter().format_research_report,
+            analysis_result,
             request.query
         )
         
@@ -176,82 +320,31 @@ async def analyze_market(request: AnalysisRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Analysis request failed: {str(e)}")
+        logger.error("Analysis request failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error during analysis: {str(e)}"
         )
 
 
-@app.get("/info", response_model=Dict[str, Any])
-async def get_info():
+@app.get("/info", response_model=None)
+async def get_info() -> ORJSONResponse:
     """
     Get information about the API and analysis capabilities.
     
     Returns:
         API information and capabilities
     """
-    try:
-        return {
-            "name": "MacroChain AI",
-            "description": "AI-powered cryptocurrency market analysis agent",
-            "purpose": "Educational market analysis without financial advice",
-            "capabilities": [
-                "Deep research pipeline with deterministic methodology",
-                "Macroeconomic analysis with liquidity and policy context",
-                "Market sentiment assessment with volatility and momentum",
-                "On-chain dynamics analysis with network fundamentals",
-                "Market structure analysis with trading context",
-                "Cross-phase correlation and synthesis",
-                "Professional research report generation",
-                "Risk assessment and uncertainty quantification"
-            ],
-            "supported_assets": [
-                "bitcoin",
-                "ethereum", 
-                "major cryptocurrencies"
-            ],
-            "analysis_types": [
-                "macroeconomic",
-                "sentiment",
-                "onchain",
-                "combined"
-            ],
-            "limitations": [
-                "Educational purposes only - no financial advice",
-                "No price predictions or trading signals",
-                "Conceptual analysis framework, not real-time data",
-                "Research-grade methodology with documented limitations",
-                "Market complexity exceeds analytical frameworks",
-                "Unforeseen events can invalidate current analysis"
-            ],
-            "disclaimer": (
-                "MacroChain AI provides research-grade cryptocurrency market analysis "
-                "for educational purposes only. It does not provide financial advice, "
-                "trading signals, or price predictions. Cryptocurrency markets are "
-                "highly volatile and risky. Always conduct your own research and "
-                "consult with qualified financial professionals."
-            ),
-            "version": api_config["version"],
-            "endpoints": {
-                "analyze": "POST /analyze - Perform market analysis",
-                "health": "GET /health - Check system health",
-                "info": "GET /info - Get API information",
-                "docs": "GET /docs - API documentation"
-            }
-        }
-    except Exception as e:
-        logger.error(f"Info request failed: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve API information: {str(e)}"
-        )
+    return ORJSONResponse(INFO_RESPONSE)
 
 
 def _convert_to_api_response(research_report: Dict[str, Any], query: str) -> Dict[str, Any]:
     """
     Convert research report to API response format.
     
+    Report sections are referenced, not copied; only the flattened
+    insight and risk lists are built per request.
+    
     Args:
         research_report: Professional research report
         query: Original user query
@@ -259,64 +352,83 @@ def _convert_to_api_response(research_report: Dict[str, Any], query: str) -> Dic
     Returns:
         API-compatible response
     """
+    header = research_report["report_header"]
+    research_focus = research_report["research_focus"]
+    key_insights = research_report.get("key_insights") or {}
+    risks_uncertainty = research_report.get("risks_uncertainty") or {}
+    
     return {
         "query": query,
-        "timestamp": research_report["report_header"]["publication_date"],
-        "summary": f"{research_report['report_header']['title']} - {research_report['research_focus']['research_objective']}",
-        "market_conditions": {
-            "overall_state": "neutral",  # Extract from research data if available
-            "key_factors": [],
-            "confidence_level": "moderate"
-        },
+        "timestamp": header["publication_date"],
+        "summary": f"{header['title']} - {research_focus['research_objective']}",
+        "market_conditions": DEFAULT_MARKET_CONDITIONS,
         "analysis_sections": {
-            "macroeconomic": research_report.get("macro_context", {}),
-            "sentiment": research_report.get("market_sentiment", {}),
-            "onchain": research_report.get("onchain_overview", {}),
-            "market_structure": research_report.get("market_structure", {})
+            "macroeconomic": research_report.get("macro_context") or {},
+            "sentiment": research_report.get("market_sentiment") or {},
+            "onchain": research_report.get("onchain_overview") or {},
+            "market_structure": research_report.get("market_structure") or {}
         },
-        "key_insights": [
-            insight["insight"] for insight in research_report.get("key_insights", {}).get("insights", [])
-        ],
-        "risk_factors": [
-            risk["risk"] for risk in research_report.get("risks_uncertainty", {}).get("risk_factors", [])
-        ],
-        "educational_context": "\n".join(research_report.get("research_focus", {}).get("methodology", [])),
+        "key_insights": [insight["insight"] for insight in key_insights.get("insights", ())],
+        "risk_factors": [risk["risk"] for risk in risks_uncertainty.get("risk_factors", ())],
+        "educational_context": "\n".join(research_focus.get("methodology", ())),
         "disclaimer": research_report.get("disclaimer", ""),
-        "metadata": research_report.get("report_metadata", {})
+        "metadata": research_report.get("report_metadata") or {}
     }
 
 
+# Error bodies are mostly static; their fixed fields are built once and
+# merged with the per-request fields
+_NOT_FOUND_BODY: Dict[str, Any] = {
+    "error": "Endpoint not found",
+    "message": None,  # Set per request; listed here to keep its place in the body
+    "available_endpoints": ["/", "/health", "/analyze", "/info", "/docs"]
+}
+
+_VALIDATION_ERROR_BODY: Dict[str, Any] = {
+    "error": "Validation error",
+    "message": "Request validation failed. Please check your input parameters."
+}
+
+_INTERNAL_ERROR_BODY: Dict[str, Any] = {
+    "error": "Internal server error",
+    "message": "An unexpected error occurred while processing your request."
+}
+
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Handle 404 errors."""
-    return {
-        "error": "Endpoint not found",
-        "message": f"The requested endpoint {request.url.path} does not exist",
-        "available_endpoints": ["/", "/health", "/analyze", "/info", "/docs"],
-        "timestamp": research_formatter._get_timestamp()
-    }
+    return ORJSONResponse(
+        status_code=404,
+        content={
+            **_NOT_FOUND_BODY,
+            "message": f"The requested endpoint {request.url.path} does not exist",
+            "timestamp": utc_timestamp()
+        }
+    )
 
 
 @app.exception_handler(422)
 async def validation_error_handler(request, exc):
     """Handle validation errors."""
-    return {
-        "error": "Validation error",
-        "message": "Request validation failed. Please check your input parameters.",
-        "details": str(exc),
-        "timestamp": research_formatter._get_timestamp()
-    }
+    return ORJSONResponse(
+        status_code=422,
+        content={
+            **_VALIDATION_ERROR_BODY,
+            "details": str(exc),
+            "timestamp": utc_timestamp()
+        }
+    )
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """Handle internal server errors."""
-    logger.error(f"Internal server error: {str(exc)}")
-    return {
-        "error": "Internal server error",
-        "message": "An unexpected error occurred while processing your request.",
-        "timestamp": research_formatter._get_timestamp()
-    }
+    logger.error("Internal server error: %s", exc)
+    return ORJSONResponse(
+        status_code=500,
+        content={**_INTERNAL_ERROR_BODY, "timestamp": utc_timestamp()}
+    )
 
 
 # Startup event
@@ -324,11 +436,22 @@ async def internal_error_handler(request, exc):
 async def startup_event():
     """Handle application startup."""
     logger.info("MacroChain AI API starting up...")
-    logger.info(f"API version: {api_config['version']}")
+    logger.info("API version: %s", api_config["version"])
     logger.info("Documentation available at: /docs")
+    
+    # Build the analysis stack in the background so the first request does not pay for it
+    asyncio.get_running_loop().run_in_executor(None, _prewarm_analyzer)
     logger.info("MacroChain AI API ready to serve requests")
 
 
+def _prewarm_analyzer() -> None:
+    """Create the shared analyzer and its components ahead of traffic."""
+    try:
+        get_analyzer().prewarm()
+    except Exception:
+        logger.exception("Analyzer prewarm failed; components will be created on first use")
+
+
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -336,14 +459,51 @@ async def shutdown_event():
     logger.info("MacroChain AI API shutting down...")
 
 
+def _install_event_loop_policy(policy_path: str) -> None:
+    """
+    Install an alternative asyncio event loop policy.
+    
+    Used for event loops that uvicorn does not know about, such as
+    io_uring-backed loops that batch socket I/O submissions into fewer
+    syscalls. These mainly help on Linux 6.1+ with many concurrent
+    connections.
+    
+    Args:
+        policy_path: Import path in "module:PolicyClass" form
+    """
+    import importlib
+    
+    module_name, _, class_name = policy_path.partition(":")
+    if not class_name:
+        raise ValueError(f"Event loop policy must be 'module:PolicyClass', got {policy_path!r}")
+    
+    policy_class = getattr(importlib.import_module(module_name), class_name)
+    asyncio.set_event_loop_policy(policy_class())
+    logger.info("Using event loop policy: %s", policy_path)
+
+
 if __name__ == "__main__":
     import uvicorn
     
-    # Run the application
+    loop = "auto"
+    if api_config["event_loop_policy"]:
+        # uvicorn's "asyncio" setup keeps an already-installed policy, so
+        # the custom loop is used by the server process. It is not carried
+        # into reload subprocesses.
+        _install_event_loop_policy(api_config["event_loop_policy"])
+        loop = "asyncio"
+    
+    # Run the application. With uvicorn[standard] installed, "auto" selects
+    # the uvloop event loop and the httptools parser where available.
+    # Reload and access logging are off unless enabled via API_RELOAD /
+    # API_ACCESS_LOG, since both add per-request or background overhead.
     uvicorn.run(
-        "app:app",
+        "api.app:app",
         host=api_config["host"],
         port=api_config["port"],
-        reload=True,
+        reload=api_config["reload"],
+        loop=loop,
+        http="auto",
+        access_log=api_config["access_log"],
         log_level="info"
     )
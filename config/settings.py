@@ -6,12 +6,23 @@ for the MacroChain AI system.
 """
 
 import os
-from typing import Dict, Any
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, Mapping
+from dotenv import load_dotenv
 
 
-class Settings(BaseSettings):
-    """Application settings."""
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings.
+    
+    Each field can be overridden by an environment variable of the same
+    name in upper case (e.g. ``API_PORT``), or by an entry in ``.env``.
+    """
     
     # API Configuration
     api_host: str = "0.0.0.0"
@@ -19,10 +30,14 @@ class Settings(BaseSettings):
     api_title: str = "MacroChain AI API"
     api_description: str = "AI-powered crypto market analysis agent"
     api_version: str = "1.0.0"
+    api_reload: bool = False  # Development only
+    api_access_log: bool = False
+    api_event_loop_policy: str = ""  # Optional "module:PolicyClass", e.g. io_uring-backed loops
     
     # Analysis Configuration
     max_analysis_length: int = 2000
     analysis_timeout: int = 30
+    analysis_cache_size: int = 512
     
     # LLM Configuration (placeholder for future integration)
     llm_provider: str = "openai"  # Can be changed to other providers
@@ -43,59 +58,104 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from environment variables, falling back to defaults.
+        
+        Returns:
+            Settings instance
+        """
+        overrides = {}
+        for field in fields(cls):
+            raw = os.environ.get(field.name.upper())
+            if raw is None:
+                continue
+            
+            field_type = type(field.default)
+            if field_type is bool:
+                overrides[field.name] = raw.strip().lower() in _TRUE_VALUES
+            else:
+                overrides[field.name] = field_type(raw)
+        
+        return cls(**overrides)
+
+
+# Global settings instance (environment takes precedence over .env)
+load_dotenv(".env", encoding="utf-8")
+settings = Settings.from_env()
+
+# Read-only configuration views, built once at import
+ANALYSIS_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "max_length": settings.max_analysis_length,
+    "timeout": settings.analysis_timeout,
+    "cache_size": settings.analysis_cache_size,
+    "enable_onchain": settings.enable_onchain_data,
+    "enable_sentiment": settings.enable_sentiment_data,
+    "enable_macro": settings.enable_macro_data,
+    "max_risk_level": settings.max_risk_level,
+    "require_disclaimer": settings.require_disclaimer
+})
+
+LLM_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "provider": settings.llm_provider,
+    "model": settings.llm_model,
+    "temperature": settings.llm_temperature,
+    "max_tokens": settings.llm_max_tokens
+})
 
+LOGGING_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "level": settings.log_level,
+    "format": settings.log_format
+})
 
-# Global settings instance
-settings = Settings()
+API_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "host": settings.api_host,
+    "port": settings.api_port,
+    "title": settings.api_title,
+    "description": settings.api_description,
+    "version": settings.api_version,
+    "reload": settings.api_reload,
+    "access_log": settings.api_access_log,
+    "event_loop_policy": settings.api_event_loop_policy
+})
 
 
-def get_analysis_config() -> Dict[str, Any]:
+def get_analysis_config() -> Mapping[str, Any]:
     """
     Get analysis configuration parameters.
     
     Returns:
-        Dictionary containing analysis configuration
+        Read-only mapping containing analysis configuration
     """
-    return {
-        "max_length": settings.max_analysis_length,
-        "timeout": settings.analysis_timeout,
-        "enable_onchain": settings.enable_onchain_data,
-        "enable_sentiment": settings.enable_sentiment_data,
-        "enable_macro": settings.enable_macro_data,
-        "max_risk_level": settings.max_risk_level,
-        "require_disclaimer": settings.require_disclaimer
-    }
-
-
-def get_llm_config() -> Dict[str, Any]:
+    return ANALYSIS_CONFIG
+
+
+def get_llm_config() -> Mapping[str, Any]:
     """
     Get LLM configuration parameters.
     
     Returns:
-        Dictionary containing LLM configuration
+        Read-only mapping containing LLM configuration
     """
-    return {
-        "provider": settings.llm_provider,
-        "model": settings.llm_model,
-        "temperature": settings.llm_temperature,
-        "max_tokens": settings.llm_max_tokens
-    }
+    return LLM_CONFIG
 
 
-def get_api_config() -> Dict[str, Any]:
+def get_api_config() -> Mapping[str, Any]:
     """
     Get API configuration parameters.
     
     Returns:
-        Dictionary containing API configuration
+        Read-only mapping containing API configuration
+    """
+    return API_CONFIG
+
+
+def get_logging_config() -> Mapping[str, Any]:
+    """
+    Get logging configuration parameters.
+    
+    Returns:
+        Read-only mapping containing logging configuration
     """
-    return {
-        "host": settings.api_host,
-        "port": settings.api_port,
-        "title": settings.api_title,
-        "description": settings.api_description,
-        "version": settings.api_version
-    }
+    return LOGGING_CONFIG
@@ -2,14 +2,21 @@
 MacroChain AI Core Module
 
 This module contains the core analysis components for the MacroChain AI system.
+Components are imported lazily on first attribute access, so importing one
+submodule does not load the others.
 """
 
-from .analyzer import MacroChainAnalyzer
-from .macro import MacroAnalyzer
-from .sentiment import SentimentAnalyzer
-from .onchain import OnChainAnalyzer
-from .market_structure import MarketStructureAnalyzer
-from .research_pipeline import ResearchPipeline
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "MacroChainAnalyzer": ".analyzer",
+    "MacroAnalyzer": ".macro",
+    "SentimentAnalyzer": ".sentiment",
+    "OnChainAnalyzer": ".onchain",
+    "MarketStructureAnalyzer": ".market_structure",
+    "ResearchPipeline": ".research_pipeline"
+}
 
 __all__ = [
     "MacroChainAnalyzer",
@@ -19,3 +26,19 @@ __all__ = [
     "MarketStructureAnalyzer",
     "ResearchPipeline"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported components on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported components."""
+    return sorted(set(globals()) | set(__all__))
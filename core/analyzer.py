@@ -5,17 +5,363 @@ This module combines insights from macro, sentiment, and on-chain analysis
 to provide comprehensive cryptocurrency market analysis.
 """
 
-from typing import Dict, Any, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+import copy
+import importlib
 import logging
-from .macro import MacroAnalyzer
-from .sentiment import SentimentAnalyzer
-from .onchain import OnChainAnalyzer
-from .market_structure import MarketStructureAnalyzer
-from .research_pipeline import ResearchPipeline
+import threading
+import time
+from sys import intern
+
+from .clock import utc_timestamp
+from .coalescer import Coalescer
+from .readonly import ReadOnlyDict, freeze
+from .ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from .macro import MacroAnalyzer
+    from .sentiment import SentimentAnalyzer
+    from .onchain import OnChainAnalyzer
+    from .market_structure import MarketStructureAnalyzer
+    from .research_pipeline import ResearchPipeline
+
+try:  # Optional: compact numeric batch columns
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # Optional: native batch scoring
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 logger = logging.getLogger(__name__)
 
+# Classification values shared with the component analyzers. Interned so that
+# equality checks against the analyzers' (also interned) literals short-circuit
+# on identity; comparisons stay ``==`` so externally built dicts still match.
+_PHASE_TREND_UP = intern("trend_up")
+_PHASE_TREND_DOWN = intern("trend_down")
+_PHASE_TRANSITION = intern("transition")
+_PHASE_UNCERTAIN = intern("uncertain")
+_PHASE_RANGE = intern("range")
+_VOL_HIGH = intern("high")
+_VOL_EXTREME = intern("extreme")
+_VOL_LOW = intern("low")
+_COND_TIGHT = intern("tight")
+_COND_VERY_TIGHT = intern("very_tight")
+_COND_AMPLE = intern("ample")
+_SENT_FEAR = intern("fear")
+_SENT_GREED = intern("greed")
+_HEALTH_STRONG = intern("strong")
+_HEALTH_WEAKENING = intern("weakening")
+
+_TREND_PHASES = (_PHASE_TREND_UP, _PHASE_TREND_DOWN)
+_UNSETTLED_PHASES = (_PHASE_TRANSITION, _PHASE_UNCERTAIN)
+_ELEVATED_VOLATILITY = (_VOL_HIGH, _VOL_EXTREME)
+_TIGHT_CONDITIONS = (_COND_TIGHT, _COND_VERY_TIGHT)
+
+# Shared read-only fallback for missing nested sections (never returned to callers)
+_EMPTY = MappingProxyType({})
+
+_DISCLAIMER = (
+    "This analysis is for educational purposes only and does not constitute "
+    "financial advice. Cryptocurrency markets are highly volatile and risky. "
+    "Always conduct your own research and consult with qualified financial "
+    "professionals before making any investment decisions."
+)
+
+_GENERAL_RISK = "General cryptocurrency market volatility"
+
+# Assets analyzed when the caller does not name any
+_DEFAULT_ASSETS: Tuple[str, ...] = ("bitcoin", "ethereum")
+
+_SUMMARY_CLOSING = (
+    "This analysis illustrates how different factors interact in cryptocurrency markets.\n"
+    "Understanding these relationships can help in developing market awareness,\n"
+    "though it's important to remember that markets remain inherently unpredictable.\n"
+)
+
+
+class AnalysisCtx(NamedTuple):
+    """Component analyses plus the nested values the combining helpers share."""
+    macro: Dict[str, Any]
+    sentiment: Dict[str, Any]
+    onchain: Dict[str, Any]
+    structure: Dict[str, Any]
+    phase: Optional[str]
+    vol: Optional[str]
+    liq: Optional[str]
+    sent: Optional[str]
+    macro_liq: Optional[str]
+
+
+def _build_ctx(
+    macro: Dict[str, Any],
+    sentiment: Dict[str, Any],
+    onchain: Dict[str, Any],
+    structure: Dict[str, Any]
+) -> AnalysisCtx:
+    """Resolve the nested structure/sentiment/macro lookups once per analysis."""
+    return AnalysisCtx(
+        macro=macro,
+        sentiment=sentiment,
+        onchain=onchain,
+        structure=structure,
+        phase=structure.get("market_phase", {}).get("current_phase"),
+        vol=structure.get("volatility_regime", {}).get("current_regime"),
+        liq=structure.get("liquidity_conditions", {}).get("current_condition"),
+        sent=sentiment.get("overall_sentiment"),
+        macro_liq=macro.get("liquidity_conditions"),
+    )
+
+
+# Theme rules: (predicate(ctx), theme)
+_THEME_RULES = (
+    (lambda c: (c.macro.get("liquidity_tightening") or
+                c.onchain.get("reduced_activity") or
+                c.liq == _COND_TIGHT),
+     "Liquidity conditions affecting market activity"),
+    (lambda c: c.sentiment.get("fear_dominance") or c.sentiment.get("risk_off_sentiment"),
+     "Risk aversion dominating market sentiment"),
+    (lambda c: c.onchain.get("increased_adoption") or c.onchain.get("network_growth"),
+     "Network fundamentals showing strength"),
+    (lambda c: c.macro.get("policy_uncertainty") or c.macro.get("economic_volatility"),
+     "Macroeconomic uncertainty influencing crypto markets"),
+    (lambda c: c.phase in _UNSETTLED_PHASES,
+     "Market structure in transition phase"),
+    (lambda c: c.phase in _TREND_PHASES,
+     "Defined market structure with directional bias"),
+)
+
+# Correlation rules: (predicate(ctx), correlation)
+_CORRELATION_RULES = (
+    (lambda c: c.macro_liq == _COND_TIGHT and c.onchain.get("transaction_volume_trend") == "decreasing",
+     {
+         "type": "macro_onchain",
+         "observation": "Tight macro liquidity correlates with reduced on-chain activity",
+         "strength": "moderate"
+     }),
+    (lambda c: c.sent == _SENT_FEAR and c.onchain.get("holder_behavior") == "accumulation",
+     {
+         "type": "sentiment_onchain",
+         "observation": "Fear sentiment coincides with long-term holder accumulation",
+         "strength": "moderate"
+     }),
+    (lambda c: c.phase == _PHASE_TRANSITION and c.vol in _ELEVATED_VOLATILITY,
+     {
+         "type": "structure_volatility",
+         "observation": "Market structure transition coincides with high volatility",
+         "strength": "strong"
+     }),
+    (lambda c: (c.macro.get("overall_conditions", {}).get("overall") == "challenging" and
+                c.phase == _PHASE_RANGE),
+     {
+         "type": "macro_structure",
+         "observation": "Challenging macro conditions coincide with range-bound structure",
+         "strength": "moderate"
+     }),
+)
+
+
+@dataclass
+class AnalysisResult:
+    """Combined analysis result; converted to a plain dict at the API boundary."""
+    __slots__ = (
+        "query", "assets_analyzed", "timestamp", "market_conditions",
+        "macro_analysis", "sentiment_analysis", "onchain_analysis",
+        "market_structure_analysis", "key_themes", "correlations",
+        "educational_summary", "risk_factors", "research_quality", "disclaimer"
+    )
+    query: str
+    assets_analyzed: List[str]
+    timestamp: str
+    market_conditions: Dict[str, Any]
+    macro_analysis: Dict[str, Any]
+    sentiment_analysis: Dict[str, Any]
+    onchain_analysis: Dict[str, Any]
+    market_structure_analysis: Dict[str, Any]
+    key_themes: List[str]
+    correlations: List[Dict[str, Any]]
+    educational_summary: str
+    risk_factors: List[str]
+    research_quality: Optional[Dict[str, Any]]  # Only set by the research pipeline
+    disclaimer: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the response dictionary shape (shallow; sections are shared).
+        
+        Deliberately not dataclasses.asdict, which deep-copies every nested
+        section on each call.
+        
+        Returns:
+            Analysis result dictionary
+        """
+        if self.research_quality is None:
+            return dict(zip(_LEGACY_RESULT_KEYS, _legacy_result_values(self)))
+        return dict(zip(_RESULT_KEYS, _result_values(self)))
+
+
+# Fixed result key orders and matching bulk attribute getters
+_RESULT_KEYS = AnalysisResult.__slots__
+_LEGACY_RESULT_KEYS = tuple(key for key in _RESULT_KEYS if key != "research_quality")
+_result_values = attrgetter(*_RESULT_KEYS)
+_legacy_result_values = attrgetter(*_LEGACY_RESULT_KEYS)
+
+
+# Risk rules: (predicate(ctx), risk); the general market risk is always appended
+_RISK_RULES = (
+    (lambda c: c.macro.get("policy_uncertainty"),
+     "Regulatory and policy uncertainty"),
+    (lambda c: c.sentiment.get("extreme_sentiment"),
+     "Extreme market sentiment may indicate volatility"),
+    (lambda c: c.onchain.get("concentration_risk"),
+     "High concentration of holdings"),
+    (lambda c: c.macro_liq == _COND_TIGHT,
+     "Reduced market liquidity"),
+    (lambda c: c.phase == _PHASE_TRANSITION,
+     "Market structure transition increases uncertainty"),
+    (lambda c: c.vol in _ELEVATED_VOLATILITY,
+     "High volatility environment increases risk"),
+    (lambda c: c.liq in _TIGHT_CONDITIONS,
+     "Tight liquidity conditions may increase execution risk"),
+)
+
+# Market condition features: one flag per candidate factor
+(
+    _F_SENTIMENT_FEAR,
+    _F_SENTIMENT_GREED,
+    _F_MACRO_TIGHT,
+    _F_MACRO_AMPLE,
+    _F_NETWORK_STRONG,
+    _F_NETWORK_WEAKENING,
+    _F_PHASE_TREND,
+    _F_PHASE_TRANSITION,
+    _F_VOLATILITY_HIGH,
+    _F_VOLATILITY_LOW,
+) = range(10)
+_N_FEATURES = 10
+
+# Direction of each feature: +1 supportive, -1 adverse, 0 descriptive only
+_FEATURE_WEIGHTS = (-1, 1, -1, 1, 1, -1, 0, 0, 0, 0)
+
+# Factor text per feature (the trend text depends on the phase)
+_FEATURE_TEXT = (
+    "Negative sentiment pressure",
+    "Positive sentiment pressure",
+    "Constrained macro liquidity",
+    "Supportive macro liquidity",
+    "Strong on-chain fundamentals",
+    "Weakening on-chain fundamentals",
+    None,
+    "Market structure in transition",
+    "High volatility environment",
+    "Low volatility environment",
+)
+
+_OVERALL_STATES = ("neutral", "positive", "negative")
+
+
+def _condition_features(ctx: AnalysisCtx) -> Tuple[int, ...]:
+    """Encode the market-condition factors present in ctx as a flag vector."""
+    network_health = ctx.onchain.get("network_health")
+    return (
+        ctx.sent == _SENT_FEAR,
+        ctx.sent == _SENT_GREED,
+        ctx.macro_liq == _COND_TIGHT,
+        ctx.macro_liq == _COND_AMPLE,
+        network_health == _HEALTH_STRONG,
+        network_health == _HEALTH_WEAKENING,
+        ctx.phase in _TREND_PHASES,
+        ctx.phase == _PHASE_TRANSITION,
+        ctx.vol in _ELEVATED_VOLATILITY,
+        ctx.vol == _VOL_LOW,
+    )
+
+
+def _score_features(features: Sequence[int]) -> Tuple[int, int, int]:
+    """
+    Score one feature vector.
+    
+    Args:
+        features: Flag per feature, in _F_* order
+        
+    Returns:
+        (positive count, negative count, index into _OVERALL_STATES)
+    """
+    positive = negative = 0
+    for weight, flag in zip(_FEATURE_WEIGHTS, features):
+        if flag:
+            if weight > 0:
+                positive += 1
+            elif weight < 0:
+                negative += 1
+    
+    if positive > negative:
+        return positive, negative, 1
+    if negative > positive:
+        return positive, negative, 2
+    return positive, negative, 0
+
+
+if njit is not None:
+    _FEATURE_WEIGHTS_ARRAY = np.array(_FEATURE_WEIGHTS, dtype=np.int8)
+    
+    @njit("int64[:, :](int8[:, :], int8[:])", cache=True, nogil=True)
+    def _score_feature_rows_native(rows, weights):
+        scored = np.zeros((rows.shape[0], 3), dtype=np.int64)
+        for i in range(rows.shape[0]):
+            positive = 0
+            negative = 0
+            for j in range(rows.shape[1]):
+                if rows[i, j] != 0:
+                    if weights[j] > 0:
+                        positive += 1
+                    elif weights[j] < 0:
+                        negative += 1
+            scored[i, 0] = positive
+            scored[i, 1] = negative
+            if positive > negative:
+                scored[i, 2] = 1
+            elif negative > positive:
+                scored[i, 2] = 2
+        return scored
+
+
+@lru_cache(maxsize=None)
+def _warn_pure_python_scoring() -> None:
+    """Log (once) that batch scoring runs without Numba."""
+    logger.warning("Numba is not installed; batch condition scoring uses the pure-Python fallback")
+
+
+def _score_feature_rows(rows: Sequence[Sequence[int]]) -> List[Tuple[int, int, int]]:
+    """
+    Score many feature vectors at once.
+    
+    Uses a compiled Numba kernel when numba is installed; per-call analysis
+    scores a single vector in pure Python, where dispatch would dominate.
+    
+    Args:
+        rows: Feature vectors, in _F_* order
+        
+    Returns:
+        (positive count, negative count, state index) per row
+    """
+    if njit is None:
+        _warn_pure_python_scoring()
+        return [_score_features(row) for row in rows]
+    
+    matrix = np.asarray(rows, dtype=np.int8).reshape(-1, _N_FEATURES)
+    return [tuple(row) for row in _score_feature_rows_native(matrix, _FEATURE_WEIGHTS_ARRAY).tolist()]
+
 
 class MacroChainAnalyzer:
     """
@@ -26,13 +372,100 @@ class MacroChainAnalyzer:
     educational and neutral perspective.
     """
     
-    def __init__(self):
-        """Initialize the analyzer with all components."""
-        self.macro_analyzer = MacroAnalyzer()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.onchain_analyzer = OnChainAnalyzer()
-        self.market_structure_analyzer = MarketStructureAnalyzer()
-        self.research_pipeline = ResearchPipeline()
+    __slots__ = (
+        "_macro_analyzer",
+        "_sentiment_analyzer",
+        "_onchain_analyzer",
+        "_market_structure_analyzer",
+        "_research_pipeline",
+        "_init_lock",
+        "legacy_timeout",
+        "_pool",
+        "_cache",
+        "_coalescer"
+    )
+    
+    # Component slot -> (module, class); imported and built on first use
+    _COMPONENTS = {
+        "_macro_analyzer": (".macro", "MacroAnalyzer"),
+        "_sentiment_analyzer": (".sentiment", "SentimentAnalyzer"),
+        "_onchain_analyzer": (".onchain", "OnChainAnalyzer"),
+        "_market_structure_analyzer": (".market_structure", "MarketStructureAnalyzer"),
+        "_research_pipeline": (".research_pipeline", "ResearchPipeline"),
+    }
+    
+    def __init__(
+        self,
+        legacy_timeout: float = 30.0,
+        cache_size: int = 512,
+        cache_ttl: float = 60.0
+    ):
+        """
+        Initialize the analyzer; components are created on first use.
+        
+        Args:
+            legacy_timeout: Seconds to wait for the component analyses in
+                analyze_legacy before falling back to partial results
+            cache_size: Maximum number of cached analysis results
+            cache_ttl: Seconds a cached analysis result stays fresh
+        """
+        for slot in self._COMPONENTS:
+            setattr(self, slot, None)
+        self._init_lock = threading.Lock()
+        self.legacy_timeout = legacy_timeout
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mca")
+        self._cache = TTLCache(cache_size, cache_ttl)
+        self._coalescer = Coalescer()
+    
+    @property
+    def macro_analyzer(self) -> "MacroAnalyzer":
+        """Macroeconomic analyzer, created on first use."""
+        return self._macro_analyzer or self._init_component("_macro_analyzer")
+    
+    @property
+    def sentiment_analyzer(self) -> "SentimentAnalyzer":
+        """Sentiment analyzer, created on first use."""
+        return self._sentiment_analyzer or self._init_component("_sentiment_analyzer")
+    
+    @property
+    def onchain_analyzer(self) -> "OnChainAnalyzer":
+        """On-chain analyzer, created on first use."""
+        return self._onchain_analyzer or self._init_component("_onchain_analyzer")
+    
+    @property
+    def market_structure_analyzer(self) -> "MarketStructureAnalyzer":
+        """Market structure analyzer, created on first use."""
+        return self._market_structure_analyzer or self._init_component("_market_structure_analyzer")
+    
+    @property
+    def research_pipeline(self) -> "ResearchPipeline":
+        """Research pipeline, created on first use."""
+        return self._research_pipeline or self._init_component("_research_pipeline")
+    
+    def _init_component(self, slot: str) -> Any:
+        """
+        Import and construct a component exactly once, even across threads.
+        
+        Args:
+            slot: Private slot holding the component
+            
+        Returns:
+            The component instance
+        """
+        with self._init_lock:
+            component = getattr(self, slot)
+            if component is None:
+                module_name, class_name = self._COMPONENTS[slot]
+                module = importlib.import_module(module_name, __package__)
+                component = getattr(module, class_name)()
+                setattr(self, slot, component)
+            return component
+    
+    def prewarm(self) -> None:
+        """Create every component now instead of on the first request."""
+        for slot in self._COMPONENTS:
+            if getattr(self, slot) is None:
+                self._init_component(slot)
         
     def analyze(self, query: str, assets: List[str] = None) -> Dict[str, Any]:
         """
@@ -45,26 +478,85 @@ class MacroChainAnalyzer:
         Returns:
             Dictionary containing structured analysis results
         """
+        cache_key = self._cache_key("pipeline", query, assets)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical requests, sync or async, share one pipeline run
+        result, shared = self._coalescer.do(cache_key, self._analyze_pipeline, query, assets, cache_key)
+        return self._unshared(result, shared)
+    
+    def _analyze_pipeline(self, query: str, assets: Optional[List[str]], cache_key: Hashable) -> Dict[str, Any]:
+        """Run the research pipeline and cache its formatted result."""
         try:
-            logger.info(f"Starting comprehensive analysis for query: {query}")
+            logger.info("Starting comprehensive analysis for query: %s", query)
             
             # Use the research pipeline for comprehensive analysis
             pipeline_result = self.research_pipeline.execute_research(query, assets)
+            return self._finish_pipeline(pipeline_result, cache_key)
             
-            if pipeline_result.get("error"):
-                return self._error_response(pipeline_result.get("message", "Pipeline failed"))
+        except Exception as e:
+            logger.error("Error during analysis: %s", e)
+            return self._error_response(str(e))
+    
+    async def analyze_async(self, query: str, assets: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Event-loop variant of analyze.
+        
+        The research pipeline is awaited on the caller's loop and runs its
+        component analyzers on the pipeline's worker threads, so async
+        callers never block their loop or start a second one. Concurrent
+        identical requests share one run, whether they came through
+        analyze or analyze_async.
+        
+        Args:
+            query: User's analysis request
+            assets: List of assets to focus on (optional)
             
-            # Format results for backward compatibility
-            formatted_result = self._format_pipeline_results(pipeline_result)
+        Returns:
+            Dictionary containing structured analysis results
+        """
+        cache_key = self._cache_key("pipeline", query, assets)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result, shared = await self._coalescer.do_async(
+            cache_key, self._analyze_pipeline_async, query, assets, cache_key
+        )
+        return self._unshared(result, shared)
+    
+    async def _analyze_pipeline_async(
+        self, query: str, assets: Optional[List[str]], cache_key: Hashable
+    ) -> Dict[str, Any]:
+        """Await the research pipeline and cache its formatted result."""
+        try:
+            logger.info("Starting async comprehensive analysis for query: %s", query)
             
-            logger.info("Comprehensive analysis completed successfully")
-            return formatted_result
+            pipeline_result = await self.research_pipeline.execute_research_async(query, assets)
+            return self._finish_pipeline(pipeline_result, cache_key)
             
         except Exception as e:
-            logger.error(f"Error during analysis: {str(e)}")
+            logger.error("Error during async analysis: %s", e)
             return self._error_response(str(e))
     
-    def analyze_legacy(self, query: str, assets: List[str] = None) -> Dict[str, Any]:
+    def _finish_pipeline(self, pipeline_result: Dict[str, Any], cache_key: Hashable) -> Dict[str, Any]:
+        """Format a research pipeline report, caching it if every phase succeeded."""
+        if pipeline_result.get("error"):
+            return self._error_response(pipeline_result.get("message", "Pipeline failed"))
+        
+        # Format results for backward compatibility
+        formatted_result = self._format_pipeline_results(pipeline_result).to_dict()
+        logger.info("Comprehensive analysis completed successfully")
+        
+        # A phase that failed or timed out may succeed on the next request
+        execution = pipeline_result["pipeline_execution"]
+        if execution["phases_completed"] < execution["total_phases"]:
+            return freeze(formatted_result)
+        return self._cache.set(cache_key, formatted_result)
+    
+    def analyze_legacy(self, query: str, assets: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """
         Legacy analysis method for backward compatibility.
         
@@ -75,18 +567,31 @@ class MacroChainAnalyzer:
         Returns:
             Dictionary containing structured analysis results
         """
+        cache_key = self._cache_key("legacy", query, assets)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical requests, sync or async, share one set of component analyses
+        result, shared = self._coalescer.do(cache_key, self._analyze_legacy, query, assets, cache_key)
+        return self._unshared(result, shared)
+    
+    def _analyze_legacy(self, query: str, assets: Optional[Sequence[str]], cache_key: Hashable) -> Dict[str, Any]:
+        """Run and combine the component analyses, caching the result."""
         try:
-            logger.info(f"Starting legacy analysis for query: {query}")
+            logger.info("Starting legacy analysis for query: %s", query)
             
             # Default to major cryptocurrencies if no assets specified
             if not assets:
-                assets = ["bitcoin", "ethereum"]
+                assets = _DEFAULT_ASSETS
             
-            # Perform individual analyses
-            macro_analysis = self.macro_analyzer.analyze(query, assets)
-            sentiment_analysis = self.sentiment_analyzer.analyze(query, assets)
-            onchain_analysis = self.onchain_analyzer.analyze(query, assets)
-            structure_analysis = self.market_structure_analyzer.analyze(query, assets)
+            # Perform individual analyses concurrently
+            (
+                macro_analysis,
+                sentiment_analysis,
+                onchain_analysis,
+                structure_analysis
+            ) = self._run_component_analyses(query, assets)
             
             # Combine insights
             combined_analysis = self._combine_analyses(
@@ -96,15 +601,230 @@ class MacroChainAnalyzer:
                 structure_analysis,
                 query,
                 assets
-            )
+            ).to_dict()
             
+            cached_result = self._cache.set(cache_key, combined_analysis)
             logger.info("Legacy analysis completed successfully")
-            return combined_analysis
+            return cached_result
+            
+        except Exception as e:
+            logger.error("Error during legacy analysis: %s", e)
+            return self._error_response(str(e))
+    
+    async def analyze_legacy_async(self, query: str, assets: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Event-loop variant of analyze_legacy.
+        
+        The component analyzers run on the analyzer's thread pool and are
+        awaited with asyncio.wait, bounded by legacy_timeout, so async callers
+        never block their loop. A component that raised is replaced by its
+        error response, and one still pending at the deadline has its task
+        cancelled and is replaced by a timeout response; the worker thread
+        itself cannot be interrupted and finishes in the background.
+        
+        Args:
+            query: User's analysis request
+            assets: List of assets to focus on (optional)
+            
+        Returns:
+            Dictionary containing structured analysis results
+        """
+        cache_key = self._cache_key("legacy", query, assets)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result, shared = await self._coalescer.do_async(
+            cache_key, self._analyze_legacy_async, query, assets, cache_key
+        )
+        return self._unshared(result, shared)
+    
+    async def _analyze_legacy_async(
+        self, query: str, assets: Optional[Sequence[str]], cache_key: Hashable
+    ) -> Dict[str, Any]:
+        """Await the component analyses, then combine and cache the result."""
+        try:
+            logger.info("Starting async legacy analysis for query: %s", query)
+            
+            if not assets:
+                assets = _DEFAULT_ASSETS
+            
+            loop = asyncio.get_running_loop()
+            analyzers = self._component_analyzers()
+            tasks = [
+                asyncio.ensure_future(loop.run_in_executor(self._pool, analyzer.analyze, query, assets))
+                for analyzer in analyzers
+            ]
+            done, pending = await asyncio.wait(tasks, timeout=self.legacy_timeout)
+            
+            results = []
+            for analyzer, task in zip(analyzers, tasks):
+                if task in pending:
+                    task.cancel()
+                    results.append(self._component_timeout(analyzer))
+                elif task.exception() is not None:
+                    results.append(self._component_failure(analyzer, task.exception()))
+                else:
+                    results.append(task.result())
+            
+            combined_analysis = self._combine_analyses(*results, query, assets).to_dict()
+            
+            cached_result = self._cache.set(cache_key, combined_analysis)
+            logger.info("Async legacy analysis completed successfully")
+            return cached_result
             
         except Exception as e:
-            logger.error(f"Error during legacy analysis: {str(e)}")
+            logger.error("Error during async legacy analysis: %s", e)
             return self._error_response(str(e))
     
+    def analyze_batch(
+        self,
+        requests: Sequence[Tuple[str, Optional[Sequence[str]]]]
+    ) -> Dict[str, Any]:
+        """
+        Run legacy analysis over many (query, assets) pairs in columnar form.
+        
+        Each top-level field becomes one column with a row per request, so
+        the result can be passed straight to ``pandas.DataFrame``. Factor
+        counts are int8 numpy arrays when numpy is installed.
+        
+        Args:
+            requests: (query, assets) pairs; assets may be None for the defaults
+            
+        Returns:
+            Dictionary of equal-length columns
+        """
+        columns: Dict[str, Any] = {
+            "query": [],
+            "assets_analyzed": [],
+            "timestamp": [],
+            "error": [],
+            "overall_state": [],
+            "confidence_level": [],
+            "key_factors": [],
+            "key_themes": [],
+            "risk_factors": [],
+        }
+        feature_rows = []
+        
+        for query, assets in requests:
+            result = self.analyze_legacy(query, assets)
+            failed = bool(result.get("error"))
+            conditions = result.get("market_conditions") or _EMPTY
+            
+            columns["query"].append(query)
+            columns["assets_analyzed"].append(result.get("assets_analyzed", list(assets or _DEFAULT_ASSETS)))
+            columns["timestamp"].append(result.get("timestamp"))
+            columns["error"].append(failed)
+            columns["overall_state"].append(conditions.get("overall_state"))
+            columns["confidence_level"].append(conditions.get("confidence_level"))
+            columns["key_factors"].append(conditions.get("key_factors", []))
+            columns["key_themes"].append(result.get("key_themes", []))
+            columns["risk_factors"].append(result.get("risk_factors", []))
+            feature_rows.append(
+                (0,) * _N_FEATURES if failed else _condition_features(_build_ctx(
+                    result["macro_analysis"],
+                    result["sentiment_analysis"],
+                    result["onchain_analysis"],
+                    result["market_structure_analysis"]
+                ))
+            )
+        
+        scored = _score_feature_rows(feature_rows) if feature_rows else []
+        positive = [row[0] for row in scored]
+        negative = [row[1] for row in scored]
+        if np is not None:
+            columns["positive_factors"] = np.array(positive, dtype=np.int8)
+            columns["negative_factors"] = np.array(negative, dtype=np.int8)
+        else:
+            columns["positive_factors"] = positive
+            columns["negative_factors"] = negative
+        
+        return columns
+    
+    def invalidate(self, query: Optional[str] = None) -> None:
+        """
+        Drop cached analysis results.
+        
+        Args:
+            query: Only drop results for exactly this query (any asset set); all
+                results are dropped when omitted
+        """
+        if query is None:
+            self._cache.invalidate()
+            return
+        self._cache.invalidate(lambda key: key[1] == query)
+    
+    @staticmethod
+    def _unshared(result: Dict[str, Any], shared: bool) -> Dict[str, Any]:
+        """Copy a coalesced result another caller also holds, unless it is read-only."""
+        # Cached results are frozen; only a shared error response needs copying
+        return copy.deepcopy(result) if shared and not isinstance(result, ReadOnlyDict) else result
+    
+    @staticmethod
+    def _cache_key(mode: str, query: str, assets: Optional[Sequence[str]]) -> Tuple[str, str, Tuple[str, ...]]:
+        """
+        Build the result cache key for an analysis request.
+        
+        Results echo the query and asset list back, so both are keyed
+        exactly as given; normalizing them would hand one caller another
+        caller's spelling or asset order.
+        """
+        return (mode, query, tuple(assets or _DEFAULT_ASSETS))
+    
+    def _component_analyzers(self) -> tuple:
+        """Component analyzers in the order _combine_analyses expects."""
+        return (
+            self.macro_analyzer,
+            self.sentiment_analyzer,
+            self.onchain_analyzer,
+            self.market_structure_analyzer
+        )
+    
+    def _component_timeout(self, analyzer: Any) -> Dict[str, Any]:
+        """Fallback result for a component that missed the deadline."""
+        logger.warning("%s timed out after %ss", type(analyzer).__name__, self.legacy_timeout)
+        return analyzer._error_response(f"timed out after {self.legacy_timeout}s")
+    
+    def _component_failure(self, analyzer: Any, error: BaseException) -> Dict[str, Any]:
+        """Fallback result for a component that raised."""
+        logger.error("%s failed: %s", type(analyzer).__name__, error)
+        return analyzer._error_response(str(error))
+    
+    def _run_component_analyses(self, query: str, assets: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Run the four component analyzers on the shared thread pool.
+        
+        A component that fails or misses the shared deadline is replaced by
+        its own error response, so one slow source cannot stall the result.
+        
+        Args:
+            query: User's analysis request
+            assets: Assets to analyze
+            
+        Returns:
+            Macro, sentiment, on-chain and market structure results, in order
+        """
+        analyzers = self._component_analyzers()
+        futures = [self._pool.submit(analyzer.analyze, query, assets) for analyzer in analyzers]
+        deadline = time.monotonic() + self.legacy_timeout
+        
+        results = []
+        for analyzer, future in zip(analyzers, futures):
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                future.cancel()
+                results.append(self._component_timeout(analyzer))
+            except Exception as e:
+                results.append(self._component_failure(analyzer, e))
+        
+        return results
+    
+    def shutdown(self) -> None:
+        """Release the worker threads used by analyze_legacy."""
+        self._pool.shutdown(wait=False)
+    
     def _combine_analyses(
         self, 
         macro: Dict[str, Any],
@@ -112,8 +832,8 @@ class MacroChainAnalyzer:
         onchain: Dict[str, Any],
         structure: Dict[str, Any],
         query: str,
-        assets: List[str]
-    ) -> Dict[str, Any]:
+        assets: Sequence[str]
+    ) -> AnalysisResult:
         """
         Combine individual analyses into a comprehensive result.
         
@@ -126,7 +846,7 @@ class MacroChainAnalyzer:
             assets: Assets analyzed
             
         Returns:
-            Combined analysis dictionary
+            Combined analysis result
         """
         # Extract key insights from each analysis
         macro_insights = macro.get("insights", [])
@@ -134,224 +854,102 @@ class MacroChainAnalyzer:
         onchain_insights = onchain.get("insights", [])
         structure_insights = structure.get("insights", [])
         
+        # Resolve shared nested lookups once for all helpers
+        ctx = _build_ctx(macro, sentiment, onchain, structure)
+        
         # Identify themes and correlations
-        themes = self._identify_themes(macro, sentiment, onchain, structure)
-        correlations = self._find_correlations(macro, sentiment, onchain, structure)
+        themes = self._identify_themes(ctx)
+        correlations = self._find_correlations(ctx)
         
         # Assess overall market conditions
-        market_conditions = self._assess_market_conditions(
-            macro, sentiment, onchain, structure
-        )
+        market_conditions = self._assess_market_conditions(ctx)
         
         # Generate educational summary
         educational_summary = self._generate_educational_summary(
             query, assets, themes, correlations
         )
         
-        return {
-            "query": query,
-            "assets_analyzed": assets,
-            "timestamp": self._get_timestamp(),
-            "market_conditions": market_conditions,
-            "macro_analysis": macro,
-            "sentiment_analysis": sentiment,
-            "onchain_analysis": onchain,
-            "market_structure_analysis": structure,
-            "key_themes": themes,
-            "correlations": correlations,
-            "educational_summary": educational_summary,
-            "risk_factors": self._identify_risk_factors(macro, sentiment, onchain, structure),
-            "disclaimer": self._get_disclaimer()
-        }
+        return AnalysisResult(
+            query=query,
+            assets_analyzed=list(assets),
+            timestamp=self._get_timestamp(),
+            market_conditions=market_conditions,
+            macro_analysis=macro,
+            sentiment_analysis=sentiment,
+            onchain_analysis=onchain,
+            market_structure_analysis=structure,
+            key_themes=themes,
+            correlations=correlations,
+            educational_summary=educational_summary,
+            risk_factors=self._identify_risk_factors(ctx),
+            research_quality=None,
+            disclaimer=_DISCLAIMER
+        )
     
-    def _identify_themes(
-        self, 
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any], 
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[str]:
+    def _identify_themes(self, ctx: AnalysisCtx) -> List[str]:
         """
         Identify recurring themes across different analyses.
         
         Args:
-            macro: Macroeconomic analysis
-            sentiment: Sentiment analysis
-            onchain: On-chain analysis
-            structure: Market structure analysis
+            ctx: Component analyses with precomputed shared lookups
             
         Returns:
             List of identified themes
         """
-        themes = []
-        
-        # Check for liquidity themes
-        if (macro.get("liquidity_tightening") or 
-            onchain.get("reduced_activity") or
-            structure.get("liquidity_conditions", {}).get("current_condition") == "tight"):
-            themes.append("Liquidity conditions affecting market activity")
-        
-        # Check for sentiment themes
-        if (sentiment.get("fear_dominance") or 
-            sentiment.get("risk_off_sentiment")):
-            themes.append("Risk aversion dominating market sentiment")
-        
-        # Check for network activity themes
-        if (onchain.get("increased_adoption") or 
-            onchain.get("network_growth")):
-            themes.append("Network fundamentals showing strength")
-        
-        # Check for macro uncertainty
-        if (macro.get("policy_uncertainty") or 
-            macro.get("economic_volatility")):
-            themes.append("Macroeconomic uncertainty influencing crypto markets")
-        
-        # Check for market structure themes
-        structure_phase = structure.get("market_phase", {}).get("current_phase")
-        if structure_phase in ["transition", "uncertain"]:
-            themes.append("Market structure in transition phase")
-        elif structure_phase in ["trend_up", "trend_down"]:
-            themes.append("Defined market structure with directional bias")
-        
-        return themes
+        return [
+            theme for predicate, theme in _THEME_RULES
+            if predicate(ctx)
+        ]
     
-    def _find_correlations(
-        self, 
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    def _find_correlations(self, ctx: AnalysisCtx) -> List[Dict[str, Any]]:
         """
         Find correlations between different analysis types.
         
         Args:
-            macro: Macroeconomic analysis
-            sentiment: Sentiment analysis
-            onchain: On-chain analysis
-            structure: Market structure analysis
+            ctx: Component analyses with precomputed shared lookups
             
         Returns:
             List of correlation observations
         """
-        correlations = []
-        
-        # Correlate macro liquidity with on-chain activity
-        if (macro.get("liquidity_conditions") == "tight" and 
-            onchain.get("transaction_volume_trend") == "decreasing"):
-            correlations.append({
-                "type": "macro_onchain",
-                "observation": "Tight macro liquidity correlates with reduced on-chain activity",
-                "strength": "moderate"
-            })
-        
-        # Correlate sentiment with market activity
-        if (sentiment.get("overall_sentiment") == "fear" and 
-            onchain.get("holder_behavior") == "accumulation"):
-            correlations.append({
-                "type": "sentiment_onchain",
-                "observation": "Fear sentiment coincides with long-term holder accumulation",
-                "strength": "moderate"
-            })
-        
-        # Correlate market structure with volatility
-        structure_phase = structure.get("market_phase", {}).get("current_phase")
-        volatility_regime = structure.get("volatility_regime", {}).get("current_regime")
-        
-        if (structure_phase == "transition" and 
-            volatility_regime in ["high", "extreme"]):
-            correlations.append({
-                "type": "structure_volatility",
-                "observation": "Market structure transition coincides with high volatility",
-                "strength": "strong"
-            })
-        
-        # Correlate macro conditions with market structure
-        if (macro.get("overall_conditions", {}).get("overall") == "challenging" and
-            structure.get("market_phase", {}).get("current_phase") == "range"):
-            correlations.append({
-                "type": "macro_structure",
-                "observation": "Challenging macro conditions coincide with range-bound structure",
-                "strength": "moderate"
-            })
-        
-        return correlations
-    
-    def _assess_market_conditions(
-        self, 
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        return [
+            dict(correlation) for predicate, correlation in _CORRELATION_RULES
+            if predicate(ctx)
+        ]
+    
+    def _assess_market_conditions(self, ctx: AnalysisCtx) -> Dict[str, Any]:
         """
         Assess overall market conditions based on all analyses.
         
         Args:
-            macro: Macroeconomic analysis
-            sentiment: Sentiment analysis
-            onchain: On-chain analysis
-            structure: Market structure analysis
+            ctx: Component analyses with precomputed shared lookups
             
         Returns:
             Market conditions assessment
         """
-        conditions = {
-            "overall_state": "neutral",
-            "key_factors": [],
-            "confidence_level": "moderate"
-        }
+        features = _condition_features(ctx)
         
-        # Determine overall state
         factors = []
+        for index, present in enumerate(features):
+            if not present:
+                continue
+            if index == _F_PHASE_TREND:
+                factors.append(f"Defined {ctx.phase.replace('_', ' ')} structure")
+            else:
+                factors.append(_FEATURE_TEXT[index])
         
-        if sentiment.get("overall_sentiment") == "fear":
-            factors.append("Negative sentiment pressure")
-        elif sentiment.get("overall_sentiment") == "greed":
-            factors.append("Positive sentiment pressure")
-        
-        if macro.get("liquidity_conditions") == "tight":
-            factors.append("Constrained macro liquidity")
-        elif macro.get("liquidity_conditions") == "ample":
-            factors.append("Supportive macro liquidity")
-        
-        if onchain.get("network_health") == "strong":
-            factors.append("Strong on-chain fundamentals")
-        elif onchain.get("network_health") == "weakening":
-            factors.append("Weakening on-chain fundamentals")
-        
-        # Add market structure factors
-        structure_phase = structure.get("market_phase", {}).get("current_phase")
-        if structure_phase in ["trend_up", "trend_down"]:
-            factors.append(f"Defined {structure_phase.replace('_', ' ')} structure")
-        elif structure_phase == "transition":
-            factors.append("Market structure in transition")
-        
-        volatility_regime = structure.get("volatility_regime", {}).get("current_regime")
-        if volatility_regime in ["high", "extreme"]:
-            factors.append("High volatility environment")
-        elif volatility_regime == "low":
-            factors.append("Low volatility environment")
-        
-        conditions["key_factors"] = factors
-        
-        # Set overall state based on balance of factors
-        positive_factors = sum(1 for f in factors if "positive" in f.lower() or "strong" in f.lower() or "supportive" in f.lower() or "trend_up" in f.lower())
-        negative_factors = sum(1 for f in factors if "negative" in f.lower() or "weakening" in f.lower() or "constrained" in f.lower() or "trend_down" in f.lower())
-        
-        if positive_factors > negative_factors:
-            conditions["overall_state"] = "positive"
-        elif negative_factors > positive_factors:
-            conditions["overall_state"] = "negative"
-        else:
-            conditions["overall_state"] = "neutral"
+        # Set overall state based on balance of supportive vs adverse factors
+        _, _, state = _score_features(features)
         
-        return conditions
+        return {
+            "overall_state": _OVERALL_STATES[state],
+            "key_factors": factors,
+            "confidence_level": "moderate"
+        }
     
     def _generate_educational_summary(
         self, 
         query: str,
-        assets: List[str],
+        assets: Sequence[str],
         themes: List[str],
         correlations: List[Dict[str, Any]]
     ) -> str:
@@ -367,84 +965,41 @@ class MacroChainAnalyzer:
         Returns:
             Educational summary string
         """
-        summary_parts = [
-            f"Analysis of {', '.join(assets)} based on your query about {query}.",
-            ""
-        ]
-        
-        if themes:
-            summary_parts.append("Key market themes identified:")
-            for theme in themes:
-                summary_parts.append(f"- {theme}")
-            summary_parts.append("")
+        themes_block = (
+            "Key market themes identified:\n"
+            + "".join(f"- {theme}\n" for theme in themes)
+            + "\n"
+        ) if themes else ""
         
-        if correlations:
-            summary_parts.append("Notable market correlations:")
-            for corr in correlations:
-                summary_parts.append(f"- {corr['observation']}")
-            summary_parts.append("")
+        correlations_block = (
+            "Notable market correlations:\n"
+            + "".join(f"- {corr['observation']}\n" for corr in correlations)
+            + "\n"
+        ) if correlations else ""
         
-        summary_parts.extend([
-            "This analysis illustrates how different factors interact in cryptocurrency markets.",
-            "Understanding these relationships can help in developing market awareness,",
-            "though it's important to remember that markets remain inherently unpredictable.",
-            ""
-        ])
-        
-        return "\n".join(summary_parts)
+        return (
+            f"Analysis of {', '.join(assets)} based on your query about {query}.\n\n"
+            f"{themes_block}{correlations_block}{_SUMMARY_CLOSING}"
+        )
     
-    def _identify_risk_factors(
-        self, 
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[str]:
+    def _identify_risk_factors(self, ctx: AnalysisCtx) -> List[str]:
         """
         Identify key risk factors from the analysis.
         
         Args:
-            macro: Macroeconomic analysis
-            sentiment: Sentiment analysis
-            onchain: On-chain analysis
-            structure: Market structure analysis
+            ctx: Component analyses with precomputed shared lookups
             
         Returns:
             List of risk factors
         """
-        risks = []
-        
-        if macro.get("policy_uncertainty"):
-            risks.append("Regulatory and policy uncertainty")
-        
-        if sentiment.get("extreme_sentiment"):
-            risks.append("Extreme market sentiment may indicate volatility")
-        
-        if onchain.get("concentration_risk"):
-            risks.append("High concentration of holdings")
-        
-        if macro.get("liquidity_conditions") == "tight":
-            risks.append("Reduced market liquidity")
-        
-        # Add market structure risks
-        structure_phase = structure.get("market_phase", {}).get("current_phase")
-        if structure_phase == "transition":
-            risks.append("Market structure transition increases uncertainty")
-        
-        volatility_regime = structure.get("volatility_regime", {}).get("current_regime")
-        if volatility_regime in ["high", "extreme"]:
-            risks.append("High volatility environment increases risk")
-        
-        liquidity_condition = structure.get("liquidity_conditions", {}).get("current_condition")
-        if liquidity_condition in ["tight", "very_tight"]:
-            risks.append("Tight liquidity conditions may increase execution risk")
+        risks = [risk for predicate, risk in _RISK_RULES if predicate(ctx)]
         
         # Always include general market risk
-        risks.append("General cryptocurrency market volatility")
+        risks.append(_GENERAL_RISK)
         
         return risks
     
-    def _format_pipeline_results(self, pipeline_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_pipeline_results(self, pipeline_result: Dict[str, Any]) -> AnalysisResult:
         """
         Format pipeline results for backward compatibility.
         
@@ -452,56 +1007,43 @@ class MacroChainAnalyzer:
             pipeline_result: Results from research pipeline
             
         Returns:
-            Formatted results compatible with existing API
+            Analysis result compatible with the existing API shape
         """
-        research_findings = pipeline_result.get("research_findings", {})
-        phase_results = pipeline_result.get("phase_results", {})
+        meta = pipeline_result["research_metadata"]
+        research_findings = pipeline_result.get("research_findings") or _EMPTY
+        overall = research_findings.get("overall_market_state") or _EMPTY
+        phase_results = pipeline_result.get("phase_results") or _EMPTY
+        correlations = research_findings.get("cross_phase_correlations") or ()
         
-        # Extract individual phase results
-        macro_analysis = phase_results.get("macro", {})
-        sentiment_analysis = phase_results.get("sentiment", {})
-        onchain_analysis = phase_results.get("onchain", {})
-        structure_analysis = phase_results.get("market_structure", {})
-        
-        return {
-            "query": pipeline_result["research_metadata"]["query"],
-            "assets_analyzed": pipeline_result["research_metadata"]["assets_analyzed"],
-            "timestamp": pipeline_result["research_metadata"]["timestamp"],
-            "market_conditions": {
-                "overall_state": research_findings.get("overall_market_state", {}).get("overall_state", "neutral"),
-                "key_factors": research_findings.get("overall_market_state", {}).get("dominant_factors", []),
+        return AnalysisResult(
+            query=meta["query"],
+            assets_analyzed=meta["assets_analyzed"],
+            timestamp=meta["timestamp"],
+            market_conditions={
+                "overall_state": overall.get("overall_state", "neutral"),
+                "key_factors": overall.get("dominant_factors", []),
                 "confidence_level": research_findings.get("confidence_level", "moderate")
             },
-            "macro_analysis": macro_analysis,
-            "sentiment_analysis": sentiment_analysis,
-            "onchain_analysis": onchain_analysis,
-            "market_structure_analysis": structure_analysis,
-            "key_themes": [corr.get("observation", "") for corr in research_findings.get("cross_phase_correlations", [])],
-            "correlations": research_findings.get("cross_phase_correlations", []),
-            "educational_summary": f"Comprehensive research analysis completed with {research_findings.get('total_insights', 0)} insights identified.",
-            "risk_factors": pipeline_result.get("limitations", []),
-            "research_quality": research_findings.get("research_quality", {}),
-            "disclaimer": pipeline_result.get("disclaimer", self._get_disclaimer())
-        }
+            macro_analysis=phase_results.get("macro", {}),
+            sentiment_analysis=phase_results.get("sentiment", {}),
+            onchain_analysis=phase_results.get("onchain", {}),
+            market_structure_analysis=phase_results.get("market_structure", {}),
+            key_themes=[corr.get("observation", "") for corr in correlations],
+            correlations=correlations,
+            educational_summary=f"Comprehensive research analysis completed with {research_findings.get('total_insights', 0)} insights identified.",
+            risk_factors=pipeline_result.get("limitations", []),
+            research_quality=research_findings.get("research_quality", {}),
+            disclaimer=pipeline_result.get("disclaimer", _DISCLAIMER)
+        )
     
     def _get_timestamp(self) -> str:
         """Get current timestamp for analysis."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
-    
-    def _get_disclaimer(self) -> str:
-        """Get standard disclaimer for analysis."""
-        return (
-            "This analysis is for educational purposes only and does not constitute "
-            "financial advice. Cryptocurrency markets are highly volatile and risky. "
-            "Always conduct your own research and consult with qualified financial "
-            "professionals before making any investment decisions."
-        )
+        return utc_timestamp()
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
         """Generate error response."""
         return {
             "error": True,
             "message": f"Analysis failed: {error_message}",
-            "disclaimer": self._get_disclaimer()
+            "disclaimer": _DISCLAIMER
         }
@@ -0,0 +1,30 @@
+"""
+Timestamps for MacroChain AI.
+
+Analysis results, research reports and API responses all stamp the current
+time through utc_timestamp, so they share a single format.
+"""
+
+from datetime import datetime, timezone
+from typing import Tuple
+import time
+
+
+# Last formatted timestamp and the wall-clock second it describes; calls
+# within the same second share one string instead of formatting their own
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO-8601 with second precision and a Z suffix.
+
+    Returns:
+        Timestamp such as ``2024-01-31T12:00:00Z``, formatted at most once
+        per second
+    """
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return _last_timestamp[1]
@@ -0,0 +1,137 @@
+"""
+In-flight call coalescing for MacroChain AI.
+
+This module collapses concurrent calls that share a key into a single
+execution, so identical work requested at the same time is done once.
+"""
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import threading
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The event loop running in this thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class Coalescer:
+    """
+    Deduplicate concurrent calls by key (the "single-flight" pattern).
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for and share its outcome. Threads and coroutines
+    share the same in-flight calls, so a coroutine can join a call a thread
+    started and vice versa. Nothing is kept once the call completes, so this
+    is not a cache.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        # key -> (outcome, event loop running the call's task; None for a thread)
+        self._inflight: Dict[Hashable, Tuple["Future[Any]", Optional[asyncio.AbstractEventLoop]]] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, bool]:
+        """
+        Run fn for key, or wait for the call already running for it.
+
+        Args:
+            key: Identity of the work being requested
+            fn: Function to run if no call for key is in flight
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Tuple of (result, shared); shared is True when the result came
+            from another caller's execution and may be aliased
+
+        Raises:
+            Whatever fn raised, for the leader and every waiting caller
+        """
+        outcome, owner, leader = self._join(key, None)
+        if not leader:
+            if owner is not None and owner is _running_loop():
+                # Blocking here would stall the loop the in-flight call needs
+                return fn(*args, **kwargs), False
+            return outcome.result(), True
+
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as e:
+            self._retire(key)
+            outcome.set_exception(e)
+            raise
+        self._retire(key)
+        outcome.set_result(value)
+        return value, False
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Tuple[Any, bool]:
+        """
+        Await fn for key, or wait for the call already running for it.
+
+        The leader's coroutine runs as its own task, so cancelling a caller,
+        the leader included, only stops that caller waiting; the call still
+        completes for everyone else.
+
+        Args:
+            key: Identity of the work being requested
+            fn: Coroutine function to run if no call for key is in flight
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Tuple of (result, shared), as for do
+
+        Raises:
+            Whatever fn raised, for the leader and every waiting caller
+        """
+        loop = asyncio.get_running_loop()
+        outcome, _, leader = self._join(key, loop)
+        if leader:
+            task = loop.create_task(fn(*args, **kwargs))
+            task.add_done_callback(lambda done: self._settle(key, outcome, done))
+        value = await asyncio.shield(asyncio.wrap_future(outcome))
+        return value, not leader
+
+    def inflight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._inflight)
+
+    def _join(
+        self, key: Hashable, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> Tuple["Future[Any]", Optional[asyncio.AbstractEventLoop], bool]:
+        """Return key's in-flight call as (outcome, owner loop, False), or register a new one and return True."""
+        with self._lock:
+            call = self._inflight.get(key)
+            if call is not None:
+                return call[0], call[1], False
+            outcome: "Future[Any]" = Future()
+            outcome.set_running_or_notify_cancel()  # Waiters cannot cancel it for everyone
+            self._inflight[key] = (outcome, loop)
+            return outcome, loop, True
+
+    def _retire(self, key: Hashable) -> None:
+        """Stop routing new callers for key to the finished call."""
+        with self._lock:
+            del self._inflight[key]
+
+    def _settle(self, key: Hashable, outcome: "Future[Any]", task: "asyncio.Task[Any]") -> None:
+        """Hand a finished leader task's outcome to its waiting callers."""
+        self._retire(key)
+        if task.cancelled():
+            outcome.set_exception(asyncio.CancelledError())
+            return
+        # Retrieving the exception here means it is never reported as unobserved
+        error = task.exception()
+        if error is None:
+            outcome.set_result(task.result())
+        else:
+            outcome.set_exception(error)
@@ -6,13 +6,243 @@ cryptocurrency markets, including liquidity, interest rates, and global
 risk sentiment.
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, ClassVar, FrozenSet, List, Mapping, Tuple, TypedDict
 import logging
+from sys import intern
+
+from .clock import utc_timestamp
+from .readonly import freeze
 
 
 logger = logging.getLogger(__name__)
 
 
+def _interned(*texts: str) -> Tuple[str, ...]:
+    """Build a shared tuple of interned strings."""
+    return tuple(intern(text) for text in texts)
+
+
+# Status values shared by the assessment helpers, insight rules and driver
+# checks. Interned so equality with the (interned) literals they are compared
+# against resolves on identity; checks stay ``==`` for externally built input.
+_TIGHT = intern("tight")
+_AMPLE = intern("ample")
+_CHALLENGING = intern("challenging")
+_SUPPORTIVE = intern("supportive")
+_MIXED = intern("mixed")
+_RISK_OFF = intern("risk_off")
+_RISK_ON = intern("risk_on")
+_POSITIVE = intern("positive")
+
+
+@dataclass(frozen=True)
+class MacroFactor:
+    """A single macro factor reading with its educational context."""
+    __slots__ = ("name", "indicator", "reading", "impact", "explanation")
+    name: str
+    indicator: str  # Result key for the reading, e.g. "status" or "trend"
+    reading: str
+    impact: str
+    explanation: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to the result's JSON shape."""
+        return {
+            self.indicator: self.reading,
+            "impact": self.impact,
+            "explanation": self.explanation
+        }
+
+
+class MacroAnalysisResult(TypedDict):
+    """Shape of a successful MacroAnalyzer.analyze() result."""
+    analysis_type: str
+    liquidity_conditions: Mapping[str, Any]
+    interest_rate_environment: Mapping[str, Any]
+    global_risk_sentiment: Mapping[str, Any]
+    regulatory_environment: Mapping[str, Any]
+    overall_conditions: Mapping[str, Any]
+    insights: Tuple[str, ...]
+    educational_notes: Tuple[str, ...]
+    timestamp: str
+
+
+def _factor_view(factors: Tuple[MacroFactor, ...]) -> Mapping[str, Any]:
+    """Frozen {name: reading/impact/explanation} view of a factor table."""
+    return freeze({factor.name: factor.to_dict() for factor in factors})
+
+
+# Static factor tables (educational placeholders). Built once at import;
+# helpers read the dataclasses, results carry the frozen JSON-shaped views.
+_LIQUIDITY_FACTORS: Tuple[MacroFactor, ...] = (
+    MacroFactor(
+        name="central_bank_policies",
+        indicator="status",
+        reading="accommodative",  # Educational placeholder
+        impact="Central bank balance sheets affect global liquidity",
+        explanation="When central banks expand balance sheets through quantitative easing, it typically increases available liquidity that can flow into various asset classes, including cryptocurrencies."
+    ),
+    MacroFactor(
+        name="dollar_strength",
+        indicator="status",
+        reading="neutral",
+        impact="Strong dollar can pressure crypto prices",
+        explanation="A stronger US dollar typically makes dollar-denominated assets more expensive for international investors, potentially reducing demand for cryptocurrencies."
+    ),
+    MacroFactor(
+        name="credit_conditions",
+        indicator="status",
+        reading="moderate",
+        impact="Credit availability influences risk asset demand",
+        explanation="Loose credit conditions often correlate with higher demand for risk assets like cryptocurrencies, while tight credit conditions can reduce investment flows."
+    )
+)
+
+_RATE_FACTORS: Tuple[MacroFactor, ...] = (
+    MacroFactor(
+        name="policy_rates",
+        indicator="current_trend",
+        reading="stable",  # Educational placeholder
+        impact="Higher rates can reduce demand for risk assets",
+        explanation="When interest rates rise, traditional savings become more attractive, potentially reducing the relative appeal of cryptocurrencies as alternative investments."
+    ),
+    MacroFactor(
+        name="real_rates",
+        indicator="status",
+        reading="negative_to_neutral",
+        impact="Negative real rates historically support crypto",
+        explanation="When inflation exceeds nominal interest rates, investors may seek assets like cryptocurrencies that can potentially preserve purchasing power."
+    ),
+    MacroFactor(
+        name="yield_curve",
+        indicator="shape",
+        reading="normal",
+        impact="Yield curve shape indicates economic expectations",
+        explanation="The yield curve reflects market expectations about future economic conditions and can influence risk appetite across all asset classes."
+    )
+)
+
+_RISK_SENTIMENT_INDICATORS: Tuple[MacroFactor, ...] = (
+    MacroFactor(
+        name="equity_markets",
+        indicator="trend",
+        reading="cautious",
+        impact="Equity performance often correlates with crypto",
+        explanation="Cryptocurrencies, particularly Bitcoin, have shown increasing correlation with broader risk assets, especially during periods of market stress."
+    ),
+    MacroFactor(
+        name="volatility_indices",
+        indicator="level",
+        reading="moderate",
+        impact="Higher volatility indicates increased fear",
+        explanation="Traditional volatility indices like the VIX can serve as proxies for overall market risk appetite, which often extends to cryptocurrency markets."
+    ),
+    MacroFactor(
+        name="safe_haven_demand",
+        indicator="status",
+        reading="balanced",
+        impact="Safe haven demand affects risk asset flows",
+        explanation="During periods of heightened uncertainty, investors may rotate between safe havens and risk assets, impacting cryptocurrency demand patterns."
+    )
+)
+
+_REGULATORY_FACTORS: Tuple[MacroFactor, ...] = (
+    MacroFactor(
+        name="major_jurisdictions",
+        indicator="trend",
+        reading="clarification_increasing",
+        impact="Regulatory clarity can support institutional adoption",
+        explanation="Clear regulatory frameworks reduce uncertainty for institutional investors and can support market development."
+    ),
+    MacroFactor(
+        name="compliance_requirements",
+        indicator="status",
+        reading="evolving",
+        impact="Compliance costs affect market participants",
+        explanation="Increasing compliance requirements can impact operational costs for crypto businesses and influence market structure."
+    ),
+    MacroFactor(
+        name="international_coordination",
+        indicator="level",
+        reading="improving",
+        impact="Coordinated approaches reduce regulatory arbitrage",
+        explanation="Better international coordination on crypto regulation can create more consistent global market conditions."
+    )
+)
+
+# JSON-shaped views of the factor tables, as emitted in results
+_LIQUIDITY_FACTORS_VIEW = _factor_view(_LIQUIDITY_FACTORS)
+_RATE_FACTORS_VIEW = _factor_view(_RATE_FACTORS)
+_RISK_SENTIMENT_INDICATORS_VIEW = _factor_view(_RISK_SENTIMENT_INDICATORS)
+_REGULATORY_FACTORS_VIEW = _factor_view(_REGULATORY_FACTORS)
+
+
+# Insight rules, one per section in (liquidity, rates, sentiment, regulatory)
+# order: (status extractor, {status: insight})
+_INSIGHT_RULES = (
+    (lambda liquidity: liquidity["overall_status"], {
+        _TIGHT: "Tight liquidity conditions may constrain crypto market growth",
+        _AMPLE: "Supportive liquidity environment could benefit crypto markets"
+    }),
+    (lambda rates: rates["implications"]["overall"], {
+        _CHALLENGING: "Current interest rate environment presents headwinds for risk assets",
+        _SUPPORTIVE: "Interest rate conditions appear supportive for crypto markets"
+    }),
+    (lambda sentiment: sentiment["overall_sentiment"]["status"], {
+        _RISK_OFF: "Risk-off sentiment may pressure crypto prices in short term",
+        _RISK_ON: "Risk-on environment could support crypto market performance"
+    }),
+    (lambda regulatory: regulatory["outlook"]["trend"], {
+        _POSITIVE: "Evolving regulatory clarity may support institutional adoption"
+    }),
+)
+
+
+# Overall macro assessment indexed by number of adverse drivers (capped at 2)
+_OVERALL_BY_DRIVER_COUNT = (_SUPPORTIVE, _MIXED, _CHALLENGING)
+
+# Static text sections, shared by every result (and the error response)
+_LIQUIDITY_OBSERVATIONS: Tuple[str, ...] = _interned(
+    "Global liquidity remains a key driver of crypto market cycles",
+    "Liquidity changes often precede price movements in crypto markets",
+    "Cross-asset liquidity correlations are important to monitor"
+)
+
+_RATE_CONTEXT: Tuple[str, ...] = _interned(
+    "Interest rates are a fundamental driver of asset allocation decisions",
+    "Cryptocurrencies often behave like high-duration assets in rate environments",
+    "Rate expectations can be more important than current rates"
+)
+
+_RISK_SENTIMENT_INSIGHTS: Tuple[str, ...] = _interned(
+    "Risk sentiment is a major driver of short-term crypto price movements",
+    "Cryptocurrency's role as risk asset vs safe haven continues to evolve",
+    "Global risk flows increasingly interconnected across asset classes"
+)
+
+_REGULATORY_FOCUS_AREAS: Tuple[str, ...] = _interned(
+    "Institutional adoption frameworks",
+    "Consumer protection measures",
+    "Market structure regulations",
+    "Cross-border coordination"
+)
+
+_RATE_CONSIDERATIONS: Tuple[str, ...] = _interned(
+    "Rate expectations matter more than current rates",
+    "Real rates impact investment decisions",
+    "Policy divergence creates complexity"
+)
+
+_EDUCATIONAL_NOTES: Tuple[str, ...] = _interned(
+    "Macroeconomic factors provide context for cryptocurrency market movements",
+    "Traditional market relationships with crypto are evolving over time",
+    "Global liquidity cycles often correlate with crypto market cycles",
+    "Interest rate environments influence relative attractiveness of different assets",
+    "Regulatory development is a key factor in long-term market maturation"
+)
+
+
 class MacroAnalyzer:
     """
     Analyzes macroeconomic factors affecting cryptocurrency markets.
@@ -21,18 +251,32 @@ class MacroAnalyzer:
     indicators and policies influence cryptocurrency market dynamics.
     """
     
+    # Indicators covered by the analysis, in presentation order, plus a set
+    # for O(1) membership checks
+    MACRO_INDICATORS_ORDER: ClassVar[Tuple[str, ...]] = (
+        "interest_rates",
+        "inflation",
+        "liquidity_conditions",
+        "economic_growth",
+        "risk_sentiment",
+        "regulatory_environment"
+    )
+    MACRO_INDICATORS: ClassVar[FrozenSet[str]] = frozenset(MACRO_INDICATORS_ORDER)
+    
+    __slots__ = ("_static_payload",)
+    
     def __init__(self):
         """Initialize the macro analyzer."""
-        self.macro_indicators = [
-            "interest_rates",
-            "inflation", 
-            "liquidity_conditions",
-            "economic_growth",
-            "risk_sentiment",
-            "regulatory_environment"
-        ]
+        # The analysis does not depend on query or assets yet, so the whole
+        # result (minus timestamp) is assembled once per analyzer
+        self._static_payload = freeze(self._build_payload())
+    
+    @property
+    def macro_indicators(self) -> Tuple[str, ...]:
+        """Indicators covered by the analysis (kept for backward compatibility)."""
+        return self.MACRO_INDICATORS_ORDER
     
-    def analyze(self, query: str, assets: List[str] = None) -> Dict[str, Any]:
+    def analyze(self, query: str, assets: List[str] = None) -> MacroAnalysisResult:
         """
         Perform macroeconomic analysis based on the query.
         
@@ -41,50 +285,58 @@ class MacroAnalyzer:
             assets: List of assets to focus on (optional)
             
         Returns:
-            Dictionary containing macroeconomic analysis results
+            Dictionary containing macroeconomic analysis results; nested
+            sections are shared read-only mappings (copy.deepcopy the result
+            for a mutable copy)
         """
-        try:
-            logger.info(f"Starting macro analysis for query: {query}")
-            
-            # Analyze different macro factors
-            liquidity_analysis = self._analyze_liquidity_conditions()
-            interest_rate_analysis = self._analyze_interest_rate_environment()
-            risk_sentiment_analysis = self._analyze_global_risk_sentiment()
-            regulatory_analysis = self._analyze_regulatory_environment()
-            
-            # Generate insights
-            insights = self._generate_macro_insights(
-                liquidity_analysis,
-                interest_rate_analysis,
-                risk_sentiment_analysis,
-                regulatory_analysis
-            )
-            
-            # Assess overall macro conditions
-            macro_conditions = self._assess_macro_conditions(
-                liquidity_analysis,
-                interest_rate_analysis,
-                risk_sentiment_analysis
-            )
-            
-            result = {
-                "analysis_type": "macroeconomic",
-                "liquidity_conditions": liquidity_analysis,
-                "interest_rate_environment": interest_rate_analysis,
-                "global_risk_sentiment": risk_sentiment_analysis,
-                "regulatory_environment": regulatory_analysis,
-                "overall_conditions": macro_conditions,
-                "insights": insights,
-                "educational_notes": self._get_educational_notes(),
-                "timestamp": self._get_timestamp()
-            }
-            
-            logger.info("Macro analysis completed successfully")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error in macro analysis: {str(e)}")
-            return self._error_response(str(e))
+        logger.info("Starting macro analysis for query: %s", query)
+        
+        # Nothing here can fail: the payload was built (and validated) in __init__
+        result = {**self._static_payload, "timestamp": self._get_timestamp()}
+        
+        logger.info("Macro analysis completed successfully")
+        return result
+    
+    def _build_payload(self) -> Dict[str, Any]:
+        """
+        Build the deterministic part of a macro analysis result.
+        
+        The payload is frozen and shared by every analyze() call.
+        
+        Returns:
+            Macro analysis result without the timestamp
+        """
+        # Analyze different macro factors
+        liquidity_analysis = self._analyze_liquidity_conditions()
+        interest_rate_analysis = self._analyze_interest_rate_environment()
+        risk_sentiment_analysis = self._analyze_global_risk_sentiment()
+        regulatory_analysis = self._analyze_regulatory_environment()
+        
+        # Generate insights
+        insights = self._generate_macro_insights(
+            liquidity_analysis,
+            interest_rate_analysis,
+            risk_sentiment_analysis,
+            regulatory_analysis
+        )
+        
+        # Assess overall macro conditions
+        macro_conditions = self._assess_macro_conditions(
+            liquidity_analysis,
+            interest_rate_analysis,
+            risk_sentiment_analysis
+        )
+        
+        return {
+            "analysis_type": "macroeconomic",
+            "liquidity_conditions": liquidity_analysis,
+            "interest_rate_environment": interest_rate_analysis,
+            "global_risk_sentiment": risk_sentiment_analysis,
+            "regulatory_environment": regulatory_analysis,
+            "overall_conditions": macro_conditions,
+            "insights": insights,
+            "educational_notes": self._get_educational_notes()
+        }
     
     def _analyze_liquidity_conditions(self) -> Dict[str, Any]:
         """
@@ -93,36 +345,13 @@ class MacroAnalyzer:
         Returns:
             Dictionary with liquidity analysis
         """
-        # Educational analysis of liquidity factors
-        liquidity_factors = {
-            "central_bank_policies": {
-                "status": "accommodative",  # Educational placeholder
-                "impact": "Central bank balance sheets affect global liquidity",
-                "explanation": "When central banks expand balance sheets through quantitative easing, it typically increases available liquidity that can flow into various asset classes, including cryptocurrencies."
-            },
-            "dollar_strength": {
-                "status": "neutral",
-                "impact": "Strong dollar can pressure crypto prices",
-                "explanation": "A stronger US dollar typically makes dollar-denominated assets more expensive for international investors, potentially reducing demand for cryptocurrencies."
-            },
-            "credit_conditions": {
-                "status": "moderate",
-                "impact": "Credit availability influences risk asset demand",
-                "explanation": "Loose credit conditions often correlate with higher demand for risk assets like cryptocurrencies, while tight credit conditions can reduce investment flows."
-            }
-        }
-        
-        overall_liquidity = self._assess_overall_liquidity(liquidity_factors)
+        overall_liquidity = self._assess_overall_liquidity(_LIQUIDITY_FACTORS)
         
         return {
-            "factors": liquidity_factors,
+            "factors": _LIQUIDITY_FACTORS_VIEW,
             "overall_status": overall_liquidity,
             "trend": "stable",  # Educational placeholder
-            "key_observations": [
-                "Global liquidity remains a key driver of crypto market cycles",
-                "Liquidity changes often precede price movements in crypto markets",
-                "Cross-asset liquidity correlations are important to monitor"
-            ]
+            "key_observations": _LIQUIDITY_OBSERVATIONS
         }
     
     def _analyze_interest_rate_environment(self) -> Dict[str, Any]:
@@ -132,35 +361,13 @@ class MacroAnalyzer:
         Returns:
             Dictionary with interest rate analysis
         """
-        rate_factors = {
-            "policy_rates": {
-                "current_trend": "stable",  # Educational placeholder
-                "impact": "Higher rates can reduce demand for risk assets",
-                "explanation": "When interest rates rise, traditional savings become more attractive, potentially reducing the relative appeal of cryptocurrencies as alternative investments."
-            },
-            "real_rates": {
-                "status": "negative_to_neutral",
-                "impact": "Negative real rates historically support crypto",
-                "explanation": "When inflation exceeds nominal interest rates, investors may seek assets like cryptocurrencies that can potentially preserve purchasing power."
-            },
-            "yield_curve": {
-                "shape": "normal",
-                "impact": "Yield curve shape indicates economic expectations",
-                "explanation": "The yield curve reflects market expectations about future economic conditions and can influence risk appetite across all asset classes."
-            }
-        }
-        
-        rate_implications = self._assess_rate_implications(rate_factors)
+        rate_implications = self._assess_rate_implications(_RATE_FACTORS)
         
         return {
-            "factors": rate_factors,
+            "factors": _RATE_FACTORS_VIEW,
             "implications": rate_implications,
             "trend": "monitoring",
-            "educational_context": [
-                "Interest rates are a fundamental driver of asset allocation decisions",
-                "Cryptocurrencies often behave like high-duration assets in rate environments",
-                "Rate expectations can be more important than current rates"
-            ]
+            "educational_context": _RATE_CONTEXT
         }
     
     def _analyze_global_risk_sentiment(self) -> Dict[str, Any]:
@@ -170,35 +377,13 @@ class MacroAnalyzer:
         Returns:
             Dictionary with risk sentiment analysis
         """
-        sentiment_indicators = {
-            "equity_markets": {
-                "trend": "cautious",
-                "impact": "Equity performance often correlates with crypto",
-                "explanation": "Cryptocurrencies, particularly Bitcoin, have shown increasing correlation with broader risk assets, especially during periods of market stress."
-            },
-            "volatility_indices": {
-                "level": "moderate",
-                "impact": "Higher volatility indicates increased fear",
-                "explanation": "Traditional volatility indices like the VIX can serve as proxies for overall market risk appetite, which often extends to cryptocurrency markets."
-            },
-            "safe_haven_demand": {
-                "status": "balanced",
-                "impact": "Safe haven demand affects risk asset flows",
-                "explanation": "During periods of heightened uncertainty, investors may rotate between safe havens and risk assets, impacting cryptocurrency demand patterns."
-            }
-        }
-        
-        overall_sentiment = self._assess_overall_sentiment(sentiment_indicators)
+        overall_sentiment = self._assess_overall_sentiment(_RISK_SENTIMENT_INDICATORS)
         
         return {
-            "indicators": sentiment_indicators,
+            "indicators": _RISK_SENTIMENT_INDICATORS_VIEW,
             "overall_sentiment": overall_sentiment,
             "risk_appetite": "moderate",
-            "key_insights": [
-                "Risk sentiment is a major driver of short-term crypto price movements",
-                "Cryptocurrency's role as risk asset vs safe haven continues to evolve",
-                "Global risk flows increasingly interconnected across asset classes"
-            ]
+            "key_insights": _RISK_SENTIMENT_INSIGHTS
         }
     
     def _analyze_regulatory_environment(self) -> Dict[str, Any]:
@@ -208,35 +393,12 @@ class MacroAnalyzer:
         Returns:
             Dictionary with regulatory analysis
         """
-        regulatory_factors = {
-            "major_jurisdictions": {
-                "trend": "clarification_increasing",
-                "impact": "Regulatory clarity can support institutional adoption",
-                "explanation": "Clear regulatory frameworks reduce uncertainty for institutional investors and can support market development."
-            },
-            "compliance_requirements": {
-                "status": "evolving",
-                "impact": "Compliance costs affect market participants",
-                "explanation": "Increasing compliance requirements can impact operational costs for crypto businesses and influence market structure."
-            },
-            "international_coordination": {
-                "level": "improving",
-                "impact": "Coordinated approaches reduce regulatory arbitrage",
-                "explanation": "Better international coordination on crypto regulation can create more consistent global market conditions."
-            }
-        }
-        
-        regulatory_outlook = self._assess_regulatory_outlook(regulatory_factors)
+        regulatory_outlook = self._assess_regulatory_outlook(_REGULATORY_FACTORS)
         
         return {
-            "factors": regulatory_factors,
+            "factors": _REGULATORY_FACTORS_VIEW,
             "outlook": regulatory_outlook,
-            "focus_areas": [
-                "Institutional adoption frameworks",
-                "Consumer protection measures",
-                "Market structure regulations",
-                "Cross-border coordination"
-            ]
+            "focus_areas": _REGULATORY_FOCUS_AREAS
         }
     
     def _generate_macro_insights(
@@ -259,28 +421,10 @@ class MacroAnalyzer:
             List of key insights
         """
         insights = []
-        
-        # Liquidity insights
-        if liquidity["overall_status"] == "tight":
-            insights.append("Tight liquidity conditions may constrain crypto market growth")
-        elif liquidity["overall_status"] == "ample":
-            insights.append("Supportive liquidity environment could benefit crypto markets")
-        
-        # Rate insights
-        if rates["implications"]["overall"] == "challenging":
-            insights.append("Current interest rate environment presents headwinds for risk assets")
-        elif rates["implications"]["overall"] == "supportive":
-            insights.append("Interest rate conditions appear supportive for crypto markets")
-        
-        # Sentiment insights
-        if sentiment["overall_sentiment"]["status"] == "risk_off":
-            insights.append("Risk-off sentiment may pressure crypto prices in short term")
-        elif sentiment["overall_sentiment"]["status"] == "risk_on":
-            insights.append("Risk-on environment could support crypto market performance")
-        
-        # Regulatory insights
-        if regulatory["outlook"]["trend"] == "positive":
-            insights.append("Evolving regulatory clarity may support institutional adoption")
+        for (extract, table), section in zip(_INSIGHT_RULES, (liquidity, rates, sentiment, regulatory)):
+            insight = table.get(extract(section))
+            if insight is not None:
+                insights.append(insight)
         
         return insights
     
@@ -301,49 +445,31 @@ class MacroAnalyzer:
         Returns:
             Overall macro conditions assessment
         """
-        conditions = {
-            "overall": "neutral",
-            "key_drivers": [],
+        drivers = [driver for present, driver in (
+            (liquidity["overall_status"] == _TIGHT, "Liquidity constraints"),
+            (rates["implications"]["overall"] == _CHALLENGING, "Unfavorable rate environment"),
+            (sentiment["overall_sentiment"]["status"] == _RISK_OFF, "Risk aversion"),
+        ) if present]
+        
+        return {
+            "overall": _OVERALL_BY_DRIVER_COUNT[min(len(drivers), 2)],
+            "key_drivers": drivers,
             "outlook": "uncertain"
         }
-        
-        # Determine key drivers
-        if liquidity["overall_status"] == "tight":
-            conditions["key_drivers"].append("Liquidity constraints")
-        
-        if rates["implications"]["overall"] == "challenging":
-            conditions["key_drivers"].append("Unfavorable rate environment")
-        
-        if sentiment["overall_sentiment"]["status"] == "risk_off":
-            conditions["key_drivers"].append("Risk aversion")
-        
-        # Set overall assessment
-        if len(conditions["key_drivers"]) >= 2:
-            conditions["overall"] = "challenging"
-        elif len(conditions["key_drivers"]) == 1:
-            conditions["overall"] = "mixed"
-        else:
-            conditions["overall"] = "supportive"
-        
-        return conditions
     
-    def _assess_overall_liquidity(self, factors: Dict[str, Any]) -> str:
+    def _assess_overall_liquidity(self, factors: Tuple[MacroFactor, ...]) -> str:
         """Assess overall liquidity conditions."""
         # Simplified logic for educational purposes
         return "neutral"
     
-    def _assess_rate_implications(self, factors: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_rate_implications(self, factors: Tuple[MacroFactor, ...]) -> Dict[str, Any]:
         """Assess implications of interest rate environment."""
         return {
             "overall": "neutral",
-            "key_considerations": [
-                "Rate expectations matter more than current rates",
-                "Real rates impact investment decisions",
-                "Policy divergence creates complexity"
-            ]
+            "key_considerations": _RATE_CONSIDERATIONS
         }
     
-    def _assess_overall_sentiment(self, indicators: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_overall_sentiment(self, indicators: Tuple[MacroFactor, ...]) -> Dict[str, Any]:
         """Assess overall risk sentiment."""
         return {
             "status": "neutral",
@@ -351,7 +477,7 @@ class MacroAnalyzer:
             "factors": "Mixed signals across different indicators"
         }
     
-    def _assess_regulatory_outlook(self, factors: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_regulatory_outlook(self, factors: Tuple[MacroFactor, ...]) -> Dict[str, Any]:
         """Assess regulatory outlook."""
         return {
             "trend": "neutral",
@@ -359,25 +485,18 @@ class MacroAnalyzer:
             "key_developments": "Continued framework development"
         }
     
-    def _get_educational_notes(self) -> List[str]:
-        """Get educational notes about macro analysis."""
-        return [
-            "Macroeconomic factors provide context for cryptocurrency market movements",
-            "Traditional market relationships with crypto are evolving over time",
-            "Global liquidity cycles often correlate with crypto market cycles",
-            "Interest rate environments influence relative attractiveness of different assets",
-            "Regulatory development is a key factor in long-term market maturation"
-        ]
+    def _get_educational_notes(self) -> Tuple[str, ...]:
+        """Get educational notes about macro analysis (shared, immutable)."""
+        return _EDUCATIONAL_NOTES
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        return utc_timestamp()
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
-        """Generate error response."""
+        """Generate error response (used by callers that run analyze() with a fallback)."""
         return {
             "error": True,
-            "message": f"Macro analysis failed: {error_message}",
-            "educational_notes": self._get_educational_notes()
+            "message": "Macro analysis failed: " + error_message,
+            "educational_notes": _EDUCATIONAL_NOTES
         }
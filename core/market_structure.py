@@ -6,16 +6,32 @@ trading signals or financial advice. Focus is on market structure,
 phase classification, and risk context.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, ClassVar, List, Mapping, Optional, Sequence, Tuple
 import logging
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
+
+from .clock import utc_timestamp
+from .readonly import freeze
 
 
 logger = logging.getLogger(__name__)
 
 
-class MarketPhase(Enum):
+class _StrEnum(str, Enum):
+    """
+    Enum whose members are plain strings.
+    
+    Members compare, hash, print and serialize as their values (like
+    ``enum.StrEnum`` on 3.11+), so they can be used directly as result
+    values and dict keys without ``.value``.
+    """
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class MarketPhase(_StrEnum):
     """Market phase classification."""
     TREND_UP = "trend_up"
     TREND_DOWN = "trend_down"
@@ -24,7 +40,7 @@ class MarketPhase(Enum):
     UNCERTAIN = "uncertain"
 
 
-class VolatilityRegime(Enum):
+class VolatilityRegime(_StrEnum):
     """Volatility regime classification."""
     LOW = "low"
     MEDIUM = "medium"
@@ -32,7 +48,7 @@ class VolatilityRegime(Enum):
     EXTREME = "extreme"
 
 
-class LiquidityCondition(Enum):
+class LiquidityCondition(_StrEnum):
     """Liquidity condition classification."""
     AMPLE = "ample"
     MODERATE = "moderate"
@@ -40,15 +56,430 @@ class LiquidityCondition(Enum):
     VERY_TIGHT = "very_tight"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MarketStructureMetrics:
     """Market structure metrics."""
+    __slots__ = (
+        "phase",
+        "volatility_regime",
+        "liquidity_condition",
+        "trend_strength",
+        "market_efficiency",
+        "structural_biases"
+    )
     phase: MarketPhase
     volatility_regime: VolatilityRegime
     liquidity_condition: LiquidityCondition
     trend_strength: str
     market_efficiency: str
-    structural_biases: List[str]
+    structural_biases: Sequence[str]
+
+
+# Static indicator readings (educational placeholders). None of them depend
+# on the query or assets, so they are built once and shared by every result.
+_PHASE_INDICATORS: Mapping[str, Any] = freeze({
+    "price_characteristics": {
+        "directional_bias": "neutral",  # Educational placeholder
+        "momentum_quality": "moderate",
+        "trend_consistency": "variable",
+        "explanation": "Price characteristics help identify whether markets are trending, ranging, or in transition."
+    },
+    "volume_patterns": {
+        "volume_trend": "stable",
+        "volume_quality": "moderate",
+        "participation_level": "moderate",
+        "explanation": "Volume analysis provides insights into market conviction and participation strength."
+    },
+    "range_boundaries": {
+        "support_resistance": "identifiable",
+        "range_width": "moderate",
+        "boundary_strength": "moderate",
+        "explanation": "Range boundaries indicate areas of buying/selling interest and potential support/resistance."
+    },
+    "transition_signals": {
+        "phase_shift_probability": "moderate",
+        "transition_clarity": "unclear",
+        "breakout_potential": "balanced",
+        "explanation": "Transition signals help identify potential phase changes in market structure."
+    }
+})
+
+_VOLATILITY_INDICATORS: Mapping[str, Any] = freeze({
+    "volatility_level": {
+        "current_regime": "medium",  # Educational placeholder
+        "historical_comparison": "near_average",
+        "trend_direction": "stable",
+        "explanation": "Volatility level indicates the magnitude of price fluctuations and market uncertainty."
+    },
+    "volatility_persistence": {
+        "autocorrelation": "moderate",
+        "regime_stability": "moderate",
+        "mean_reversion_tendency": "present",
+        "explanation": "Volatility persistence shows whether current conditions are likely to continue."
+    },
+    "volatility_skew": {
+        "asymmetry": "slight_negative",
+        "tail_risk": "moderate",
+        "distribution_shape": "near_normal",
+        "explanation": "Volatility skew reveals asymmetries in upside vs downside volatility potential."
+    },
+    "intraday_patterns": {
+        "session_consistency": "moderate",
+        "time_of_day_effects": "present",
+        "gap_behavior": "moderate",
+        "explanation": "Intraday patterns help understand volatility dynamics throughout trading sessions."
+    }
+})
+
+_LIQUIDITY_INDICATORS: Mapping[str, Any] = freeze({
+    "order_book_depth": {
+        "depth_level": "moderate",
+        "spread_tightness": "moderate",
+        "depth_distribution": "balanced",
+        "explanation": "Order book depth indicates available liquidity at different price levels."
+    },
+    "market_impact": {
+        "impact_level": "moderate",
+        "slippage_expectation": "moderate",
+        "size_capacity": "moderate",
+        "explanation": "Market impact shows how trade sizes affect prices, indicating liquidity quality."
+    },
+    "participation_diversity": {
+        "participant_types": "diverse",
+        "geographic_distribution": "global",
+        "institutional_presence": "growing",
+        "explanation": "Participation diversity affects liquidity stability and market resilience."
+    },
+    "temporal_patterns": {
+        "session_liquidity": "variable",
+        "day_of_week_effects": "present",
+        "market_hours_impact": "significant",
+        "explanation": "Temporal patterns reveal how liquidity varies across time periods."
+    }
+})
+
+_EFFICIENCY_INDICATORS: Mapping[str, Any] = freeze({
+    "information_flow": {
+        "price_discovery": "moderate",
+        "news_incorporation": "reasonable",
+        "cross_market_arbitrage": "present",
+        "explanation": "Information flow efficiency shows how quickly markets process new information."
+    },
+    "structural_biases": {
+        "seasonal_patterns": "present",
+        "day_of_week_effects": "mild",
+        "holiday_effects": "present",
+        "explanation": "Structural biases are recurring patterns that may indicate market inefficiencies."
+    },
+    "market_microstructure": {
+        "tick_size_impact": "moderate",
+        "lot_size_effects": "present",
+        "trading_frictions": "moderate",
+        "explanation": "Market microstructure affects how efficiently prices are formed and updated."
+    },
+    "behavioral_patterns": {
+        "herding_behavior": "present",
+        "overreaction_tendencies": "present",
+        "mean_reversion": "present",
+        "explanation": "Behavioral patterns can create predictable but temporary market inefficiencies."
+    }
+})
+
+# Descriptions per phase / regime / condition / efficiency level
+_PHASE_CHARACTERISTICS: Mapping[str, Any] = freeze({
+    MarketPhase.RANGE: {
+        "description": "Price moves within defined boundaries",
+        "typical_duration": "weeks to months",
+        "volatility_tendency": "moderate",
+        "breakout_potential": "present"
+    },
+    MarketPhase.TREND_UP: {
+        "description": "Sustained upward price movement",
+        "typical_duration": "months",
+        "volatility_tendency": "low_to_moderate",
+        "momentum_characteristics": "positive"
+    },
+    MarketPhase.TREND_DOWN: {
+        "description": "Sustained downward price movement",
+        "typical_duration": "months",
+        "volatility_tendency": "moderate_to_high",
+        "momentum_characteristics": "negative"
+    },
+    MarketPhase.TRANSITION: {
+        "description": "Market structure changing between phases",
+        "typical_duration": "days to weeks",
+        "volatility_tendency": "increasing",
+        "uncertainty_level": "high"
+    },
+    MarketPhase.UNCERTAIN: {
+        "description": "Clear phase classification not possible",
+        "typical_duration": "variable",
+        "volatility_tendency": "variable",
+        "clarity_level": "low"
+    }
+})
+
+_REGIME_CHARACTERISTICS: Mapping[str, Any] = freeze({
+    VolatilityRegime.LOW: {
+        "description": "Minimal price fluctuations",
+        "risk_profile": "lower",
+        "participant_impact": "favors position holders"
+    },
+    VolatilityRegime.MEDIUM: {
+        "description": "Moderate price fluctuations",
+        "risk_profile": "moderate",
+        "participant_impact": "balanced across strategies"
+    },
+    VolatilityRegime.HIGH: {
+        "description": "Significant price fluctuations",
+        "risk_profile": "higher",
+        "participant_impact": "favors short-term traders"
+    },
+    VolatilityRegime.EXTREME: {
+        "description": "Very large price fluctuations",
+        "risk_profile": "very_high",
+        "participant_impact": "creates both risks and opportunities"
+    }
+})
+
+_LIQUIDITY_CHARACTERISTICS: Mapping[str, Any] = freeze({
+    LiquidityCondition.AMPLE: {
+        "description": "Abundant liquidity across price levels",
+        "execution_impact": "minimal",
+        "cost_implications": "lower transaction costs"
+    },
+    LiquidityCondition.MODERATE: {
+        "description": "Sufficient liquidity with some limitations",
+        "execution_impact": "moderate",
+        "cost_implications": "reasonable transaction costs"
+    },
+    LiquidityCondition.TIGHT: {
+        "description": "Limited liquidity at key price levels",
+        "execution_impact": "significant",
+        "cost_implications": "higher transaction costs"
+    },
+    LiquidityCondition.VERY_TIGHT: {
+        "description": "Very limited liquidity throughout order book",
+        "execution_impact": "severe",
+        "cost_implications": "very high transaction costs"
+    }
+})
+
+_EFFICIENCY_CHARACTERISTICS: Mapping[str, Any] = freeze({
+    "high": {
+        "description": "Prices quickly reflect available information",
+        "arbitrage_opportunities": "rare",
+        "predictability": "low"
+    },
+    "moderate": {
+        "description": "Prices reasonably reflect available information",
+        "arbitrage_opportunities": "occasional",
+        "predictability": "moderate"
+    },
+    "low": {
+        "description": "Prices may not fully reflect available information",
+        "arbitrage_opportunities": "more common",
+        "predictability": "higher"
+    }
+})
+
+# Phase confidence, liquidity stability, efficiency level and structure
+# quality are not scored yet (educational placeholders)
+_PLACEHOLDER_ASSESSMENT = "moderate"
+
+# Classification tables (simplified logic for educational purposes); pairs
+# not listed fall back to MarketPhase.UNCERTAIN / LiquidityCondition.MODERATE
+
+# (price directional bias, volume quality) -> phase
+_PHASE_CLASSIFIER: Mapping[Tuple[str, str], MarketPhase] = freeze({
+    ("neutral", "moderate"): MarketPhase.RANGE,
+    ("bullish", "strong"): MarketPhase.TREND_UP,
+    ("bearish", "strong"): MarketPhase.TREND_DOWN
+})
+
+# (order book depth level, market impact level) -> condition
+_LIQUIDITY_CLASSIFIER: Mapping[Tuple[str, str], LiquidityCondition] = freeze({
+    ("high", "low"): LiquidityCondition.AMPLE,
+    ("low", "high"): LiquidityCondition.TIGHT
+})
+
+# Insight rules, one per section in (phase, volatility, liquidity, efficiency)
+# order: (classification key, {classification: insight})
+_TRENDING_INSIGHT = "Trending market structure indicates directional momentum"
+
+_INSIGHT_RULES = (
+    ("current_phase", {
+        MarketPhase.RANGE: "Range-bound market structure suggests defined support/resistance levels",
+        MarketPhase.TREND_UP: _TRENDING_INSIGHT,
+        MarketPhase.TREND_DOWN: _TRENDING_INSIGHT,
+        MarketPhase.TRANSITION: "Transition phase suggests potential structural changes ahead"
+    }),
+    ("current_regime", {
+        VolatilityRegime.HIGH: "High volatility regime suggests increased uncertainty and risk",
+        VolatilityRegime.LOW: "Low volatility regime may indicate market complacency or consolidation"
+    }),
+    ("current_condition", {
+        LiquidityCondition.TIGHT: "Tight liquidity conditions may increase execution costs and market impact",
+        LiquidityCondition.AMPLE: "Ample liquidity conditions support efficient price discovery"
+    }),
+    ("efficiency_level", {
+        "low": "Lower market efficiency may create temporary structural opportunities",
+        "high": "Higher market efficiency suggests prices quickly reflect available information"
+    }),
+)
+
+# Assets analyzed when the caller does not name any
+_DEFAULT_ASSETS: Tuple[str, ...] = ("bitcoin", "ethereum")
+
+# Static text sections, shared by every result (and the error response)
+_EDUCATIONAL_CONTEXT: Tuple[str, ...] = (
+    "Market structure analysis provides context for price movements",
+    "Understanding structure helps assess risk and opportunity",
+    "Structure analysis complements other forms of market analysis",
+    "Market structure is dynamic and can change rapidly",
+    "Structural analysis is educational, not predictive"
+)
+
+_ASSUMPTIONS: Tuple[str, ...] = (
+    "Market structure analysis is based on conceptual frameworks",
+    "Current conditions may not reflect future states",
+    "Structural patterns have varying degrees of reliability",
+    "Analysis does not account for unexpected market events"
+)
+
+_LIMITATIONS: Tuple[str, ...] = (
+    "Analysis does not use real-time market data",
+    "Structural analysis cannot predict market movements",
+    "Market structure classification has inherent uncertainty",
+    "Educational focus limits practical trading applications"
+)
+
+
+# Result skeleton with every key in final order; analyze() copies it and
+# fills the per-call fields, so the copy never has to grow
+_RESULT_TEMPLATE: Dict[str, Any] = {
+    "analysis_type": "market_structure",
+    "market_phase": None,
+    "volatility_regime": None,
+    "liquidity_conditions": None,
+    "market_efficiency": None,
+    "structure_assessment": None,
+    "insights": None,
+    "educational_context": _EDUCATIONAL_CONTEXT,
+    "assumptions": _ASSUMPTIONS,
+    "limitations": _LIMITATIONS,
+    "timestamp": None
+}
+
+# Educational notes and base risk lists attached to each section; the risk
+# helpers below extend the base lists by concatenation, never in place
+_PHASE_EDUCATIONAL_NOTES: Tuple[str, ...] = (
+    "Market phases help contextualize price action and volatility patterns",
+    "Phase identification is probabilistic, not deterministic",
+    "Different assets can be in different phases simultaneously",
+    "Phase transitions often coincide with volatility changes"
+)
+
+_VOLATILITY_EDUCATIONAL_CONTEXT: Tuple[str, ...] = (
+    "Volatility regimes influence risk management and position sizing considerations",
+    "Different regimes favor different types of market participants",
+    "Volatility clustering is common in crypto markets",
+    "Regime transitions often present both risks and opportunities"
+)
+
+_LIQUIDITY_EDUCATIONAL_INSIGHTS: Tuple[str, ...] = (
+    "Liquidity conditions affect transaction costs and market efficiency",
+    "Liquidity can vary significantly across different cryptocurrencies",
+    "Market stress often coincides with liquidity deterioration",
+    "Understanding liquidity helps manage execution risk"
+)
+
+_EFFICIENCY_EDUCATIONAL_CONTEXT: Tuple[str, ...] = (
+    "Market efficiency affects how quickly prices reflect available information",
+    "Structural biases can create exploitable but risky patterns",
+    "Crypto markets may have different efficiency characteristics than traditional markets",
+    "Efficiency can vary across different cryptocurrencies and market conditions"
+)
+
+_STRUCTURE_RISK_FACTORS: Tuple[str, ...] = (
+    "Market structure can change without warning",
+    "Current conditions may not persist",
+    "Structural analysis has inherent limitations"
+)
+
+_TRANSITION_RISKS: Tuple[str, ...] = (
+    "Phase transitions can occur without warning",
+    "Volatility often increases during transitions",
+    "Liquidity may deteriorate during structural changes"
+)
+
+_VOLATILITY_RISKS: Tuple[str, ...] = (
+    "Volatility can increase suddenly and unexpectedly",
+    "High volatility increases execution risk and slippage",
+    "Volatility clustering can create extended periods of risk"
+)
+
+_EXECUTION_CONSIDERATIONS: Tuple[str, ...] = (
+    "Market impact increases with trade size",
+    "Timing of execution affects transaction costs",
+    "Order type selection becomes more important in tight conditions"
+)
+
+_BIAS_IMPLICATIONS: Tuple[str, ...] = (
+    "Structural biases may create temporary inefficiencies",
+    "Bias exploitation requires careful risk management",
+    "Biases can change or disappear over time"
+)
+
+# Risk and bias lists depend only on a classification, so each distinct
+# input maps to one shared tuple (callers pass the phase/regime/condition
+# string, not the indicator dicts, to keep the cache key hashable)
+@lru_cache(maxsize=16)
+def _transition_risks(phase: str) -> Tuple[str, ...]:
+    """Transition risks for a market phase."""
+    if phase == MarketPhase.RANGE:
+        return _TRANSITION_RISKS + ("Range breakouts can be explosive and unpredictable",)
+    if phase in (MarketPhase.TREND_UP, MarketPhase.TREND_DOWN):
+        return _TRANSITION_RISKS + ("Trend exhaustion can lead to rapid reversals",)
+    return _TRANSITION_RISKS
+
+
+@lru_cache(maxsize=16)
+def _volatility_risks(regime: str) -> Tuple[str, ...]:
+    """Volatility-related risks for a volatility regime."""
+    if regime in (VolatilityRegime.HIGH, VolatilityRegime.EXTREME):
+        return _VOLATILITY_RISKS + ("Current regime presents elevated risk levels",)
+    return _VOLATILITY_RISKS
+
+
+@lru_cache(maxsize=16)
+def _execution_considerations(condition: str) -> Tuple[str, ...]:
+    """Execution considerations for a liquidity condition."""
+    if condition in (LiquidityCondition.TIGHT, LiquidityCondition.VERY_TIGHT):
+        return _EXECUTION_CONSIDERATIONS + ("Current liquidity conditions require careful execution planning",)
+    return _EXECUTION_CONSIDERATIONS
+
+
+@lru_cache(maxsize=16)
+def _structural_biases(seasonal_patterns: str, day_of_week_effects: str) -> Tuple[str, ...]:
+    """Structural biases implied by the seasonal and day-of-week readings."""
+    biases = []
+    
+    if seasonal_patterns == "present":
+        biases.append("Seasonal patterns suggest recurring time-based effects")
+    
+    if day_of_week_effects == "present":
+        biases.append("Day-of-week effects indicate weekday-based patterns")
+    
+    return tuple(biases)
+
+
+@lru_cache(maxsize=2)
+def _bias_implications(has_biases: bool) -> Tuple[str, ...]:
+    """Implications of structural biases, depending on whether any were found."""
+    if has_biases:
+        return _BIAS_IMPLICATIONS + ("Identified biases warrant further investigation",)
+    return _BIAS_IMPLICATIONS
 
 
 class MarketStructureAnalyzer:
@@ -59,16 +490,28 @@ class MarketStructureAnalyzer:
     providing trading signals, recommendations, or financial advice.
     """
     
+    # Structure factors covered by the analysis, in presentation order
+    STRUCTURE_FACTORS: ClassVar[Tuple[str, ...]] = (
+        "price_action",
+        "volume_patterns",
+        "volatility_characteristics",
+        "liquidity_analysis",
+        "market_participation",
+        "structural_biases"
+    )
+    
+    __slots__ = ("_static_payload",)
+    
     def __init__(self):
         """Initialize the market structure analyzer."""
-        self.structure_factors = [
-            "price_action",
-            "volume_patterns",
-            "volatility_characteristics",
-            "liquidity_analysis",
-            "market_participation",
-            "structural_biases"
-        ]
+        # The sections do not depend on query or assets yet, so the whole
+        # result (minus timestamp) is assembled once per analyzer
+        self._static_payload = freeze(self._analyze_sections("", None))
+    
+    @property
+    def structure_factors(self) -> Tuple[str, ...]:
+        """Structure factors covered by the analysis (kept for backward compatibility)."""
+        return self.STRUCTURE_FACTORS
     
     def analyze(self, query: str, assets: List[str] = None) -> Dict[str, Any]:
         """
@@ -79,59 +522,101 @@ class MarketStructureAnalyzer:
             assets: List of assets to focus on (optional)
             
         Returns:
-            Dictionary containing market structure analysis results
+            Dictionary containing market structure analysis results; nested
+            sections are shared read-only mappings (copy.deepcopy the result
+            for a mutable copy)
         """
-        try:
-            logger.info(f"Starting market structure analysis for query: {query}")
-            
-            # Default to major cryptocurrencies if no assets specified
-            if not assets:
-                assets = ["bitcoin", "ethereum"]
-            
-            # Analyze different structure components
-            phase_analysis = self._analyze_market_phase(query, assets)
-            volatility_analysis = self._analyze_volatility_regime(query, assets)
-            liquidity_analysis = self._analyze_liquidity_conditions(query, assets)
-            efficiency_analysis = self._analyze_market_efficiency(query, assets)
-            
-            # Generate structural insights
-            insights = self._generate_structure_insights(
-                phase_analysis,
-                volatility_analysis,
-                liquidity_analysis,
-                efficiency_analysis
-            )
-            
-            # Assess overall market structure
-            structure_assessment = self._assess_market_structure(
-                phase_analysis,
-                volatility_analysis,
-                liquidity_analysis,
-                efficiency_analysis
-            )
-            
-            result = {
-                "analysis_type": "market_structure",
-                "market_phase": phase_analysis,
-                "volatility_regime": volatility_analysis,
-                "liquidity_conditions": liquidity_analysis,
-                "market_efficiency": efficiency_analysis,
-                "structure_assessment": structure_assessment,
-                "insights": insights,
-                "educational_context": self._get_educational_context(),
-                "assumptions": self._get_assumptions(),
-                "limitations": self._get_limitations(),
-                "timestamp": self._get_timestamp()
-            }
+        logger.info("Starting market structure analysis for query: %s", query)
+        
+        result = {**self._static_payload, "timestamp": self._get_timestamp()}
+        
+        logger.info("Market structure analysis completed successfully")
+        return result
+    
+    def analyze_batch(
+        self,
+        queries: Sequence[str],
+        assets_list: Optional[Sequence[Optional[Sequence[str]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform market structure analysis for many queries at once.
+        
+        The structure sections do not depend on the query or assets yet, so
+        every result references the analyzer's prebuilt read-only sections;
+        only the timestamp is per result.
+        
+        Args:
+            queries: User analysis requests
+            assets_list: Assets per query, parallel to queries (optional)
             
-            logger.info("Market structure analysis completed successfully")
-            return result
+        Returns:
+            One market structure result per query, in order; nested sections
+            are shared read-only mappings (copy.deepcopy a result for a
+            mutable copy)
             
-        except Exception as e:
-            logger.error(f"Error in market structure analysis: {str(e)}")
-            return self._error_response(str(e))
+        Raises:
+            ValueError: If assets_list and queries differ in length
+        """
+        if assets_list is not None and len(assets_list) != len(queries):
+            raise ValueError("assets_list must have one entry per query")
+        if not queries:
+            return []
+        
+        logger.info("Starting market structure analysis for %d queries", len(queries))
+        
+        payload = self._static_payload
+        results = [{**payload, "timestamp": self._get_timestamp()} for _ in queries]
+        
+        logger.info("Market structure batch analysis completed successfully")
+        return results
     
-    def _analyze_market_phase(self, query: str, assets: List[str]) -> Dict[str, Any]:
+    def _analyze_sections(self, query: str, assets: Optional[Sequence[str]]) -> Dict[str, Any]:
+        """
+        Build a market structure result; the timestamp is left unset (None).
+        
+        Args:
+            query: User's analysis request
+            assets: List of assets to focus on (optional)
+            
+        Returns:
+            Market structure sections, insights and educational context
+        """
+        # Default to major cryptocurrencies if no assets specified
+        if not assets:
+            assets = _DEFAULT_ASSETS
+        
+        # Analyze different structure components
+        phase_analysis = self._analyze_market_phase(query, assets)
+        volatility_analysis = self._analyze_volatility_regime(query, assets)
+        liquidity_analysis = self._analyze_liquidity_conditions(query, assets)
+        efficiency_analysis = self._analyze_market_efficiency(query, assets)
+        
+        # Generate structural insights
+        insights = self._generate_structure_insights(
+            phase_analysis,
+            volatility_analysis,
+            liquidity_analysis,
+            efficiency_analysis
+        )
+        
+        # Assess overall market structure
+        structure_assessment = self._assess_market_structure(
+            phase_analysis,
+            volatility_analysis,
+            liquidity_analysis,
+            efficiency_analysis
+        )
+        
+        result = _RESULT_TEMPLATE.copy()
+        result["market_phase"] = phase_analysis
+        result["volatility_regime"] = volatility_analysis
+        result["liquidity_conditions"] = liquidity_analysis
+        result["market_efficiency"] = efficiency_analysis
+        result["structure_assessment"] = structure_assessment
+        result["insights"] = insights
+        return result
+    
+    def _analyze_market_phase(self, query: str, assets: Sequence[str]) -> Dict[str, Any]:
         """
         Analyze current market phase.
         
@@ -143,36 +628,11 @@ class MarketStructureAnalyzer:
             Market phase analysis
         """
         # Educational analysis of market phase characteristics
-        phase_indicators = {
-            "price_characteristics": {
-                "directional_bias": "neutral",  # Educational placeholder
-                "momentum_quality": "moderate",
-                "trend_consistency": "variable",
-                "explanation": "Price characteristics help identify whether markets are trending, ranging, or in transition."
-            },
-            "volume_patterns": {
-                "volume_trend": "stable",
-                "volume_quality": "moderate",
-                "participation_level": "moderate",
-                "explanation": "Volume analysis provides insights into market conviction and participation strength."
-            },
-            "range_boundaries": {
-                "support_resistance": "identifiable",
-                "range_width": "moderate",
-                "boundary_strength": "moderate",
-                "explanation": "Range boundaries indicate areas of buying/selling interest and potential support/resistance."
-            },
-            "transition_signals": {
-                "phase_shift_probability": "moderate",
-                "transition_clarity": "unclear",
-                "breakout_potential": "balanced",
-                "explanation": "Transition signals help identify potential phase changes in market structure."
-            }
-        }
+        phase_indicators = _PHASE_INDICATORS
         
         # Determine market phase
         market_phase = self._classify_market_phase(phase_indicators)
-        phase_confidence = self._assess_phase_confidence(phase_indicators)
+        phase_confidence = _PLACEHOLDER_ASSESSMENT
         
         return {
             "current_phase": market_phase,
@@ -180,15 +640,10 @@ class MarketStructureAnalyzer:
             "indicators": phase_indicators,
             "phase_characteristics": self._get_phase_characteristics(market_phase),
             "transition_risks": self._identify_transition_risks(market_phase, phase_indicators),
-            "educational_notes": [
-                "Market phases help contextualize price action and volatility patterns",
-                "Phase identification is probabilistic, not deterministic",
-                "Different assets can be in different phases simultaneously",
-                "Phase transitions often coincide with volatility changes"
-            ]
+            "educational_notes": _PHASE_EDUCATIONAL_NOTES
         }
     
-    def _analyze_volatility_regime(self, query: str, assets: List[str]) -> Dict[str, Any]:
+    def _analyze_volatility_regime(self, query: str, assets: Sequence[str]) -> Dict[str, Any]:
         """
         Analyze current volatility regime.
         
@@ -199,32 +654,7 @@ class MarketStructureAnalyzer:
         Returns:
             Volatility regime analysis
         """
-        volatility_indicators = {
-            "volatility_level": {
-                "current_regime": "medium",  # Educational placeholder
-                "historical_comparison": "near_average",
-                "trend_direction": "stable",
-                "explanation": "Volatility level indicates the magnitude of price fluctuations and market uncertainty."
-            },
-            "volatility_persistence": {
-                "autocorrelation": "moderate",
-                "regime_stability": "moderate",
-                "mean_reversion_tendency": "present",
-                "explanation": "Volatility persistence shows whether current conditions are likely to continue."
-            },
-            "volatility_skew": {
-                "asymmetry": "slight_negative",
-                "tail_risk": "moderate",
-                "distribution_shape": "near_normal",
-                "explanation": "Volatility skew reveals asymmetries in upside vs downside volatility potential."
-            },
-            "intraday_patterns": {
-                "session_consistency": "moderate",
-                "time_of_day_effects": "present",
-                "gap_behavior": "moderate",
-                "explanation": "Intraday patterns help understand volatility dynamics throughout trading sessions."
-            }
-        }
+        volatility_indicators = _VOLATILITY_INDICATORS
         
         # Classify volatility regime
         volatility_regime = self._classify_volatility_regime(volatility_indicators)
@@ -236,15 +666,10 @@ class MarketStructureAnalyzer:
             "indicators": volatility_indicators,
             "regime_characteristics": self._get_regime_characteristics(volatility_regime),
             "risk_implications": self._assess_volatility_risks(volatility_regime, volatility_indicators),
-            "educational_context": [
-                "Volatility regimes influence risk management and position sizing considerations",
-                "Different regimes favor different types of market participants",
-                "Volatility clustering is common in crypto markets",
-                "Regime transitions often present both risks and opportunities"
-            ]
+            "educational_context": _VOLATILITY_EDUCATIONAL_CONTEXT
         }
     
-    def _analyze_liquidity_conditions(self, query: str, assets: List[str]) -> Dict[str, Any]:
+    def _analyze_liquidity_conditions(self, query: str, assets: Sequence[str]) -> Dict[str, Any]:
         """
         Analyze market liquidity conditions.
         
@@ -255,36 +680,11 @@ class MarketStructureAnalyzer:
         Returns:
             Liquidity conditions analysis
         """
-        liquidity_indicators = {
-            "order_book_depth": {
-                "depth_level": "moderate",
-                "spread_tightness": "moderate",
-                "depth_distribution": "balanced",
-                "explanation": "Order book depth indicates available liquidity at different price levels."
-            },
-            "market_impact": {
-                "impact_level": "moderate",
-                "slippage_expectation": "moderate",
-                "size_capacity": "moderate",
-                "explanation": "Market impact shows how trade sizes affect prices, indicating liquidity quality."
-            },
-            "participation_diversity": {
-                "participant_types": "diverse",
-                "geographic_distribution": "global",
-                "institutional_presence": "growing",
-                "explanation": "Participation diversity affects liquidity stability and market resilience."
-            },
-            "temporal_patterns": {
-                "session_liquidity": "variable",
-                "day_of_week_effects": "present",
-                "market_hours_impact": "significant",
-                "explanation": "Temporal patterns reveal how liquidity varies across time periods."
-            }
-        }
+        liquidity_indicators = _LIQUIDITY_INDICATORS
         
         # Classify liquidity conditions
         liquidity_condition = self._classify_liquidity_condition(liquidity_indicators)
-        liquidity_stability = self._assess_liquidity_stability(liquidity_indicators)
+        liquidity_stability = _PLACEHOLDER_ASSESSMENT
         
         return {
             "current_condition": liquidity_condition,
@@ -292,15 +692,10 @@ class MarketStructureAnalyzer:
             "indicators": liquidity_indicators,
             "condition_characteristics": self._get_liquidity_characteristics(liquidity_condition),
             "execution_considerations": self._assess_execution_considerations(liquidity_condition, liquidity_indicators),
-            "educational_insights": [
-                "Liquidity conditions affect transaction costs and market efficiency",
-                "Liquidity can vary significantly across different cryptocurrencies",
-                "Market stress often coincides with liquidity deterioration",
-                "Understanding liquidity helps manage execution risk"
-            ]
+            "educational_insights": _LIQUIDITY_EDUCATIONAL_INSIGHTS
         }
     
-    def _analyze_market_efficiency(self, query: str, assets: List[str]) -> Dict[str, Any]:
+    def _analyze_market_efficiency(self, query: str, assets: Sequence[str]) -> Dict[str, Any]:
         """
         Analyze market efficiency and structural biases.
         
@@ -311,35 +706,10 @@ class MarketStructureAnalyzer:
         Returns:
             Market efficiency analysis
         """
-        efficiency_indicators = {
-            "information_flow": {
-                "price_discovery": "moderate",
-                "news_incorporation": "reasonable",
-                "cross_market_arbitrage": "present",
-                "explanation": "Information flow efficiency shows how quickly markets process new information."
-            },
-            "structural_biases": {
-                "seasonal_patterns": "present",
-                "day_of_week_effects": "mild",
-                "holiday_effects": "present",
-                "explanation": "Structural biases are recurring patterns that may indicate market inefficiencies."
-            },
-            "market_microstructure": {
-                "tick_size_impact": "moderate",
-                "lot_size_effects": "present",
-                "trading_frictions": "moderate",
-                "explanation": "Market microstructure affects how efficiently prices are formed and updated."
-            },
-            "behavioral_patterns": {
-                "herding_behavior": "present",
-                "overreaction_tendencies": "present",
-                "mean_reversion": "present",
-                "explanation": "Behavioral patterns can create predictable but temporary market inefficiencies."
-            }
-        }
+        efficiency_indicators = _EFFICIENCY_INDICATORS
         
         # Assess overall efficiency
-        efficiency_level = self._assess_efficiency_level(efficiency_indicators)
+        efficiency_level = _PLACEHOLDER_ASSESSMENT
         structural_biases = self._identify_structural_biases(efficiency_indicators)
         
         return {
@@ -348,12 +718,7 @@ class MarketStructureAnalyzer:
             "indicators": efficiency_indicators,
             "efficiency_characteristics": self._get_efficiency_characteristics(efficiency_level),
             "bias_implications": self._assess_bias_implications(structural_biases),
-            "educational_context": [
-                "Market efficiency affects how quickly prices reflect available information",
-                "Structural biases can create exploitable but risky patterns",
-                "Crypto markets may have different efficiency characteristics than traditional markets",
-                "Efficiency can vary across different cryptocurrencies and market conditions"
-            ]
+            "educational_context": _EFFICIENCY_EDUCATIONAL_CONTEXT
         }
     
     def _generate_structure_insights(
@@ -362,7 +727,7 @@ class MarketStructureAnalyzer:
         volatility: Dict[str, Any],
         liquidity: Dict[str, Any],
         efficiency: Dict[str, Any]
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
         Generate key insights from market structure analysis.
         
@@ -373,41 +738,15 @@ class MarketStructureAnalyzer:
             efficiency: Market efficiency analysis
             
         Returns:
-            List of key insights
+            Tuple of key insights
         """
         insights = []
+        for (key, table), section in zip(_INSIGHT_RULES, (phase, volatility, liquidity, efficiency)):
+            insight = table.get(section.get(key))
+            if insight is not None:
+                insights.append(insight)
         
-        # Phase insights
-        current_phase = phase.get("current_phase", "uncertain")
-        if current_phase == MarketPhase.RANGE.value:
-            insights.append("Range-bound market structure suggests defined support/resistance levels")
-        elif current_phase in [MarketPhase.TREND_UP.value, MarketPhase.TREND_DOWN.value]:
-            insights.append(f"Trending market structure indicates directional momentum")
-        elif current_phase == MarketPhase.TRANSITION.value:
-            insights.append("Transition phase suggests potential structural changes ahead")
-        
-        # Volatility insights
-        volatility_regime = volatility.get("current_regime", "medium")
-        if volatility_regime == VolatilityRegime.HIGH.value:
-            insights.append("High volatility regime suggests increased uncertainty and risk")
-        elif volatility_regime == VolatilityRegime.LOW.value:
-            insights.append("Low volatility regime may indicate market complacency or consolidation")
-        
-        # Liquidity insights
-        liquidity_condition = liquidity.get("current_condition", "moderate")
-        if liquidity_condition == LiquidityCondition.TIGHT.value:
-            insights.append("Tight liquidity conditions may increase execution costs and market impact")
-        elif liquidity_condition == LiquidityCondition.AMPLE.value:
-            insights.append("Ample liquidity conditions support efficient price discovery")
-        
-        # Efficiency insights
-        efficiency_level = efficiency.get("efficiency_level", "moderate")
-        if efficiency_level == "low":
-            insights.append("Lower market efficiency may create temporary structural opportunities")
-        elif efficiency_level == "high":
-            insights.append("Higher market efficiency suggests prices quickly reflect available information")
-        
-        return insights
+        return tuple(insights)
     
     def _assess_market_structure(
         self,
@@ -428,24 +767,28 @@ class MarketStructureAnalyzer:
         Returns:
             Overall market structure assessment
         """
+        # Read each classification once; the helpers take the scalars
+        volatility_regime = volatility.get("current_regime", "medium")
+        liquidity_condition = liquidity.get("current_condition", "moderate")
+        
         structure_components = {
             "market_phase": phase.get("current_phase", "uncertain"),
-            "volatility_regime": volatility.get("current_regime", "medium"),
-            "liquidity_condition": liquidity.get("current_condition", "moderate"),
+            "volatility_regime": volatility_regime,
+            "liquidity_condition": liquidity_condition,
             "efficiency_level": efficiency.get("efficiency_level", "moderate")
         }
         
         # Assess overall structure quality
-        structure_quality = self._assess_structure_quality(structure_components)
-        risk_context = self._assess_structure_risk_context(structure_components)
+        structure_quality = _PLACEHOLDER_ASSESSMENT
+        risk_context = self._assess_structure_risk_context()
         
         return {
             "overall_structure": structure_components,
             "structure_quality": structure_quality,
             "risk_context": risk_context,
-            "structural_strengths": self._identify_structure_strengths(structure_components),
-            "structural_concerns": self._identify_structure_concerns(structure_components),
-            "market_maturity": self._assess_market_maturity(structure_components)
+            "structural_strengths": self._identify_structure_strengths(liquidity_condition, volatility_regime),
+            "structural_concerns": self._identify_structure_concerns(liquidity_condition, volatility_regime),
+            "market_maturity": self._assess_market_maturity()
         }
     
     def _classify_market_phase(self, indicators: Dict[str, Any]) -> str:
@@ -454,68 +797,15 @@ class MarketStructureAnalyzer:
         price_bias = indicators["price_characteristics"]["directional_bias"]
         volume_quality = indicators["volume_patterns"]["volume_quality"]
         
-        if price_bias == "neutral" and volume_quality == "moderate":
-            return MarketPhase.RANGE.value
-        elif price_bias in ["bullish", "bearish"] and volume_quality == "strong":
-            return MarketPhase.TREND_UP.value if price_bias == "bullish" else MarketPhase.TREND_DOWN.value
-        else:
-            return MarketPhase.UNCERTAIN.value
-    
-    def _assess_phase_confidence(self, indicators: Dict[str, Any]) -> str:
-        """Assess confidence in phase classification."""
-        return "moderate"  # Educational placeholder
+        return _PHASE_CLASSIFIER.get((price_bias, volume_quality), MarketPhase.UNCERTAIN)
     
     def _get_phase_characteristics(self, phase: str) -> Dict[str, Any]:
         """Get characteristics for a market phase."""
-        characteristics = {
-            MarketPhase.RANGE.value: {
-                "description": "Price moves within defined boundaries",
-                "typical_duration": "weeks to months",
-                "volatility_tendency": "moderate",
-                "breakout_potential": "present"
-            },
-            MarketPhase.TREND_UP.value: {
-                "description": "Sustained upward price movement",
-                "typical_duration": "months",
-                "volatility_tendency": "low_to_moderate",
-                "momentum_characteristics": "positive"
-            },
-            MarketPhase.TREND_DOWN.value: {
-                "description": "Sustained downward price movement",
-                "typical_duration": "months",
-                "volatility_tendency": "moderate_to_high",
-                "momentum_characteristics": "negative"
-            },
-            MarketPhase.TRANSITION.value: {
-                "description": "Market structure changing between phases",
-                "typical_duration": "days to weeks",
-                "volatility_tendency": "increasing",
-                "uncertainty_level": "high"
-            },
-            MarketPhase.UNCERTAIN.value: {
-                "description": "Clear phase classification not possible",
-                "typical_duration": "variable",
-                "volatility_tendency": "variable",
-                "clarity_level": "low"
-            }
-        }
-        
-        return characteristics.get(phase, characteristics[MarketPhase.UNCERTAIN.value])
+        return _PHASE_CHARACTERISTICS.get(phase, _PHASE_CHARACTERISTICS[MarketPhase.UNCERTAIN])
     
-    def _identify_transition_risks(self, phase: str, indicators: Dict[str, Any]) -> List[str]:
+    def _identify_transition_risks(self, phase: str, indicators: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify transition risks for current phase."""
-        risks = [
-            "Phase transitions can occur without warning",
-            "Volatility often increases during transitions",
-            "Liquidity may deteriorate during structural changes"
-        ]
-        
-        if phase == MarketPhase.RANGE.value:
-            risks.append("Range breakouts can be explosive and unpredictable")
-        elif phase in [MarketPhase.TREND_UP.value, MarketPhase.TREND_DOWN.value]:
-            risks.append("Trend exhaustion can lead to rapid reversals")
-        
-        return risks
+        return _transition_risks(phase)
     
     def _classify_volatility_regime(self, indicators: Dict[str, Any]) -> str:
         """Classify volatility regime based on indicators."""
@@ -529,232 +819,93 @@ class MarketStructureAnalyzer:
     
     def _get_regime_characteristics(self, regime: str) -> Dict[str, Any]:
         """Get characteristics for volatility regime."""
-        characteristics = {
-            VolatilityRegime.LOW.value: {
-                "description": "Minimal price fluctuations",
-                "risk_profile": "lower",
-                "participant_impact": "favors position holders"
-            },
-            VolatilityRegime.MEDIUM.value: {
-                "description": "Moderate price fluctuations",
-                "risk_profile": "moderate",
-                "participant_impact": "balanced across strategies"
-            },
-            VolatilityRegime.HIGH.value: {
-                "description": "Significant price fluctuations",
-                "risk_profile": "higher",
-                "participant_impact": "favors short-term traders"
-            },
-            VolatilityRegime.EXTREME.value: {
-                "description": "Very large price fluctuations",
-                "risk_profile": "very_high",
-                "participant_impact": "creates both risks and opportunities"
-            }
-        }
-        
-        return characteristics.get(regime, characteristics[VolatilityRegime.MEDIUM.value])
+        return _REGIME_CHARACTERISTICS.get(regime, _REGIME_CHARACTERISTICS[VolatilityRegime.MEDIUM])
     
-    def _assess_volatility_risks(self, regime: str, indicators: Dict[str, Any]) -> List[str]:
+    def _assess_volatility_risks(self, regime: str, indicators: Dict[str, Any]) -> Tuple[str, ...]:
         """Assess volatility-related risks."""
-        risks = [
-            "Volatility can increase suddenly and unexpectedly",
-            "High volatility increases execution risk and slippage",
-            "Volatility clustering can create extended periods of risk"
-        ]
-        
-        if regime in [VolatilityRegime.HIGH.value, VolatilityRegime.EXTREME.value]:
-            risks.append("Current regime presents elevated risk levels")
-        
-        return risks
+        return _volatility_risks(regime)
     
     def _classify_liquidity_condition(self, indicators: Dict[str, Any]) -> str:
         """Classify liquidity condition based on indicators."""
         depth_level = indicators["order_book_depth"]["depth_level"]
         impact_level = indicators["market_impact"]["impact_level"]
         
-        if depth_level == "high" and impact_level == "low":
-            return LiquidityCondition.AMPLE.value
-        elif depth_level == "low" and impact_level == "high":
-            return LiquidityCondition.TIGHT.value
-        else:
-            return LiquidityCondition.MODERATE.value
-    
-    def _assess_liquidity_stability(self, indicators: Dict[str, Any]) -> str:
-        """Assess stability of liquidity conditions."""
-        return "moderate"  # Educational placeholder
+        return _LIQUIDITY_CLASSIFIER.get((depth_level, impact_level), LiquidityCondition.MODERATE)
     
     def _get_liquidity_characteristics(self, condition: str) -> Dict[str, Any]:
         """Get characteristics for liquidity condition."""
-        characteristics = {
-            LiquidityCondition.AMPLE.value: {
-                "description": "Abundant liquidity across price levels",
-                "execution_impact": "minimal",
-                "cost_implications": "lower transaction costs"
-            },
-            LiquidityCondition.MODERATE.value: {
-                "description": "Sufficient liquidity with some limitations",
-                "execution_impact": "moderate",
-                "cost_implications": "reasonable transaction costs"
-            },
-            LiquidityCondition.TIGHT.value: {
-                "description": "Limited liquidity at key price levels",
-                "execution_impact": "significant",
-                "cost_implications": "higher transaction costs"
-            },
-            LiquidityCondition.VERY_TIGHT.value: {
-                "description": "Very limited liquidity throughout order book",
-                "execution_impact": "severe",
-                "cost_implications": "very high transaction costs"
-            }
-        }
-        
-        return characteristics.get(condition, characteristics[LiquidityCondition.MODERATE.value])
+        return _LIQUIDITY_CHARACTERISTICS.get(condition, _LIQUIDITY_CHARACTERISTICS[LiquidityCondition.MODERATE])
     
-    def _assess_execution_considerations(self, condition: str, indicators: Dict[str, Any]) -> List[str]:
+    def _assess_execution_considerations(self, condition: str, indicators: Dict[str, Any]) -> Tuple[str, ...]:
         """Assess execution considerations for liquidity condition."""
-        considerations = [
-            "Market impact increases with trade size",
-            "Timing of execution affects transaction costs",
-            "Order type selection becomes more important in tight conditions"
-        ]
-        
-        if condition in [LiquidityCondition.TIGHT.value, LiquidityCondition.VERY_TIGHT.value]:
-            considerations.append("Current liquidity conditions require careful execution planning")
-        
-        return considerations
-    
-    def _assess_efficiency_level(self, indicators: Dict[str, Any]) -> str:
-        """Assess overall market efficiency level."""
-        # Simplified assessment for educational purposes
-        return "moderate"
+        return _execution_considerations(condition)
     
-    def _identify_structural_biases(self, indicators: Dict[str, Any]) -> List[str]:
+    def _identify_structural_biases(self, indicators: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify structural market biases."""
-        biases = []
-        
         structural = indicators["structural_biases"]
-        if structural["seasonal_patterns"] == "present":
-            biases.append("Seasonal patterns suggest recurring time-based effects")
-        
-        if structural["day_of_week_effects"] == "present":
-            biases.append("Day-of-week effects indicate weekday-based patterns")
-        
-        return biases
+        return _structural_biases(structural["seasonal_patterns"], structural["day_of_week_effects"])
     
     def _get_efficiency_characteristics(self, level: str) -> Dict[str, Any]:
         """Get characteristics for efficiency level."""
-        characteristics = {
-            "high": {
-                "description": "Prices quickly reflect available information",
-                "arbitrage_opportunities": "rare",
-                "predictability": "low"
-            },
-            "moderate": {
-                "description": "Prices reasonably reflect available information",
-                "arbitrage_opportunities": "occasional",
-                "predictability": "moderate"
-            },
-            "low": {
-                "description": "Prices may not fully reflect available information",
-                "arbitrage_opportunities": "more common",
-                "predictability": "higher"
-            }
-        }
-        
-        return characteristics.get(level, characteristics["moderate"])
+        return _EFFICIENCY_CHARACTERISTICS.get(level, _EFFICIENCY_CHARACTERISTICS["moderate"])
     
-    def _assess_bias_implications(self, biases: List[str]) -> List[str]:
+    def _assess_bias_implications(self, biases: Sequence[str]) -> Tuple[str, ...]:
         """Assess implications of structural biases."""
-        implications = [
-            "Structural biases may create temporary inefficiencies",
-            "Bias exploitation requires careful risk management",
-            "Biases can change or disappear over time"
-        ]
-        
-        if biases:
-            implications.append("Identified biases warrant further investigation")
-        
-        return implications
+        return _bias_implications(bool(biases))
     
-    def _assess_structure_quality(self, components: Dict[str, Any]) -> str:
-        """Assess overall market structure quality."""
-        # Simplified assessment for educational purposes
-        return "moderate"
-    
-    def _assess_structure_risk_context(self, components: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_structure_risk_context(self) -> Dict[str, Any]:
         """Assess risk context of market structure."""
         return {
             "overall_risk": "moderate",
-            "key_risk_factors": [
-                "Market structure can change without warning",
-                "Current conditions may not persist",
-                "Structural analysis has inherent limitations"
-            ]
+            "key_risk_factors": _STRUCTURE_RISK_FACTORS
         }
     
-    def _identify_structure_strengths(self, components: Dict[str, Any]) -> List[str]:
+    def _identify_structure_strengths(self, liquidity_condition: str, volatility_regime: str) -> Tuple[str, ...]:
         """Identify structural strengths."""
         strengths = []
         
-        if components["liquidity_condition"] == LiquidityCondition.AMPLE.value:
+        if liquidity_condition == LiquidityCondition.AMPLE:
             strengths.append("Strong liquidity supports efficient execution")
         
-        if components["volatility_regime"] == VolatilityRegime.LOW.value:
+        if volatility_regime == VolatilityRegime.LOW:
             strengths.append("Low volatility reduces execution uncertainty")
         
-        return strengths
+        return tuple(strengths)
     
-    def _identify_structure_concerns(self, components: Dict[str, Any]) -> List[str]:
+    def _identify_structure_concerns(self, liquidity_condition: str, volatility_regime: str) -> Tuple[str, ...]:
         """Identify structural concerns."""
         concerns = []
         
-        if components["liquidity_condition"] in [LiquidityCondition.TIGHT.value, LiquidityCondition.VERY_TIGHT.value]:
+        if liquidity_condition in (LiquidityCondition.TIGHT, LiquidityCondition.VERY_TIGHT):
             concerns.append("Tight liquidity may increase execution costs")
         
-        if components["volatility_regime"] in [VolatilityRegime.HIGH.value, VolatilityRegime.EXTREME.value]:
+        if volatility_regime in (VolatilityRegime.HIGH, VolatilityRegime.EXTREME):
             concerns.append("High volatility increases market risk")
         
-        return concerns
+        return tuple(concerns)
     
-    def _assess_market_maturity(self, components: Dict[str, Any]) -> str:
+    def _assess_market_maturity(self) -> str:
         """Assess market maturity based on structure."""
         return "developing"  # Educational placeholder
     
-    def _get_educational_context(self) -> List[str]:
-        """Get educational context about market structure analysis."""
-        return [
-            "Market structure analysis provides context for price movements",
-            "Understanding structure helps assess risk and opportunity",
-            "Structure analysis complements other forms of market analysis",
-            "Market structure is dynamic and can change rapidly",
-            "Structural analysis is educational, not predictive"
-        ]
-    
-    def _get_assumptions(self) -> List[str]:
-        """Get assumptions for market structure analysis."""
-        return [
-            "Market structure analysis is based on conceptual frameworks",
-            "Current conditions may not reflect future states",
-            "Structural patterns have varying degrees of reliability",
-            "Analysis does not account for unexpected market events"
-        ]
-    
-    def _get_limitations(self) -> List[str]:
-        """Get limitations for market structure analysis."""
-        return [
-            "Analysis does not use real-time market data",
-            "Structural analysis cannot predict market movements",
-            "Market structure classification has inherent uncertainty",
-            "Educational focus limits practical trading applications"
-        ]
+    def _get_educational_context(self) -> Tuple[str, ...]:
+        """Get educational context about market structure analysis (shared, immutable)."""
+        return _EDUCATIONAL_CONTEXT
+    
+    def _get_assumptions(self) -> Tuple[str, ...]:
+        """Get assumptions for market structure analysis (shared, immutable)."""
+        return _ASSUMPTIONS
+    
+    def _get_limitations(self) -> Tuple[str, ...]:
+        """Get limitations for market structure analysis (shared, immutable)."""
+        return _LIMITATIONS
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        return utc_timestamp()
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
-        """Generate error response."""
+        """Generate error response (used by callers that run analyze() with a fallback)."""
         return {
             "error": True,
             "message": f"Market structure analysis failed: {error_message}",
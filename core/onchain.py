@@ -6,13 +6,245 @@ activity, providing educational insights about network fundamentals
 and blockchain ecosystem dynamics.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, List, Mapping, Tuple
 import logging
 
+from .clock import utc_timestamp
+from .readonly import freeze
+
 
 logger = logging.getLogger(__name__)
 
 
+# Static metric readings (educational placeholders). None of them depend on
+# the query or assets, so they are built once and shared by every result.
+_ACTIVITY_METRICS: Mapping[str, Any] = freeze({
+    "active_addresses": {
+        "current_trend": "stable",  # Educational placeholder
+        "30_day_change": "neutral",
+        "significance": "Active addresses indicate network usage and adoption",
+        "explanation": "The number of unique active addresses shows how many users are actively using the network, serving as a proxy for adoption and engagement."
+    },
+    "new_addresses": {
+        "current_trend": "moderately_increasing",
+        "significance": "New address creation indicates user growth",
+        "explanation": "Growth in new addresses suggests ongoing user acquisition and network expansion, though some addresses may belong to existing users."
+    },
+    "network_utilization": {
+        "current_level": "moderate",
+        "significance": "Network utilization shows demand for block space",
+        "explanation": "High network utilization can indicate strong demand for transactions, potentially leading to higher fees during peak periods."
+    },
+    "dapp_activity": {
+        "trend": "growing",
+        "significance": "DeFi and application usage drives network demand",
+        "explanation": "Decentralized application activity generates transactions and demonstrates practical utility of the network."
+    }
+})
+
+_HOLDER_METRICS: Mapping[str, Any] = freeze({
+    "holder_distribution": {
+        "retail_holders": "increasing",
+        "whale_concentration": "stable",
+        "institutional_holdings": "growing",
+        "explanation": "Holder distribution shows how tokens are distributed across different holder types, which can indicate market maturity and stability."
+    },
+    "holding_periods": {
+        "short_term": "decreasing",
+        "medium_term": "stable",
+        "long_term": "increasing",
+        "explanation": "Holding period analysis reveals investor sentiment and conviction levels across different time horizons."
+    },
+    "profit_loss_status": {
+        "in_profit": "moderate_percentage",
+        "in_loss": "moderate_percentage",
+        "break_even": "small_percentage",
+        "explanation": "The percentage of holders in profit or loss can influence selling pressure and market dynamics."
+    },
+    "accumulation_distribution": {
+        "current_phase": "accumulation",
+        "accumulation_zones": "identified",
+        "distribution_zones": "minimal",
+        "explanation": "Accumulation and distribution patterns show how different holder groups are positioning themselves over time."
+    }
+})
+
+_TRANSACTION_METRICS: Mapping[str, Any] = freeze({
+    "transaction_volume": {
+        "daily_volume": "stable",
+        "volume_trend": "sideways",
+        "value_transferred": "moderate",
+        "explanation": "Transaction volume measures the total value being moved on-chain, reflecting economic activity and network utilization."
+    },
+    "transaction_count": {
+        "daily_count": "stable",
+        "count_trend": "slightly_increasing",
+        "average_transaction_size": "decreasing",
+        "explanation": "Transaction count shows network usage frequency, while average size can indicate usage patterns and efficiency."
+    },
+    "transaction_fees": {
+        "average_fee": "moderate",
+        "fee_trend": "stable",
+        "fee_pressure": "low",
+        "explanation": "Transaction fees reflect network demand and can influence user behavior, especially for smaller transactions."
+    },
+    "transaction_types": {
+        "simple_transfers": "majority",
+        "smart_contract_interactions": "growing",
+        "exchange_transactions": "stable",
+        "explanation": "Transaction type analysis shows how the network is being used and what activities drive demand."
+    }
+})
+
+_HEALTH_METRICS: Mapping[str, Any] = freeze({
+    "network_security": {
+        "hash_rate": "stable",  # For PoW networks
+        "staking_participation": "healthy",  # For PoS networks
+        "decentralization_level": "good",
+        "explanation": "Network security metrics show how robust and resilient the network is against attacks and centralization."
+    },
+    "network_performance": {
+        "block_time_consistency": "stable",
+        "confirmation_time": "normal",
+        "network_latency": "acceptable",
+        "explanation": "Performance metrics indicate how well the network is functioning and providing reliable service to users."
+    },
+    "development_activity": {
+        "developer_contribution": "active",
+        "code_updates": "regular",
+        "ecosystem_growth": "expanding",
+        "explanation": "Development activity shows the long-term viability and innovation capacity of the network."
+    },
+    "ecosystem_metrics": {
+        "node_count": "stable",
+        "client_diversity": "good",
+        "geographic_distribution": "diverse",
+        "explanation": "Ecosystem metrics indicate network decentralization and resilience against single points of failure."
+    }
+})
+
+# Educational notes attached to each section
+_ACTIVITY_NOTES: Tuple[str, ...] = (
+    "Network activity metrics provide insights into real usage vs speculation",
+    "Active addresses can be influenced by market conditions and user behavior",
+    "Network utilization affects transaction costs and user experience",
+    "DApp activity demonstrates practical utility beyond simple transfers"
+)
+
+_HOLDER_CONTEXT: Tuple[str, ...] = (
+    "Holder behavior provides insights into market psychology",
+    "Distribution patterns can indicate market structure changes",
+    "Long-term holder accumulation often signals conviction",
+    "Whale activity can significantly impact market dynamics"
+)
+
+_TRANSACTION_NOTES: Tuple[str, ...] = (
+    "Transaction metrics provide insights into real economic activity",
+    "Fee analysis helps understand network congestion and user costs",
+    "Transaction types reveal how the network is being utilized",
+    "Volume patterns can indicate market sentiment and activity"
+)
+
+_HEALTH_INSIGHTS: Tuple[str, ...] = (
+    "Network health is fundamental to long-term viability",
+    "Security metrics ensure network integrity and user trust",
+    "Development activity indicates ongoing innovation and maintenance",
+    "Ecosystem diversity contributes to network resilience"
+)
+
+# Placeholder assessments returned by the helper methods
+_ACTIVITY_ASSESSMENT: Mapping[str, Any] = freeze({
+    "trend": "stable",
+    "strength": "moderate",
+    "sustainability": "likely_sustainable"
+})
+
+_GROWTH_INDICATORS: Tuple[str, ...] = (
+    "New address creation shows user acquisition",
+    "DApp activity demonstrates utility beyond speculation",
+    "Network utilization indicates demand for services"
+)
+
+_USAGE_PATTERNS: Mapping[str, Any] = freeze({
+    "primary_usage": "transfers_and_dapps",
+    "user_engagement": "moderate",
+    "retention_indicators": "positive"
+})
+
+_HOLDER_PATTERNS: Mapping[str, Any] = freeze({
+    "long_term_trend": "accumulation",
+    "distribution_pattern": "stable",
+    "overall_sentiment": "cautiously_optimistic"
+})
+
+_HOLDER_RISKS: Tuple[str, ...] = (
+    "Concentration risk if whale holdings increase",
+    "Liquidity risk if long-term holders start distributing",
+    "Volatility risk if short-term holders dominate"
+)
+
+_TRANSACTION_PATTERNS: Mapping[str, Any] = freeze({
+    "volume_trend": "stable",
+    "efficiency_trend": "improving",
+    "usage_evolution": "maturing"
+})
+
+_EFFICIENCY_METRICS: Mapping[str, Any] = freeze({
+    "fee_efficiency": "good",
+    "throughput_utilization": "moderate",
+    "cost_effectiveness": "reasonable"
+})
+
+_ECONOMIC_ACTIVITY: Mapping[str, Any] = freeze({
+    "status": "moderate",
+    "trend": "stable",
+    "quality": "improving"
+})
+
+_NETWORK_VITALITY: Mapping[str, Any] = freeze({
+    "status": "healthy",
+    "strength": "strong",
+    "resilience": "good"
+})
+
+_SECURITY_POSTURE: Mapping[str, Any] = freeze({
+    "overall_security": "strong",
+    "attack_resistance": "high",
+    "decentralization": "adequate"
+})
+
+_SUSTAINABILITY_FACTORS: Tuple[str, ...] = (
+    "Active development ensures continuous improvement",
+    "Diverse ecosystem reduces single points of failure",
+    "Healthy economic incentives support network security"
+)
+
+_EDUCATIONAL_EXPLANATIONS: Tuple[str, ...] = (
+    "On-chain metrics provide transparent insights into network activity",
+    "Blockchain data allows for unprecedented market analysis capabilities",
+    "Network fundamentals often diverge from price action in short term",
+    "Long-term value correlates with network utility and adoption",
+    "On-chain analysis complements traditional market analysis methods",
+    "Understanding blockchain metrics helps assess project fundamentals"
+)
+
+# Factor readings counted as strengths / concerns in the network assessment
+_POSITIVE_VALUES: FrozenSet[str] = frozenset({"growing", "accumulation", "healthy", "strong"})
+_NEGATIVE_VALUES: FrozenSet[str] = frozenset({"declining", "distribution", "unhealthy", "weak"})
+
+# Display labels for the network condition factors, e.g. "Activity Trend"
+_FACTOR_LABELS: Mapping[str, str] = freeze({
+    factor: factor.replace("_", " ").title()
+    for factor in ("activity_trend", "holder_sentiment", "transaction_health", "network_vitality")
+})
+
+
+def _factor_label(factor: str) -> str:
+    """Display label for a condition factor name."""
+    label = _FACTOR_LABELS.get(factor)
+    return label if label is not None else factor.replace("_", " ").title()
+
+
 class OnChainAnalyzer:
     """
     Analyzes on-chain metrics and blockchain fundamentals.
@@ -22,6 +254,8 @@ class OnChainAnalyzer:
     investment advice or trading signals.
     """
     
+    __slots__ = ("onchain_categories", "_section_analyzers", "_static_payload")
+    
     def __init__(self):
         """Initialize the on-chain analyzer."""
         self.onchain_categories = [
@@ -32,6 +266,17 @@ class OnChainAnalyzer:
             "development_activity",
             "economic_metrics"
         ]
+        # Section analyzers bound once, in result order: network activity,
+        # holder behavior, transaction metrics, network health
+        self._section_analyzers = (
+            self._analyze_network_activity,
+            self._analyze_holder_behavior,
+            self._analyze_transaction_metrics,
+            self._analyze_network_health
+        )
+        # The analysis does not depend on query or assets yet, so the whole
+        # result (minus timestamp) is assembled once per analyzer
+        self._static_payload = freeze(self._build_payload())
     
     def analyze(self, query: str, assets: List[str] = None) -> Dict[str, Any]:
         """
@@ -42,51 +287,58 @@ class OnChainAnalyzer:
             assets: List of assets to focus on (optional)
             
         Returns:
-            Dictionary containing on-chain analysis results
+            Dictionary containing on-chain analysis results; nested
+            sections are shared read-only mappings (copy.deepcopy the result
+            for a mutable copy)
         """
-        try:
-            logger.info(f"Starting on-chain analysis for query: {query}")
-            
-            # Analyze different on-chain components
-            network_activity = self._analyze_network_activity()
-            holder_behavior = self._analyze_holder_behavior()
-            transaction_metrics = self._analyze_transaction_metrics()
-            network_health = self._analyze_network_health()
-            
-            # Generate insights
-            insights = self._generate_onchain_insights(
-                network_activity,
-                holder_behavior,
-                transaction_metrics,
-                network_health
-            )
-            
-            # Assess overall network conditions
-            network_conditions = self._assess_network_conditions(
-                network_activity,
-                holder_behavior,
-                transaction_metrics,
-                network_health
-            )
-            
-            result = {
-                "analysis_type": "onchain",
-                "network_activity": network_activity,
-                "holder_behavior": holder_behavior,
-                "transaction_metrics": transaction_metrics,
-                "network_health": network_health,
-                "network_conditions": network_conditions,
-                "insights": insights,
-                "educational_explanations": self._get_educational_explanations(),
-                "timestamp": self._get_timestamp()
-            }
-            
-            logger.info("On-chain analysis completed successfully")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error in on-chain analysis: {str(e)}")
-            return self._error_response(str(e))
+        logger.info("Starting on-chain analysis for query: %s", query)
+        
+        # Nothing here can fail: the payload was built (and validated) in __init__
+        result = {**self._static_payload, "timestamp": self._get_timestamp()}
+        
+        logger.info("On-chain analysis completed successfully")
+        return result
+    
+    def _build_payload(self) -> Dict[str, Any]:
+        """
+        Build the deterministic part of an on-chain analysis result.
+        
+        The payload is frozen and shared by every analyze() call.
+        
+        Returns:
+            On-chain analysis result without the timestamp
+        """
+        # Analyze different on-chain components
+        network_activity, holder_behavior, transaction_metrics, network_health = [
+            analyze_section() for analyze_section in self._section_analyzers
+        ]
+        
+        # Generate insights
+        insights = self._generate_onchain_insights(
+            network_activity,
+            holder_behavior,
+            transaction_metrics,
+            network_health
+        )
+        
+        # Assess overall network conditions
+        network_conditions = self._assess_network_conditions(
+            network_activity,
+            holder_behavior,
+            transaction_metrics,
+            network_health
+        )
+        
+        return {
+            "analysis_type": "onchain",
+            "network_activity": network_activity,
+            "holder_behavior": holder_behavior,
+            "transaction_metrics": transaction_metrics,
+            "network_health": network_health,
+            "network_conditions": network_conditions,
+            "insights": insights,
+            "educational_explanations": self._get_educational_explanations()
+        }
     
     def _analyze_network_activity(self) -> Dict[str, Any]:
         """
@@ -95,29 +347,7 @@ class OnChainAnalyzer:
         Returns:
             Dictionary with network activity analysis
         """
-        activity_metrics = {
-            "active_addresses": {
-                "current_trend": "stable",  # Educational placeholder
-                "30_day_change": "neutral",
-                "significance": "Active addresses indicate network usage and adoption",
-                "explanation": "The number of unique active addresses shows how many users are actively using the network, serving as a proxy for adoption and engagement."
-            },
-            "new_addresses": {
-                "current_trend": "moderately_increasing",
-                "significance": "New address creation indicates user growth",
-                "explanation": "Growth in new addresses suggests ongoing user acquisition and network expansion, though some addresses may belong to existing users."
-            },
-            "network_utilization": {
-                "current_level": "moderate",
-                "significance": "Network utilization shows demand for block space",
-                "explanation": "High network utilization can indicate strong demand for transactions, potentially leading to higher fees during peak periods."
-            },
-            "dapp_activity": {
-                "trend": "growing",
-                "significance": "DeFi and application usage drives network demand",
-                "explanation": "Decentralized application activity generates transactions and demonstrates practical utility of the network."
-            }
-        }
+        activity_metrics = _ACTIVITY_METRICS
         
         activity_assessment = self._assess_activity_trends(activity_metrics)
         
@@ -126,12 +356,7 @@ class OnChainAnalyzer:
             "overall_activity": activity_assessment,
             "growth_indicators": self._identify_growth_indicators(activity_metrics),
             "usage_patterns": self._analyze_usage_patterns(activity_metrics),
-            "educational_notes": [
-                "Network activity metrics provide insights into real usage vs speculation",
-                "Active addresses can be influenced by market conditions and user behavior",
-                "Network utilization affects transaction costs and user experience",
-                "DApp activity demonstrates practical utility beyond simple transfers"
-            ]
+            "educational_notes": _ACTIVITY_NOTES
         }
     
     def _analyze_holder_behavior(self) -> Dict[str, Any]:
@@ -141,32 +366,7 @@ class OnChainAnalyzer:
         Returns:
             Dictionary with holder behavior analysis
         """
-        holder_metrics = {
-            "holder_distribution": {
-                "retail_holders": "increasing",
-                "whale_concentration": "stable",
-                "institutional_holdings": "growing",
-                "explanation": "Holder distribution shows how tokens are distributed across different holder types, which can indicate market maturity and stability."
-            },
-            "holding_periods": {
-                "short_term": "decreasing",
-                "medium_term": "stable",
-                "long_term": "increasing",
-                "explanation": "Holding period analysis reveals investor sentiment and conviction levels across different time horizons."
-            },
-            "profit_loss_status": {
-                "in_profit": "moderate_percentage",
-                "in_loss": "moderate_percentage",
-                "break_even": "small_percentage",
-                "explanation": "The percentage of holders in profit or loss can influence selling pressure and market dynamics."
-            },
-            "accumulation_distribution": {
-                "current_phase": "accumulation",
-                "accumulation_zones": "identified",
-                "distribution_zones": "minimal",
-                "explanation": "Accumulation and distribution patterns show how different holder groups are positioning themselves over time."
-            }
-        }
+        holder_metrics = _HOLDER_METRICS
         
         behavior_insights = self._analyze_holder_patterns(holder_metrics)
         
@@ -175,12 +375,7 @@ class OnChainAnalyzer:
             "behavioral_insights": behavior_insights,
             "market_maturity": self._assess_market_maturity(holder_metrics),
             "risk_indicators": self._identify_holder_risks(holder_metrics),
-            "educational_context": [
-                "Holder behavior provides insights into market psychology",
-                "Distribution patterns can indicate market structure changes",
-                "Long-term holder accumulation often signals conviction",
-                "Whale activity can significantly impact market dynamics"
-            ]
+            "educational_context": _HOLDER_CONTEXT
         }
     
     def _analyze_transaction_metrics(self) -> Dict[str, Any]:
@@ -190,32 +385,7 @@ class OnChainAnalyzer:
         Returns:
             Dictionary with transaction metrics analysis
         """
-        transaction_metrics = {
-            "transaction_volume": {
-                "daily_volume": "stable",
-                "volume_trend": "sideways",
-                "value_transferred": "moderate",
-                "explanation": "Transaction volume measures the total value being moved on-chain, reflecting economic activity and network utilization."
-            },
-            "transaction_count": {
-                "daily_count": "stable",
-                "count_trend": "slightly_increasing",
-                "average_transaction_size": "decreasing",
-                "explanation": "Transaction count shows network usage frequency, while average size can indicate usage patterns and efficiency."
-            },
-            "transaction_fees": {
-                "average_fee": "moderate",
-                "fee_trend": "stable",
-                "fee_pressure": "low",
-                "explanation": "Transaction fees reflect network demand and can influence user behavior, especially for smaller transactions."
-            },
-            "transaction_types": {
-                "simple_transfers": "majority",
-                "smart_contract_interactions": "growing",
-                "exchange_transactions": "stable",
-                "explanation": "Transaction type analysis shows how the network is being used and what activities drive demand."
-            }
-        }
+        transaction_metrics = _TRANSACTION_METRICS
         
         transaction_insights = self._analyze_transaction_patterns(transaction_metrics)
         
@@ -224,12 +394,7 @@ class OnChainAnalyzer:
             "transaction_insights": transaction_insights,
             "efficiency_metrics": self._analyze_efficiency(transaction_metrics),
             "economic_activity": self._assess_economic_activity(transaction_metrics),
-            "educational_notes": [
-                "Transaction metrics provide insights into real economic activity",
-                "Fee analysis helps understand network congestion and user costs",
-                "Transaction types reveal how the network is being utilized",
-                "Volume patterns can indicate market sentiment and activity"
-            ]
+            "educational_notes": _TRANSACTION_NOTES
         }
     
     def _analyze_network_health(self) -> Dict[str, Any]:
@@ -239,32 +404,7 @@ class OnChainAnalyzer:
         Returns:
             Dictionary with network health analysis
         """
-        health_metrics = {
-            "network_security": {
-                "hash_rate": "stable",  # For PoW networks
-                "staking_participation": "healthy",  # For PoS networks
-                "decentralization_level": "good",
-                "explanation": "Network security metrics show how robust and resilient the network is against attacks and centralization."
-            },
-            "network_performance": {
-                "block_time_consistency": "stable",
-                "confirmation_time": "normal",
-                "network_latency": "acceptable",
-                "explanation": "Performance metrics indicate how well the network is functioning and providing reliable service to users."
-            },
-            "development_activity": {
-                "developer_contribution": "active",
-                "code_updates": "regular",
-                "ecosystem_growth": "expanding",
-                "explanation": "Development activity shows the long-term viability and innovation capacity of the network."
-            },
-            "ecosystem_metrics": {
-                "node_count": "stable",
-                "client_diversity": "good",
-                "geographic_distribution": "diverse",
-                "explanation": "Ecosystem metrics indicate network decentralization and resilience against single points of failure."
-            }
-        }
+        health_metrics = _HEALTH_METRICS
         
         health_assessment = self._assess_network_vitality(health_metrics)
         
@@ -273,12 +413,7 @@ class OnChainAnalyzer:
             "overall_health": health_assessment,
             "security_analysis": self._analyze_security_posture(health_metrics),
             "sustainability_factors": self._assess_sustainability(health_metrics),
-            "educational_insights": [
-                "Network health is fundamental to long-term viability",
-                "Security metrics ensure network integrity and user trust",
-                "Development activity indicates ongoing innovation and maintenance",
-                "Ecosystem diversity contributes to network resilience"
-            ]
+            "educational_insights": _HEALTH_INSIGHTS
         }
     
     def _generate_onchain_insights(
@@ -287,7 +422,7 @@ class OnChainAnalyzer:
         holders: Dict[str, Any],
         transactions: Dict[str, Any],
         health: Dict[str, Any]
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
         Generate key insights from on-chain analysis.
         
@@ -298,7 +433,7 @@ class OnChainAnalyzer:
             health: Network health analysis
             
         Returns:
-            List of key insights
+            Tuple of key insights
         """
         insights = []
         
@@ -317,7 +452,7 @@ class OnChainAnalyzer:
         # Transaction insights
         if transactions["economic_activity"]["trend"] == "increasing":
             insights.append("Rising transaction volume indicates growing economic activity on-chain")
-        elif transactions["efficiency_metrics"]["fee_pressure"] == "high":
+        elif transactions["efficiency_metrics"].get("fee_pressure") == "high":
             insights.append("High fee pressure may constrain smaller transactions and affect user experience")
         
         # Health insights
@@ -326,7 +461,7 @@ class OnChainAnalyzer:
         elif health["overall_health"]["status"] == "concerning":
             insights.append("Network health concerns may require attention for sustainable development")
         
-        return insights
+        return tuple(insights)
     
     def _assess_network_conditions(
         self,
@@ -355,8 +490,12 @@ class OnChainAnalyzer:
         }
         
         # Determine overall conditions
-        positive_factors = sum(1 for v in condition_factors.values() if v in ["growing", "accumulation", "healthy", "strong"])
-        negative_factors = sum(1 for v in condition_factors.values() if v in ["declining", "distribution", "unhealthy", "weak"])
+        positive_factors = negative_factors = 0
+        for value in condition_factors.values():
+            if value in _POSITIVE_VALUES:
+                positive_factors += 1
+            elif value in _NEGATIVE_VALUES:
+                negative_factors += 1
         
         if positive_factors > negative_factors:
             overall_status = "positive"
@@ -373,132 +512,80 @@ class OnChainAnalyzer:
             "outlook": "stable"
         }
     
-    def _assess_activity_trends(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_activity_trends(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess overall activity trends."""
-        return {
-            "trend": "stable",
-            "strength": "moderate",
-            "sustainability": "likely_sustainable"
-        }
+        return _ACTIVITY_ASSESSMENT
     
-    def _identify_growth_indicators(self, metrics: Dict[str, Any]) -> List[str]:
+    def _identify_growth_indicators(self, metrics: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify growth indicators from activity metrics."""
-        return [
-            "New address creation shows user acquisition",
-            "DApp activity demonstrates utility beyond speculation",
-            "Network utilization indicates demand for services"
-        ]
+        return _GROWTH_INDICATORS
     
-    def _analyze_usage_patterns(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_usage_patterns(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Analyze usage patterns."""
-        return {
-            "primary_usage": "transfers_and_dapps",
-            "user_engagement": "moderate",
-            "retention_indicators": "positive"
-        }
+        return _USAGE_PATTERNS
     
-    def _analyze_holder_patterns(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_holder_patterns(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Analyze holder behavior patterns."""
-        return {
-            "long_term_trend": "accumulation",
-            "distribution_pattern": "stable",
-            "overall_sentiment": "cautiously_optimistic"
-        }
+        return _HOLDER_PATTERNS
     
     def _assess_market_maturity(self, metrics: Dict[str, Any]) -> str:
         """Assess market maturity based on holder metrics."""
         return "maturing"
     
-    def _identify_holder_risks(self, metrics: Dict[str, Any]) -> List[str]:
+    def _identify_holder_risks(self, metrics: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify potential risks from holder metrics."""
-        return [
-            "Concentration risk if whale holdings increase",
-            "Liquidity risk if long-term holders start distributing",
-            "Volatility risk if short-term holders dominate"
-        ]
+        return _HOLDER_RISKS
     
-    def _analyze_transaction_patterns(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_transaction_patterns(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Analyze transaction patterns."""
-        return {
-            "volume_trend": "stable",
-            "efficiency_trend": "improving",
-            "usage_evolution": "maturing"
-        }
+        return _TRANSACTION_PATTERNS
     
-    def _analyze_efficiency(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_efficiency(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Analyze transaction efficiency."""
-        return {
-            "fee_efficiency": "good",
-            "throughput_utilization": "moderate",
-            "cost_effectiveness": "reasonable"
-        }
+        return _EFFICIENCY_METRICS
     
-    def _assess_economic_activity(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_economic_activity(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess economic activity level."""
-        return {
-            "status": "moderate",
-            "trend": "stable",
-            "quality": "improving"
-        }
+        return _ECONOMIC_ACTIVITY
     
-    def _assess_network_vitality(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_network_vitality(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Assess overall network vitality."""
-        return {
-            "status": "healthy",
-            "strength": "strong",
-            "resilience": "good"
-        }
+        return _NETWORK_VITALITY
     
-    def _analyze_security_posture(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_security_posture(self, metrics: Dict[str, Any]) -> Mapping[str, Any]:
         """Analyze network security posture."""
-        return {
-            "overall_security": "strong",
-            "attack_resistance": "high",
-            "decentralization": "adequate"
-        }
+        return _SECURITY_POSTURE
     
-    def _assess_sustainability(self, metrics: Dict[str, Any]) -> List[str]:
+    def _assess_sustainability(self, metrics: Dict[str, Any]) -> Tuple[str, ...]:
         """Assess sustainability factors."""
-        return [
-            "Active development ensures continuous improvement",
-            "Diverse ecosystem reduces single points of failure",
-            "Healthy economic incentives support network security"
-        ]
+        return _SUSTAINABILITY_FACTORS
     
-    def _identify_network_strengths(self, factors: Dict[str, Any]) -> List[str]:
+    def _identify_network_strengths(self, factors: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify network strengths."""
         strengths = []
         for factor, value in factors.items():
-            if value in ["growing", "accumulation", "healthy", "strong"]:
-                strengths.append(f"{factor.replace('_', ' ').title()}: {value}")
-        return strengths
+            if value in _POSITIVE_VALUES:
+                strengths.append(f"{_factor_label(factor)}: {value}")
+        return tuple(strengths)
     
-    def _identify_network_concerns(self, factors: Dict[str, Any]) -> List[str]:
+    def _identify_network_concerns(self, factors: Dict[str, Any]) -> Tuple[str, ...]:
         """Identify network concerns."""
         concerns = []
         for factor, value in factors.items():
-            if value in ["declining", "distribution", "unhealthy", "weak"]:
-                concerns.append(f"{factor.replace('_', ' ').title()}: {value}")
-        return concerns
+            if value in _NEGATIVE_VALUES:
+                concerns.append(f"{_factor_label(factor)}: {value}")
+        return tuple(concerns)
     
-    def _get_educational_explanations(self) -> List[str]:
+    def _get_educational_explanations(self) -> Tuple[str, ...]:
         """Get educational explanations about on-chain analysis."""
-        return [
-            "On-chain metrics provide transparent insights into network activity",
-            "Blockchain data allows for unprecedented market analysis capabilities",
-            "Network fundamentals often diverge from price action in short term",
-            "Long-term value correlates with network utility and adoption",
-            "On-chain analysis complements traditional market analysis methods",
-            "Understanding blockchain metrics helps assess project fundamentals"
-        ]
+        return _EDUCATIONAL_EXPLANATIONS
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        return utc_timestamp()
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
-        """Generate error response."""
+        """Generate error response (used by callers that run analyze() with a fallback)."""
         return {
             "error": True,
             "message": f"On-chain analysis failed: {error_message}",
@@ -0,0 +1,67 @@
+"""
+Read-only containers for MacroChain AI.
+
+Static analysis sections are built once and shared by every result. These
+helpers make that sharing safe without giving up JSON serialization: unlike
+``types.MappingProxyType``, a ``ReadOnlyDict`` is still a ``dict`` to json,
+orjson, pydantic and ``copy.deepcopy``.
+"""
+
+from typing import Any, Dict, NoReturn
+import copy
+
+
+class ReadOnlyDict(dict):
+    """
+    A dict that rejects mutation.
+
+    Copies (``copy.copy``, ``copy.deepcopy``, ``.copy()``, pickling) produce
+    ordinary mutable dicts, so callers that need to edit a result can do so
+    on their own copy.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("ReadOnlyDict does not support item assignment")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self) -> Dict[Any, Any]:
+        """Return a shallow, mutable copy."""
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyDict({dict.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to ReadOnlyDict and lists to tuples.
+
+    Args:
+        value: Analysis data built from dicts, lists and scalars
+
+    Returns:
+        Equivalent read-only structure
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
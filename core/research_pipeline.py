@@ -5,14 +5,21 @@ This module implements a structured, deterministic research pipeline that
 orchestrates comprehensive crypto market analysis across multiple dimensions.
 """
 
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import asyncio
 import logging
+import time
+import uuid
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain, islice
 from .macro import MacroAnalyzer
 from .sentiment import SentimentAnalyzer
 from .onchain import OnChainAnalyzer
 from .market_structure import MarketStructureAnalyzer
+from .clock import utc_timestamp
+from .readonly import freeze
 
 
 logger = logging.getLogger(__name__)
@@ -27,9 +34,10 @@ class ResearchPhase(Enum):
     SYNTHESIS = "synthesis"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ResearchContext:
     """Context for research pipeline execution."""
+    __slots__ = ("query", "assets", "timestamp", "research_id", "assumptions", "limitations")
     query: str
     assets: List[str]
     timestamp: str
@@ -38,9 +46,10 @@ class ResearchContext:
     limitations: List[str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class PhaseResult:
     """Result from a research pipeline phase."""
+    __slots__ = ("phase", "data", "confidence", "assumptions", "limitations", "execution_time")
     phase: ResearchPhase
     data: Dict[str, Any]
     confidence: str
@@ -49,6 +58,113 @@ class PhaseResult:
     execution_time: float
 
 
+@dataclass(frozen=True)
+class PhaseSummary:
+    """An analysis phase's result, with the values synthesis reads resolved once."""
+    __slots__ = (
+        "name", "present", "ok", "headline", "state",
+        "confidence", "insights", "assumptions", "limitations"
+    )
+    name: str
+    present: bool  # The phase returned any data, even an error
+    ok: bool  # The phase returned data without an error
+    headline: Mapping[str, Any]  # The phase's overall assessment section
+    state: str
+    confidence: str
+    insights: Sequence[str]  # Empty unless ok
+    assumptions: Sequence[str]  # Empty unless ok
+    limitations: Sequence[str]  # Empty unless ok
+
+
+# Synthesis inputs: (summary name, headline section, state key), in phase order
+_PHASE_HEADLINES = (
+    ("macro", "overall_conditions", "overall"),
+    ("sentiment", "overall_sentiment", "overall_sentiment"),
+    ("onchain", "network_conditions", "overall_status"),
+    ("structure", "market_phase", "overall_bias"),
+)
+
+_RESEARCH_DISCLAIMER = (
+    "This research report is for educational and informational purposes only. "
+    "It does not constitute financial advice, investment recommendations, or trading signals. "
+    "Cryptocurrency markets are highly volatile and risky. Always conduct your own research "
+    "and consult with qualified financial professionals before making any investment decisions."
+)
+
+# Number of insights carried into the synthesis as key insights
+_KEY_INSIGHT_LIMIT = 10
+
+# Research-wide assumptions and limitations, listed before the per-phase ones
+_DEFAULT_ASSUMPTIONS = (
+    "Analysis is based on conceptual and educational frameworks",
+    "Market conditions are dynamic and may change rapidly",
+    "Historical patterns may not repeat in future conditions",
+    "Multiple factors influence cryptocurrency market dynamics",
+)
+
+_DEFAULT_LIMITATIONS = (
+    "Analysis does not use real-time market data",
+    "Educational focus limits predictive capabilities",
+    "Market complexity exceeds analytical frameworks",
+    "Unforeseen events can invalidate current analysis",
+)
+
+# Phase states that count towards a positive or negative overall state
+_POSITIVE_STATES = frozenset({"positive", "supportive", "strong"})
+_NEGATIVE_STATES = frozenset({"negative", "challenging", "weak"})
+
+# Correlation rules: (predicate(macro, sentiment, onchain, structure), correlation)
+_CORRELATION_RULES = (
+    (lambda macro, sentiment, onchain, structure: (
+        macro.headline.get("overall") == "challenging" and
+        sentiment.headline.get("overall_sentiment") == "negative"),
+     freeze({
+         "type": "macro_sentiment",
+         "phases": ["macro", "sentiment"],
+         "observation": "Challenging macro conditions align with negative sentiment",
+         "strength": "strong",
+         "significance": "high"
+     })),
+    (lambda macro, sentiment, onchain, structure: (
+        onchain.headline.get("overall_status") == "positive" and
+        structure.headline.get("trend_strength") == "strong"),
+     freeze({
+         "type": "onchain_structure",
+         "phases": ["onchain", "market_structure"],
+         "observation": "Strong network fundamentals support robust market structure",
+         "strength": "moderate",
+         "significance": "medium"
+     })),
+    (lambda macro, sentiment, onchain, structure: (
+        sentiment.headline.get("overall_sentiment") == "neutral" and
+        structure.headline.get("phase") == "range"),
+     freeze({
+         "type": "sentiment_structure",
+         "phases": ["sentiment", "market_structure"],
+         "observation": "Neutral sentiment coincides with range-bound market structure",
+         "strength": "moderate",
+         "significance": "medium"
+     })),
+)
+
+
+def _summarize(name: str, data: Dict[str, Any], section: str, state_key: str) -> PhaseSummary:
+    """Resolve the nested values synthesis needs from one phase's data."""
+    ok = bool(data) and not data.get("error")
+    headline = data.get(section, {})
+    return PhaseSummary(
+        name=name,
+        present=bool(data),
+        ok=ok,
+        headline=headline,
+        state=headline.get(state_key, "neutral"),
+        confidence=data.get("confidence_level", "moderate"),
+        insights=data.get("insights", []) if ok else (),
+        assumptions=data.get("assumptions", []) if ok else (),
+        limitations=data.get("limitations", []) if ok else ()
+    )
+
+
 class ResearchPipeline:
     """
     Structured research pipeline for comprehensive crypto market analysis.
@@ -58,13 +174,37 @@ class ResearchPipeline:
     strict educational focus and risk awareness.
     """
     
-    def __init__(self):
-        """Initialize the research pipeline."""
+    # Default seconds an analysis phase may run (not counting time queued
+    # for a worker) before it is reported as failed
+    PHASE_TIMEOUT_S = 30.0
+    
+    def __init__(
+        self,
+        phase_timeout: float = PHASE_TIMEOUT_S
+    ):
+        """
+        Initialize the research pipeline.
+        
+        Args:
+            phase_timeout: Seconds an analysis phase may take, queueing for
+                a worker included, before it is reported as failed; a call
+                that already started keeps its worker until the analyzer
+                returns
+        """
+        self.phase_timeout = phase_timeout
         self.macro_analyzer = MacroAnalyzer()
         self.sentiment_analyzer = SentimentAnalyzer()
         self.onchain_analyzer = OnChainAnalyzer()
         self.market_structure_analyzer = MarketStructureAnalyzer()
         
+        # Analysis phase -> analyzer that executes it
+        self._phase_dispatch: Dict[ResearchPhase, Any] = {
+            ResearchPhase.MACRO: self.macro_analyzer,
+            ResearchPhase.SENTIMENT: self.sentiment_analyzer,
+            ResearchPhase.ONCHAIN: self.onchain_analyzer,
+            ResearchPhase.MARKET_STRUCTURE: self.market_structure_analyzer
+        }
+        
         self.pipeline_phases = [
             ResearchPhase.MACRO,
             ResearchPhase.SENTIMENT,
@@ -72,6 +212,14 @@ class ResearchPipeline:
             ResearchPhase.MARKET_STRUCTURE,
             ResearchPhase.SYNTHESIS
         ]
+        
+        # The analysis phases are independent; only synthesis needs their results
+        self.parallel_phases = [phase for phase in self.pipeline_phases if phase != ResearchPhase.SYNTHESIS]
+        self._pool = ThreadPoolExecutor(
+            max_workers=len(self.parallel_phases), thread_name_prefix="research"
+        )
+        # Runs the pipeline's own event loop for synchronous callers whose thread already has one
+        self._sync_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="research-sync")
     
     def execute_research(
         self, 
@@ -81,6 +229,12 @@ class ResearchPipeline:
         """
         Execute the complete research pipeline.
         
+        This is a blocking wrapper around execute_research_async for
+        synchronous callers. Coroutines should await execute_research_async
+        instead; if this is called from a thread whose event loop is running,
+        the pipeline runs on a private loop in a helper thread and the calling
+        loop is blocked until it finishes.
+        
         Args:
             query: Research query to analyze
             assets: List of assets to focus on (optional)
@@ -88,57 +242,192 @@ class ResearchPipeline:
         Returns:
             Complete research results with all phases
         """
+        return self._run_blocking(self.execute_research_async, query, assets)
+    
+    async def execute_research_async(
+        self, 
+        query: str, 
+        assets: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the complete research pipeline without blocking the event loop.
+        
+        The macro, sentiment, on-chain and market structure phases run
+        concurrently on the pipeline's worker threads; synthesis runs once
+        they have all completed.
+        
+        Args:
+            query: Research query to analyze
+            assets: List of assets to focus on (optional)
+            
+        Returns:
+            Complete research results with all phases
+        """
+        return await self._execute_research(self._new_context(query, assets))
+    
+    def execute_research_batch(
+        self,
+        queries: Sequence[str],
+        assets_list: Optional[Sequence[Optional[List[str]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the research pipeline for many queries at once.
+        
+        This is a blocking wrapper around execute_research_batch_async; like
+        execute_research, it also works from a thread with a running event
+        loop, but blocks that loop.
+        
+        Args:
+            queries: Research queries to analyze
+            assets_list: Assets per query, parallel to queries (optional)
+            
+        Returns:
+            One research report per query, in order
+            
+        Raises:
+            ValueError: If assets_list and queries differ in length
+        """
+        return self._run_blocking(self.execute_research_batch_async, queries, assets_list)
+    
+    async def execute_research_batch_async(
+        self,
+        queries: Sequence[str],
+        assets_list: Optional[Sequence[Optional[List[str]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the research pipeline for many queries without blocking the event loop.
+        
+        Each analysis phase makes one call to its analyzer's analyze_batch,
+        when it has one, instead of one analyze call per query; synthesis
+        then runs per query.
+        
+        Args:
+            queries: Research queries to analyze
+            assets_list: Assets per query, parallel to queries (optional)
+            
+        Returns:
+            One research report per query, in order
+            
+        Raises:
+            ValueError: If assets_list and queries differ in length
+        """
+        if assets_list is not None and len(assets_list) != len(queries):
+            raise ValueError("assets_list must have one entry per query")
+        if assets_list is None:
+            assets_list = [None] * len(queries)
+        if not queries:
+            return []
+        
+        contexts = [self._new_context(query, assets) for query, assets in zip(queries, assets_list)]
+        return await self._execute_research_batch(contexts)
+    
+    def _run_blocking(self, coroutine_function: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run a pipeline coroutine to completion from synchronous code."""
         try:
-            import time
-            import uuid
-            from datetime import datetime
-            
-            logger.info(f"Starting research pipeline for query: {query}")
-            
-            # Initialize research context
-            context = ResearchContext(
-                query=query,
-                assets=assets or ["bitcoin", "ethereum"],
-                timestamp=datetime.utcnow().isoformat() + "Z",
-                research_id=str(uuid.uuid4()),
-                assumptions=[],
-                limitations=[]
-            )
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine_function(*args))
+        
+        # asyncio.run cannot nest inside a running loop, so use a private loop on the helper thread
+        logger.warning(
+            "Blocking research pipeline call from a running event loop; await %s instead",
+            coroutine_function.__name__
+        )
+        return self._sync_runner.submit(asyncio.run, coroutine_function(*args)).result()
+    
+    def _new_context(self, query: str, assets: Optional[List[str]]) -> ResearchContext:
+        """Create the context for a new research run."""
+        return ResearchContext(
+            query=query,
+            assets=assets or ["bitcoin", "ethereum"],
+            timestamp=utc_timestamp(),
+            research_id=str(uuid.uuid4()),
+            assumptions=[],
+            limitations=[]
+        )
+    
+    async def _execute_research(self, context: ResearchContext) -> Dict[str, Any]:
+        """Run every pipeline phase and compile the research report."""
+        try:
+            logger.info("Starting research pipeline for query: %s", context.query)
             
-            # Execute pipeline phases
-            phase_results = []
-            total_start_time = time.time()
+            # Execute the analysis phases concurrently, then synthesize
+            total_start_time = time.perf_counter()
             
-            for phase in self.pipeline_phases:
-                if phase == ResearchPhase.SYNTHESIS:
-                    result = self._execute_synthesis_phase(context, phase_results)
-                else:
-                    result = self._execute_analysis_phase(phase, context)
-                
-                phase_results.append(result)
-                logger.info(f"Completed phase: {phase.value}")
+            phase_results = await asyncio.gather(
+                *(self._execute_analysis_phase(phase, context) for phase in self.parallel_phases)
+            )
+            results_map = self._synthesize_phase_results(context, phase_results)
             
-            total_execution_time = time.time() - total_start_time
+            total_execution_time = time.perf_counter() - total_start_time
             
             # Compile final research report
             research_report = self._compile_research_report(
-                context, phase_results, total_execution_time
+                context, results_map, total_execution_time
             )
             
-            logger.info(f"Research pipeline completed in {total_execution_time:.2f}s")
+            logger.info("Research pipeline completed in %.2fs", total_execution_time)
             return research_report
             
         except Exception as e:
-            logger.error(f"Research pipeline failed: {str(e)}")
+            logger.error("Research pipeline failed: %s", e)
             return self._error_response(context, str(e))
     
-    def _execute_analysis_phase(
+    async def _execute_research_batch(self, contexts: List[ResearchContext]) -> List[Dict[str, Any]]:
+        """Run every pipeline phase for a batch and compile one report per context."""
+        try:
+            logger.info("Starting research pipeline for %d queries", len(contexts))
+            
+            total_start_time = time.perf_counter()
+            
+            # One list of results per phase, each with one entry per context
+            phase_batches = await asyncio.gather(
+                *(self._execute_analysis_phase_batch(phase, contexts) for phase in self.parallel_phases)
+            )
+            results_maps = [
+                self._synthesize_phase_results(context, phase_results)
+                for context, phase_results in zip(contexts, zip(*phase_batches))
+            ]
+            
+            total_execution_time = time.perf_counter() - total_start_time
+            
+            research_reports = [
+                self._compile_research_report(context, results_map, total_execution_time)
+                for context, results_map in zip(contexts, results_maps)
+            ]
+            
+            logger.info("Research pipeline batch completed in %.2fs", total_execution_time)
+            return research_reports
+            
+        except Exception as e:
+            logger.error("Research pipeline batch failed: %s", e)
+            return [self._error_response(context, str(e)) for context in contexts]
+    
+    def _synthesize_phase_results(
+        self,
+        context: ResearchContext,
+        phase_results: Sequence[PhaseResult]
+    ) -> Dict[ResearchPhase, PhaseResult]:
+        """Index the analysis phase results and add the synthesis result."""
+        results_map = {result.phase: result for result in phase_results}
+        results_map[ResearchPhase.SYNTHESIS] = self._execute_synthesis_phase(context, results_map)
+        logger.info("Completed phase: %s", ResearchPhase.SYNTHESIS.value)
+        return results_map
+    
+    def _phase_analyzer(self, phase: ResearchPhase) -> Any:
+        """Analyzer that executes the given analysis phase."""
+        analyzer = self._phase_dispatch.get(phase)
+        if analyzer is None:
+            raise ValueError(f"Unknown analysis phase: {phase}")
+        return analyzer
+    
+    async def _execute_analysis_phase(
         self, 
         phase: ResearchPhase, 
         context: ResearchContext
     ) -> PhaseResult:
         """
-        Execute a single analysis phase.
+        Execute a single analysis phase on a worker thread.
         
         Args:
             phase: Research phase to execute
@@ -147,74 +436,150 @@ class ResearchPipeline:
         Returns:
             Phase execution result
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            if phase == ResearchPhase.MACRO:
-                data = self.macro_analyzer.analyze(context.query, context.assets)
-            elif phase == ResearchPhase.SENTIMENT:
-                data = self.sentiment_analyzer.analyze(context.query, context.assets)
-            elif phase == ResearchPhase.ONCHAIN:
-                data = self.onchain_analyzer.analyze(context.query, context.assets)
-            elif phase == ResearchPhase.MARKET_STRUCTURE:
-                data = self.market_structure_analyzer.analyze(context.query, context.assets)
-            else:
-                raise ValueError(f"Unknown analysis phase: {phase}")
-            
-            execution_time = time.time() - start_time
+            analyzer = self._phase_analyzer(phase)
             
-            return PhaseResult(
-                phase=phase,
-                data=data,
-                confidence=data.get("confidence_level", "moderate"),
-                assumptions=data.get("assumptions", []),
-                limitations=data.get("limitations", []),
-                execution_time=execution_time
-            )
+            data = await self._run_on_worker(analyzer.analyze, context.query, context.assets)
+            logger.info("Completed phase: %s", phase.value)
+            
+            return self._analysis_result(phase, data, time.perf_counter() - start_time)
             
+        except asyncio.TimeoutError:
+            reason = f"timed out after {self.phase_timeout}s"
+            logger.warning("Phase %s %s", phase.value, reason)
+            return self._analysis_failure(phase, reason, time.perf_counter() - start_time)
         except Exception as e:
-            logger.error(f"Phase {phase.value} failed: {str(e)}")
-            return PhaseResult(
-                phase=phase,
-                data={"error": str(e)},
-                confidence="low",
-                assumptions=[f"Analysis failed: {str(e)}"],
-                limitations=["Phase execution error"],
-                execution_time=time.time() - start_time
+            logger.error("Phase %s failed: %s", phase.value, e)
+            return self._analysis_failure(phase, str(e), time.perf_counter() - start_time)
+    
+    async def _execute_analysis_phase_batch(
+        self,
+        phase: ResearchPhase,
+        contexts: List[ResearchContext]
+    ) -> List[PhaseResult]:
+        """
+        Execute a single analysis phase for a batch of contexts.
+        
+        Analyzers with an analyze_batch method are called once for the whole
+        batch, and every result records that call's duration. Other analyzers
+        run once per context, as in execute_research.
+        
+        Args:
+            phase: Research phase to execute
+            contexts: Research contexts
+            
+        Returns:
+            Phase execution results, one per context
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            analyzer = self._phase_analyzer(phase)
+            analyze_batch = getattr(analyzer, "analyze_batch", None)
+            if analyze_batch is None:
+                return list(await asyncio.gather(
+                    *(self._execute_analysis_phase(phase, context) for context in contexts)
+                ))
+            
+            batch = await self._run_on_worker(
+                analyze_batch,
+                [context.query for context in contexts],
+                [context.assets for context in contexts]
             )
+            logger.info("Completed phase: %s (%d queries)", phase.value, len(contexts))
+            
+            execution_time = time.perf_counter() - start_time
+            return [self._analysis_result(phase, data, execution_time) for data in batch]
+            
+        except asyncio.TimeoutError:
+            reason = f"timed out after {self.phase_timeout}s"
+            logger.warning("Phase %s %s", phase.value, reason)
+        except Exception as e:
+            reason = str(e)
+            logger.error("Phase %s failed: %s", phase.value, e)
+        
+        execution_time = time.perf_counter() - start_time
+        return [self._analysis_failure(phase, reason, execution_time) for _ in contexts]
+    
+    async def _run_on_worker(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run an analyzer call on the phase pool, bounded by the phase timeout.
+        
+        The timeout counts from submission, so it bounds time spent queued
+        for a worker as well as the call itself; a call still queued at the
+        deadline is dropped without ever running. A call that times out
+        while running cannot be interrupted: it keeps its worker busy until
+        the analyzer returns, and its result is discarded.
+        
+        Args:
+            fn: Analyzer method to call
+            *args: Positional arguments for fn
+            
+        Returns:
+            fn's result
+            
+        Raises:
+            asyncio.TimeoutError: If the call has not finished within
+                phase_timeout of being submitted
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool, fn, *args)
+        return await asyncio.wait_for(future, self.phase_timeout)
+    
+    def _analysis_result(self, phase: ResearchPhase, data: Dict[str, Any], execution_time: float) -> PhaseResult:
+        """Wrap an analyzer result as a phase result."""
+        return PhaseResult(
+            phase=phase,
+            data=data,
+            confidence=data.get("confidence_level", "moderate"),
+            assumptions=data.get("assumptions", []),
+            limitations=data.get("limitations", []),
+            execution_time=execution_time
+        )
+    
+    def _analysis_failure(self, phase: ResearchPhase, reason: str, execution_time: float) -> PhaseResult:
+        """Phase result for an analysis phase that raised or timed out."""
+        return PhaseResult(
+            phase=phase,
+            data={"error": reason},
+            confidence="low",
+            assumptions=[f"Analysis failed: {reason}"],
+            limitations=["Phase execution error"],
+            execution_time=execution_time
+        )
     
     def _execute_synthesis_phase(
         self, 
         context: ResearchContext, 
-        phase_results: List[PhaseResult]
+        results_map: Dict[ResearchPhase, PhaseResult]
     ) -> PhaseResult:
         """
         Execute synthesis phase to combine all analyses.
         
         Args:
             context: Research context
-            phase_results: Results from previous phases
+            results_map: Results from previous phases, by phase
             
         Returns:
             Synthesis phase result
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Extract data from previous phases
-            macro_data = self._get_phase_data(phase_results, ResearchPhase.MACRO)
-            sentiment_data = self._get_phase_data(phase_results, ResearchPhase.SENTIMENT)
-            onchain_data = self._get_phase_data(phase_results, ResearchPhase.ONCHAIN)
-            structure_data = self._get_phase_data(phase_results, ResearchPhase.MARKET_STRUCTURE)
+            macro_data = results_map[ResearchPhase.MACRO].data
+            sentiment_data = results_map[ResearchPhase.SENTIMENT].data
+            onchain_data = results_map[ResearchPhase.ONCHAIN].data
+            structure_data = results_map[ResearchPhase.MARKET_STRUCTURE].data
             
             # Perform synthesis
             synthesis_data = self._synthesize_analyses(
                 macro_data, sentiment_data, onchain_data, structure_data, context
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             return PhaseResult(
                 phase=ResearchPhase.SYNTHESIS,
@@ -226,23 +591,16 @@ class ResearchPipeline:
             )
             
         except Exception as e:
-            logger.error(f"Synthesis phase failed: {str(e)}")
+            logger.error("Synthesis phase failed: %s", e)
             return PhaseResult(
                 phase=ResearchPhase.SYNTHESIS,
                 data={"error": str(e)},
                 confidence="low",
                 assumptions=[f"Synthesis failed: {str(e)}"],
                 limitations=["Synthesis execution error"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
-    def _get_phase_data(self, phase_results: List[PhaseResult], phase: ResearchPhase) -> Dict[str, Any]:
-        """Get data from a specific phase result."""
-        for result in phase_results:
-            if result.phase == phase:
-                return result.data
-        return {}
-    
     def _synthesize_analyses(
         self,
         macro: Dict[str, Any],
@@ -264,119 +622,57 @@ class ResearchPipeline:
         Returns:
             Synthesized analysis data
         """
-        # Collect all insights
-        all_insights = []
-        
-        # Extract insights from each phase
-        if macro and not macro.get("error"):
-            all_insights.extend(macro.get("insights", []))
-        
-        if sentiment and not sentiment.get("error"):
-            all_insights.extend(sentiment.get("insights", []))
-        
-        if onchain and not onchain.get("error"):
-            all_insights.extend(onchain.get("insights", []))
+        # Resolve each phase's nested values once
+        summaries = tuple(
+            _summarize(name, data, section, state_key)
+            for (name, section, state_key), data
+            in zip(_PHASE_HEADLINES, (macro, sentiment, onchain, structure))
+        )
         
-        if structure and not structure.get("error"):
-            all_insights.extend(structure.get("insights", []))
+        # Count all insights but only materialize the top 10
+        total_insights = sum(len(summary.insights) for summary in summaries)
+        key_insights = list(islice(
+            chain.from_iterable(summary.insights for summary in summaries), _KEY_INSIGHT_LIMIT
+        ))
         
         # Identify cross-phase correlations
-        correlations = self._identify_cross_phase_correlations(
-            macro, sentiment, onchain, structure
-        )
+        correlations = self._identify_cross_phase_correlations(summaries)
         
         # Assess overall market state
-        market_state = self._assess_overall_market_state(
-            macro, sentiment, onchain, structure
-        )
+        market_state = self._assess_overall_market_state(summaries)
         
         # Compile assumptions and limitations
-        assumptions = self._compile_assumptions(macro, sentiment, onchain, structure)
-        limitations = self._compile_limitations(macro, sentiment, onchain, structure)
+        assumptions, limitations = self._compile_assumptions_and_limitations(summaries)
         
         return {
             "synthesis_type": "comprehensive_market_analysis",
-            "total_insights": len(all_insights),
-            "key_insights": all_insights[:10],  # Top 10 insights
+            "total_insights": total_insights,
+            "key_insights": key_insights,
             "cross_phase_correlations": correlations,
             "overall_market_state": market_state,
-            "research_quality": self._assess_research_quality(macro, sentiment, onchain, structure),
+            "research_quality": self._assess_research_quality(summaries),
             "assumptions": assumptions,
             "limitations": limitations,
-            "confidence_level": self._calculate_overall_confidence(macro, sentiment, onchain, structure)
+            "confidence_level": self._calculate_overall_confidence(summaries)
         }
     
-    def _identify_cross_phase_correlations(
-        self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Identify correlations across different analysis phases."""
-        correlations = []
-        
-        # Macro-Sentiment correlations
-        if (macro.get("overall_conditions", {}).get("overall") == "challenging" and
-            sentiment.get("overall_sentiment", {}).get("overall_sentiment") == "negative"):
-            correlations.append({
-                "type": "macro_sentiment",
-                "phases": ["macro", "sentiment"],
-                "observation": "Challenging macro conditions align with negative sentiment",
-                "strength": "strong",
-                "significance": "high"
-            })
-        
-        # On-Chain-Structure correlations
-        if (onchain.get("network_conditions", {}).get("overall_status") == "positive" and
-            structure.get("market_phase", {}).get("trend_strength") == "strong"):
-            correlations.append({
-                "type": "onchain_structure",
-                "phases": ["onchain", "market_structure"],
-                "observation": "Strong network fundamentals support robust market structure",
-                "strength": "moderate",
-                "significance": "medium"
-            })
-        
-        # Sentiment-Structure correlations
-        if (sentiment.get("overall_sentiment", {}).get("overall_sentiment") == "neutral" and
-            structure.get("market_phase", {}).get("phase") == "range"):
-            correlations.append({
-                "type": "sentiment_structure",
-                "phases": ["sentiment", "market_structure"],
-                "observation": "Neutral sentiment coincides with range-bound market structure",
-                "strength": "moderate",
-                "significance": "medium"
-            })
-        
-        return correlations
+    def _identify_cross_phase_correlations(self, summaries: Sequence[PhaseSummary]) -> List[Mapping[str, Any]]:
+        """Identify correlations across different analysis phases (shared read-only entries)."""
+        return [
+            correlation for predicate, correlation in _CORRELATION_RULES
+            if predicate(*summaries)
+        ]
     
-    def _assess_overall_market_state(
-        self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _assess_overall_market_state(self, summaries: Sequence[PhaseSummary]) -> Dict[str, Any]:
         """Assess overall market state from all phases."""
-        state_indicators = {}
-        
         # Collect state indicators
-        if macro:
-            state_indicators["macro"] = macro.get("overall_conditions", {}).get("overall", "neutral")
-        
-        if sentiment:
-            state_indicators["sentiment"] = sentiment.get("overall_sentiment", {}).get("overall_sentiment", "neutral")
-        
-        if onchain:
-            state_indicators["onchain"] = onchain.get("network_conditions", {}).get("overall_status", "neutral")
-        
-        if structure:
-            state_indicators["structure"] = structure.get("market_phase", {}).get("overall_bias", "neutral")
+        state_indicators = {summary.name: summary.state for summary in summaries if summary.present}
         
         # Determine overall state
-        positive_count = sum(1 for v in state_indicators.values() if v in ["positive", "supportive", "strong"])
-        negative_count = sum(1 for v in state_indicators.values() if v in ["negative", "challenging", "weak"])
+        positive_count = negative_count = 0
+        for state in state_indicators.values():
+            positive_count += state in _POSITIVE_STATES
+            negative_count += state in _NEGATIVE_STATES
         
         if positive_count > negative_count:
             overall_state = "positive"
@@ -397,73 +693,32 @@ class ResearchPipeline:
         dominant = []
         
         for phase, state in state_indicators.items():
-            if state not in ["neutral"]:
+            if state != "neutral":
                 dominant.append(f"{phase.title()}: {state}")
         
         return dominant
     
-    def _compile_assumptions(
+    def _compile_assumptions_and_limitations(
         self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[str]:
-        """Compile assumptions from all phases."""
-        assumptions = [
-            "Analysis is based on conceptual and educational frameworks",
-            "Market conditions are dynamic and may change rapidly",
-            "Historical patterns may not repeat in future conditions",
-            "Multiple factors influence cryptocurrency market dynamics"
-        ]
-        
-        # Add phase-specific assumptions
-        for phase_name, phase_data in [("macro", macro), ("sentiment", sentiment), 
-                                     ("onchain", onchain), ("structure", structure)]:
-            if phase_data and not phase_data.get("error"):
-                phase_assumptions = phase_data.get("assumptions", [])
-                for assumption in phase_assumptions:
-                    assumptions.append(f"{phase_name.title()}: {assumption}")
-        
-        return assumptions
-    
-    def _compile_limitations(
-        self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> List[str]:
-        """Compile limitations from all phases."""
-        limitations = [
-            "Analysis does not use real-time market data",
-            "Educational focus limits predictive capabilities",
-            "Market complexity exceeds analytical frameworks",
-            "Unforeseen events can invalidate current analysis"
-        ]
-        
-        # Add phase-specific limitations
-        for phase_name, phase_data in [("macro", macro), ("sentiment", sentiment), 
-                                     ("onchain", onchain), ("structure", structure)]:
-            if phase_data and not phase_data.get("error"):
-                phase_limitations = phase_data.get("limitations", [])
-                for limitation in phase_limitations:
-                    limitations.append(f"{phase_name.title()}: {limitation}")
-        
-        return limitations
+        summaries: Sequence[PhaseSummary]
+    ) -> Tuple[List[str], List[str]]:
+        """Compile assumptions and limitations from all phases in one pass."""
+        assumptions = list(_DEFAULT_ASSUMPTIONS)
+        limitations = list(_DEFAULT_LIMITATIONS)
+        
+        # Add phase-specific assumptions and limitations
+        for summary in summaries:
+            label = summary.name.title()
+            assumptions.extend(f"{label}: {assumption}" for assumption in summary.assumptions)
+            limitations.extend(f"{label}: {limitation}" for limitation in summary.limitations)
+        
+        return assumptions, limitations
     
-    def _assess_research_quality(
-        self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _assess_research_quality(self, summaries: Sequence[PhaseSummary]) -> Dict[str, Any]:
         """Assess overall research quality."""
-        successful_phases = sum(1 for data in [macro, sentiment, onchain, structure] 
-                              if data and not data.get("error"))
+        successful_phases = sum(1 for summary in summaries if summary.ok)
         
-        total_phases = 4
+        total_phases = len(summaries)
         
         quality_score = successful_phases / total_phases
         
@@ -482,20 +737,9 @@ class ResearchPipeline:
             "completeness": f"{successful_phases}/{total_phases} phases completed"
         }
     
-    def _calculate_overall_confidence(
-        self,
-        macro: Dict[str, Any],
-        sentiment: Dict[str, Any],
-        onchain: Dict[str, Any],
-        structure: Dict[str, Any]
-    ) -> str:
+    def _calculate_overall_confidence(self, summaries: Sequence[PhaseSummary]) -> str:
         """Calculate overall confidence in research results."""
-        confidences = []
-        
-        for data in [macro, sentiment, onchain, structure]:
-            if data and not data.get("error"):
-                conf = data.get("confidence_level", "moderate")
-                confidences.append(conf)
+        confidences = [summary.confidence for summary in summaries if summary.ok]
         
         if not confidences:
             return "low"
@@ -516,16 +760,13 @@ class ResearchPipeline:
     def _compile_research_report(
         self,
         context: ResearchContext,
-        phase_results: List[PhaseResult],
+        results_map: Dict[ResearchPhase, PhaseResult],
         total_execution_time: float
     ) -> Dict[str, Any]:
         """Compile final research report."""
         # Extract synthesis data
-        synthesis_result = None
-        for result in phase_results:
-            if result.phase == ResearchPhase.SYNTHESIS:
-                synthesis_result = result
-                break
+        synthesis_result = results_map.get(ResearchPhase.SYNTHESIS)
+        phase_results = results_map.values()
         
         synthesis_data = synthesis_result.data if synthesis_result else {}
         
@@ -559,17 +800,13 @@ class ResearchPipeline:
             "research_quality": synthesis_data.get("research_quality", {}),
             "assumptions": synthesis_data.get("assumptions", []),
             "limitations": synthesis_data.get("limitations", []),
-            "disclaimer": self._get_research_disclaimer()
+            "disclaimer": _RESEARCH_DISCLAIMER
         }
     
-    def _get_research_disclaimer(self) -> str:
-        """Get research disclaimer."""
-        return (
-            "This research report is for educational and informational purposes only. "
-            "It does not constitute financial advice, investment recommendations, or trading signals. "
-            "Cryptocurrency markets are highly volatile and risky. Always conduct your own research "
-            "and consult with qualified financial professionals before making any investment decisions."
-        )
+    def shutdown(self) -> None:
+        """Release the worker threads used by the analysis phases."""
+        self._pool.shutdown(wait=False)
+        self._sync_runner.shutdown(wait=False)
     
     def _error_response(self, context: ResearchContext, error_message: str) -> Dict[str, Any]:
         """Generate error response."""
@@ -583,5 +820,5 @@ class ResearchPipeline:
             },
             "error": True,
             "message": f"Research pipeline failed: {error_message}",
-            "disclaimer": self._get_research_disclaimer()
+            "disclaimer": _RESEARCH_DISCLAIMER
         }
@@ -8,6 +8,8 @@ indicators, news tone analysis, social media sentiment, and market momentum.
 from typing import Dict, Any, List
 import logging
 
+from .clock import utc_timestamp
+
 
 logger = logging.getLogger(__name__)
 
@@ -449,8 +451,7 @@ class SentimentAnalyzer:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        return utc_timestamp()
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
         """Generate error response."""
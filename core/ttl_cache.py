@@ -0,0 +1,68 @@
+"""
+Result caching for MacroChain AI.
+
+This module provides the bounded, expiring cache behind the analysis
+orchestrator's results.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+from .readonly import freeze
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+    
+    Values are frozen (see ``readonly.freeze``) once when stored and shared
+    by every hit, so callers can never mutate a cached result in place;
+    ``copy.deepcopy`` a hit for a mutable copy.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached read-only value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a frozen copy of value, evicting the least recently used entry.
+        
+        Returns:
+            The stored read-only value, which callers can return in place of
+            value so that cached and fresh results look the same
+        """
+        frozen = freeze(value)
+        entry = (time.monotonic() + self.ttl, frozen)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return frozen
+    
+    def invalidate(self, match: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """Drop every entry, or only those whose key satisfies match."""
+        with self._lock:
+            if match is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if match(key)]:
+                del self._entries[key]
@@ -3,12 +3,34 @@ MacroChain AI Services Module
 
 This module contains service components for response formatting
 and utility functions for the MacroChain AI system.
+Components are imported lazily on first attribute access.
 """
 
-from .response_formatter import ResponseFormatter
-from .research_formatter import ResearchFormatter
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "ResponseFormatter": ".response_formatter",
+    "ResearchFormatter": ".research_formatter"
+}
 
 __all__ = [
     "ResponseFormatter",
     "ResearchFormatter"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported components on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported components."""
+    return sorted(set(globals()) | set(__all__))
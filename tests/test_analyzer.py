@@ -0,0 +1,88 @@
+"""Tests for MacroChainAnalyzer result caching."""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.analyzer import MacroChainAnalyzer
+from core.research_pipeline import ResearchPhase
+
+
+class FailingAnalyzer:
+    """Analyzer stand-in whose analyze always raises."""
+
+    def analyze(self, query, assets=None):
+        raise RuntimeError("data source unavailable")
+
+
+def test_cache_hit_is_frozen_and_shared():
+    analyzer = MacroChainAnalyzer()
+    first = analyzer.analyze("bitcoin outlook")
+    assert analyzer.analyze("bitcoin outlook") is first
+
+
+def test_cached_results_keep_the_callers_query():
+    analyzer = MacroChainAnalyzer()
+    analyzer.analyze("Bitcoin outlook")
+
+    respelled = analyzer.analyze("bitcoin OUTLOOK")
+    assert respelled["query"] == "bitcoin OUTLOOK"
+
+    analyzer.analyze_legacy("Bitcoin outlook")
+    legacy = analyzer.analyze_legacy("bitcoin OUTLOOK")
+    assert legacy["query"] == "bitcoin OUTLOOK"
+    assert "bitcoin OUTLOOK" in legacy["educational_summary"]
+
+
+def test_invalidate_drops_only_the_given_query():
+    analyzer = MacroChainAnalyzer()
+    kept = analyzer.analyze("keep me")
+    dropped = analyzer.analyze("drop me")
+
+    analyzer.invalidate("drop me")
+    assert analyzer.analyze("keep me") is kept
+    assert analyzer.analyze("drop me") is not dropped
+
+
+def test_cached_results_keep_the_callers_asset_order():
+    analyzer = MacroChainAnalyzer()
+    analyzer.analyze("asset order", ["bitcoin", "ethereum"])
+
+    reordered = analyzer.analyze("asset order", ["ethereum", "bitcoin"])
+    assert tuple(reordered["assets_analyzed"]) == ("ethereum", "bitcoin")
+
+
+def test_result_with_a_failed_phase_is_not_cached():
+    analyzer = MacroChainAnalyzer()
+    pipeline = analyzer.research_pipeline
+    pipeline._phase_dispatch[ResearchPhase.SENTIMENT] = FailingAnalyzer()
+
+    first = analyzer.analyze("partial failure")
+    assert analyzer.analyze("partial failure") is not first
+
+    pipeline._phase_dispatch[ResearchPhase.SENTIMENT] = pipeline.sentiment_analyzer
+    complete = analyzer.analyze("partial failure")
+    assert analyzer.analyze("partial failure") is complete
+
+
+def test_concurrent_async_requests_share_one_pipeline_run():
+    analyzer = MacroChainAnalyzer()
+    pipeline = analyzer.research_pipeline
+    runs = []
+
+    class CountingPipeline:
+        async def execute_research_async(self, query, assets=None):
+            runs.append(query)
+            await asyncio.sleep(0.05)
+            return await pipeline.execute_research_async(query, assets)
+
+    analyzer._research_pipeline = CountingPipeline()
+
+    async def main():
+        return await asyncio.gather(*(analyzer.analyze_async("shared run") for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert runs == ["shared run"]
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,153 @@
+"""Tests for Coalescer single-flight execution."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.coalescer import Coalescer
+
+
+class Gate:
+    """Blocking function that counts its calls and waits to be released."""
+
+    def __init__(self, result=None, error=None):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.result = result
+        self.error = error
+
+    def __call__(self):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _run_concurrently(coalescer, fn, callers=5):
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(coalescer.do, "key", fn)]
+        assert fn.entered.wait(5)
+        futures += [pool.submit(coalescer.do, "key", fn) for _ in range(callers - 1)]
+        # Let the waiters reach the in-flight call before the leader finishes
+        while not all(future.running() for future in futures):
+            time.sleep(0.01)
+        time.sleep(0.1)
+        fn.release.set()
+        return futures
+
+
+def test_concurrent_calls_share_one_execution():
+    coalescer = Coalescer()
+    result = {"value": 1}
+    fn = Gate(result=result)
+
+    futures = _run_concurrently(coalescer, fn)
+    outcomes = [future.result() for future in futures]
+
+    assert fn.calls == 1
+    assert outcomes[0] == (result, False)
+    assert all(value is result and shared for value, shared in outcomes[1:])
+    assert coalescer.inflight() == 0
+
+
+def test_exception_reaches_every_caller():
+    coalescer = Coalescer()
+    fn = Gate(error=ValueError("boom"))
+
+    futures = _run_concurrently(coalescer, fn)
+    for future in futures:
+        with pytest.raises(ValueError, match="boom"):
+            future.result()
+
+    assert fn.calls == 1
+    assert coalescer.inflight() == 0
+
+
+def test_completed_call_is_not_reused():
+    coalescer = Coalescer()
+    assert coalescer.do("key", lambda: 1) == (1, False)
+    assert coalescer.do("key", lambda: 2) == (2, False)
+
+
+def test_async_callers_share_one_execution_and_exceptions():
+    coalescer = Coalescer()
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        if value == "bad":
+            raise ValueError(value)
+        return value
+
+    async def main():
+        shared = await asyncio.gather(*(coalescer.do_async("good", work, "good") for _ in range(3)))
+        failed = await asyncio.gather(
+            *(coalescer.do_async("bad", work, "bad") for _ in range(3)), return_exceptions=True
+        )
+        return shared, failed
+
+    shared, failed = asyncio.run(main())
+    assert calls == ["good", "bad"]
+    assert shared == [("good", False), ("good", True), ("good", True)]
+    assert all(isinstance(error, ValueError) for error in failed)
+    assert coalescer.inflight() == 0
+
+
+def test_cancelled_leader_does_not_cancel_the_shared_call():
+    coalescer = Coalescer()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        leader = asyncio.ensure_future(coalescer.do_async("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.do_async("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == ("done", True)
+
+
+def test_thread_waits_for_a_call_started_by_a_coroutine():
+    coalescer = Coalescer()
+    thread_results = []
+    thread = threading.Thread(target=lambda: thread_results.append(coalescer.do("key", lambda: "own")))
+
+    async def work():
+        thread.start()
+        await asyncio.sleep(0.1)
+        return "shared"
+
+    assert asyncio.run(coalescer.do_async("key", work)) == ("shared", False)
+    thread.join(5)
+    assert thread_results == [("shared", True)]
+
+
+def test_sync_call_on_the_owning_loop_runs_instead_of_blocking_it():
+    coalescer = Coalescer()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    async def main():
+        leader = asyncio.ensure_future(coalescer.do_async("key", work))
+        await asyncio.sleep(0)
+        own = coalescer.do("key", lambda: "own")
+        return own, await leader
+
+    assert asyncio.run(main()) == (("own", False), ("shared", False))
@@ -0,0 +1,54 @@
+"""Tests for ReadOnlyDict and freeze."""
+
+import copy
+import json
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.readonly import ReadOnlyDict, freeze
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda d: d.__setitem__("b", 2),
+    lambda d: d.__delitem__("a"),
+    lambda d: d.update(b=2),
+    lambda d: d.setdefault("b", 2),
+    lambda d: d.pop("a"),
+    lambda d: d.popitem(),
+    lambda d: d.clear(),
+])
+def test_mutation_is_rejected(mutate):
+    frozen = ReadOnlyDict(a=1)
+    with pytest.raises(TypeError):
+        mutate(frozen)
+    assert frozen == {"a": 1}
+
+
+def test_in_place_union_is_rejected():
+    frozen = ReadOnlyDict(a=1)
+    with pytest.raises(TypeError):
+        frozen |= {"b": 2}
+    assert frozen == {"a": 1}
+
+
+def test_copies_are_plain_mutable_dicts():
+    frozen = freeze({"a": {"b": [1]}})
+    for clone in (frozen.copy(), copy.copy(frozen), copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))):
+        assert type(clone) is dict
+        clone["c"] = 2
+    deep = copy.deepcopy(frozen)
+    assert type(deep["a"]) is dict
+    deep["a"]["b"] = []
+    assert frozen["a"]["b"] == (1,)
+
+
+def test_freeze_is_recursive_and_json_serializable():
+    frozen = freeze({"a": [{"b": 1}], "c": "d"})
+    assert isinstance(frozen["a"][0], ReadOnlyDict)
+    assert frozen["a"] == ({"b": 1},)
+    assert json.loads(json.dumps(frozen)) == {"a": [{"b": 1}], "c": "d"}
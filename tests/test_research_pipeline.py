@@ -0,0 +1,70 @@
+"""Tests for ResearchPipeline phase timeouts."""
+
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.research_pipeline import ResearchPhase, ResearchPipeline
+
+
+class HungAnalyzer:
+    """Analyzer stand-in whose analyze blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def analyze(self, query, assets=None):
+        self.release.wait()
+        return {"confidence_level": "high"}
+
+
+def _phase_status(report):
+    return {
+        phase: details["status"]
+        for phase, details in report["pipeline_execution"]["phase_details"].items()
+    }
+
+
+def test_hung_phase_times_out_while_other_phases_finish():
+    pipeline = ResearchPipeline(phase_timeout=0.2)
+    hung = HungAnalyzer()
+    pipeline._phase_dispatch[ResearchPhase.ONCHAIN] = hung
+    try:
+        report = pipeline.execute_research("hung onchain phase")
+    finally:
+        hung.release.set()
+        pipeline.shutdown()
+
+    assert report["phase_results"]["onchain"] == {"error": "timed out after 0.2s"}
+    assert _phase_status(report) == {
+        "macro": "success",
+        "sentiment": "success",
+        "onchain": "failed",
+        "market_structure": "success",
+        "synthesis": "success",
+    }
+
+
+def test_queued_call_times_out_and_later_runs_finish():
+    pipeline = ResearchPipeline(phase_timeout=0.2)
+    release = threading.Event()
+    # Occupy every worker, as hung calls would, so the next phase has to queue
+    blockers = [pipeline._pool.submit(release.wait) for _ in pipeline.parallel_phases]
+    try:
+        context = pipeline._new_context("queued phase", None)
+        result = asyncio.run(pipeline._execute_analysis_phase(ResearchPhase.SENTIMENT, context))
+        assert result.data == {"error": "timed out after 0.2s"}
+        assert result.execution_time < 1.0
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    try:
+        report = pipeline.execute_research("after the hang")
+    finally:
+        pipeline.shutdown()
+    assert set(_phase_status(report).values()) == {"success"}
@@ -0,0 +1,76 @@
+"""Tests for TTLCache expiry, eviction and freezing."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import core.ttl_cache as ttl_cache
+from core.readonly import ReadOnlyDict
+from core.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    cache.set("key", {"value": 1})
+
+    clock.now += 59.9
+    assert cache.get("key") == {"value": 1}
+
+    clock.now += 0.1
+    assert cache.get("key") is None
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", {"value": "a"})
+    cache.set("b", {"value": "b"})
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", {"value": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": "a"}
+    assert cache.get("c") == {"value": "c"}
+
+
+def test_stored_value_is_frozen_and_shared(clock):
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    value = {"nested": {"items": [1, 2]}}
+    stored = cache.set("key", value)
+
+    assert isinstance(stored, ReadOnlyDict)
+    assert stored["nested"]["items"] == (1, 2)
+    assert cache.get("key") is stored
+    value["nested"]["items"].append(3)
+    assert cache.get("key")["nested"]["items"] == (1, 2)
+
+
+def test_invalidate_by_key_predicate(clock):
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    cache.set(("pipeline", "q1"), {})
+    cache.set(("pipeline", "q2"), {})
+
+    cache.invalidate(lambda key: key[1] == "q1")
+    assert cache.get(("pipeline", "q1")) is None
+    assert cache.get(("pipeline", "q2")) == {}
+
+    cache.invalidate()
+    assert cache.get(("pipeline", "q2")) is None